@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+from array import array
+from grafo_csr import CSRGraph
+from estadisticas import SearchStats
+from heuristicas import StraightLineHeuristic
+import ruta_euclidea
+
+# ---------------------------------------------------------
+# Banco de pruebas de las cinco búsquedas
+#
+# Genera grafos sintéticos reproducibles (misma semilla, mismo grafo):
+#   - grid: rejilla 4-conexa
+#   - geometric: puntos aleatorios unidos si están a menos de un radio
+#   - scale_free: Barabási-Albert (pocos nodos muy conectados)
+# Ejecuta bfs, dfs, ucs, greedy_best_first y a_star sobre un conjunto
+# fijo de consultas y escribe un JSON con percentiles de latencia,
+# nodos expandidos y pico de memoria. Con --baseline compara contra
+# un JSON anterior para medir cada optimización.
+#
+#   python benchmark.py --sizes 1000 10000 --output actual.json
+#   python benchmark.py --sizes 1000 10000 --baseline actual.json
+
+ALGORITHMS = ("bfs", "dfs", "ucs", "greedy_best_first", "a_star")
+INFORMED = ("greedy_best_first", "a_star")
+
+# Coordenadas alrededor de Sevilla: metros -> grados
+LAT0, LON0 = 37.38, -5.99
+METERS_PER_DEGREE_LAT = 111320.0
+METERS_PER_DEGREE_LON = 111320.0 * math.cos(math.radians(LAT0))
+
+
+def _to_coordinates(x, y):
+    return (LAT0 + y / METERS_PER_DEGREE_LAT, LON0 + x / METERS_PER_DEGREE_LON)
+
+
+def _build(points, edges, rng):
+    """Grafo no dirigido con pesos = distancia * factor aleatorio en [1, 1.3]."""
+    names = [str(i) for i in range(len(points))]
+    sources, targets, weights = array('i'), array('i'), array('q')
+    for u, v in edges:
+        (x1, y1), (x2, y2) = points[u], points[v]
+        w = max(1, int(math.hypot(x1 - x2, y1 - y2) * rng.uniform(1.0, 1.3)))
+        sources.extend((u, v))
+        targets.extend((v, u))
+        weights.extend((w, w))
+    graph = CSRGraph.from_edges(names, sources, targets, weights)
+    coordinates = {names[i]: _to_coordinates(x, y) for i, (x, y) in enumerate(points)}
+    return graph, coordinates
+
+
+def grid_graph(n, seed):
+    rng = random.Random(seed)
+    side = max(2, int(math.isqrt(n)))
+    spacing = 100.0
+    points = [(c * spacing, r * spacing) for r in range(side) for c in range(side)]
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                edges.append((u, u + 1))
+            if r + 1 < side:
+                edges.append((u, u + side))
+    return _build(points, edges, rng)
+
+
+def geometric_graph(n, seed, degree=6):
+    rng = random.Random(seed)
+    size = 100.0 * math.sqrt(n)
+    points = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(n)]
+    radius = math.sqrt(degree * size * size / (math.pi * n))
+    # Cubetas de lado `radius`: solo se comparan puntos de cubetas vecinas
+    buckets = {}
+    for i, (x, y) in enumerate(points):
+        buckets.setdefault((int(x // radius), int(y // radius)), []).append(i)
+    edges = []
+    r2 = radius * radius
+    for (bx, by), members in buckets.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in buckets.get((bx + dx, by + dy), ()):
+                    xj, yj = points[j]
+                    for i in members:
+                        if i < j:
+                            xi, yi = points[i]
+                            if (xi - xj) ** 2 + (yi - yj) ** 2 <= r2:
+                                edges.append((i, j))
+    return _build(points, edges, rng)
+
+
+def scale_free_graph(n, seed, m=2):
+    rng = random.Random(seed)
+    size = 100.0 * math.sqrt(n)
+    points = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(n)]
+    edges = [(i, j) for i in range(m + 1) for j in range(i + 1, m + 1)]
+    # Lista de extremos de arista: elegir de ella es elegir por grado
+    endpoints = [u for edge in edges for u in edge]
+    for u in range(m + 1, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(endpoints))
+        for v in chosen:
+            edges.append((u, v))
+            endpoints.extend((u, v))
+    return _build(points, edges, rng)
+
+
+GENERATORS = {
+    "grid": grid_graph,
+    "geometric": geometric_graph,
+    "scale_free": scale_free_graph,
+}
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_case(graph, coordinates, queries, algorithms, track_memory):
+    heuristic = StraightLineHeuristic(graph, coordinates)
+    results = {}
+    for name in algorithms:
+        search = getattr(ruta_euclidea, name)
+        latencies, expanded, peak_frontier, peak_memory = [], [], 0, 0
+        for start, goal in queries:
+            stats = SearchStats(track_memory=track_memory)
+            if name in INFORMED:
+                search(graph, start, goal, heuristic, stats=stats)
+            else:
+                search(graph, start, goal, stats=stats)
+            latencies.append(stats.elapsed * 1000)
+            expanded.append(stats.expanded)
+            peak_frontier = max(peak_frontier, stats.peak_frontier)
+            if stats.peak_memory is not None:
+                peak_memory = max(peak_memory, stats.peak_memory)
+        results[name] = {
+            "latency_ms": {
+                "p50": _percentile(latencies, 0.50),
+                "p90": _percentile(latencies, 0.90),
+                "p99": _percentile(latencies, 0.99),
+                "mean": sum(latencies) / len(latencies),
+            },
+            "expanded_mean": sum(expanded) / len(expanded),
+            "peak_frontier": peak_frontier,
+            "peak_memory_bytes": peak_memory if track_memory else None,
+        }
+    return results
+
+
+def run(sizes, kinds, algorithms, num_queries, seed, track_memory, log=sys.stderr):
+    report = {
+        "seed": seed,
+        "queries": num_queries,
+        "python": platform.python_version(),
+        "cases": [],
+    }
+    for kind in kinds:
+        for size in sizes:
+            print(f"[{kind} n={size}] generando grafo...", file=log)
+            graph, coordinates = GENERATORS[kind](size, seed)
+            rng = random.Random(seed + size)
+            queries = [(rng.choice(graph.names), rng.choice(graph.names)) for _ in range(num_queries)]
+            print(f"[{kind} n={len(graph)}] {graph.num_edges} aristas, ejecutando búsquedas...", file=log)
+            report["cases"].append({
+                "graph": kind,
+                "nodes": len(graph),
+                "edges": graph.num_edges,
+                "results": run_case(graph, coordinates, queries, algorithms, track_memory),
+            })
+    return report
+
+
+def compare(report, baseline, log=sys.stdout):
+    """Imprime la relación actual / baseline de la latencia p50 y de los expandidos."""
+    previous = {(c["graph"], c["nodes"]): c["results"] for c in baseline["cases"]}
+    print(f"{'grafo':<12}{'nodos':>9}  {'algoritmo':<18}{'p50 x':>8}{'expand. x':>11}", file=log)
+    for case in report["cases"]:
+        old = previous.get((case["graph"], case["nodes"]))
+        if old is None:
+            continue
+        for name, result in case["results"].items():
+            if name not in old:
+                continue
+            before = old[name]
+            p50 = result["latency_ms"]["p50"] / before["latency_ms"]["p50"] if before["latency_ms"]["p50"] else float('nan')
+            exp = result["expanded_mean"] / before["expanded_mean"] if before["expanded_mean"] else float('nan')
+            print(f"{case['graph']:<12}{case['nodes']:>9}  {name:<18}{p50:>8.2f}{exp:>11.2f}", file=log)
+
+
+# ---------------------------------------------------------
+# Ejecución principal
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banco de pruebas de las búsquedas de ruta_euclidea")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--memory", action="store_true", help="medir pico de memoria (más lento)")
+    parser.add_argument("--output", help="fichero JSON de salida (por defecto, salida estándar)")
+    parser.add_argument("--baseline", help="JSON anterior con el que comparar")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.graphs, args.algorithms, args.queries, args.seed, args.memory)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(report, json.load(f), log=sys.stderr)
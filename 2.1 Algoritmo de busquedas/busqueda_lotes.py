@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import weakref
+from multiprocessing import Pool
+from grafo_binario import open_binary, save_binary
+from grafo_csr import CSRGraph
+from heuristicas import StraightLineHeuristic
+import ruta_euclidea
+
+# ---------------------------------------------------------
+# Consultas en lote con un pool de procesos
+#
+# El grafo se escribe una sola vez en el formato binario y cada
+# proceso lo abre con mmap en su inicializador: los procesos solo
+# reciben la ruta del fichero (nunca se serializa el grafo) y el
+# sistema operativo comparte las páginas en memoria entre todos.
+# Igual con la heurística en línea recta: se calcula una vez, se
+# guarda junto al grafo (StraightLineHeuristic.save) y cada proceso
+# la carga del fichero en lugar de recibir las coordenadas.
+# Las consultas se reparten en bloques y los resultados vuelven
+# en el mismo orden que los pares de entrada.
+
+ALGORITHMS = ("bfs", "dfs", "ucs", "greedy_best_first", "a_star",
+              "bidirectional_ucs", "bidirectional_a_star")
+INFORMED = ("greedy_best_first", "a_star", "bidirectional_a_star")
+
+_graph = None
+_search = None
+
+
+def _bind_search(algorithm, heuristic):
+    """Función search(graph, start, goal) con `heuristic` si la búsqueda es informada."""
+    search = getattr(ruta_euclidea, algorithm)
+    if heuristic is not None and algorithm in INFORMED:
+        return lambda graph, start, goal: search(graph, start, goal, heuristic)
+    return search
+
+
+def _init_worker(path, algorithm, heuristic_path):
+    global _graph, _search
+    _graph = open_binary(path)
+    heuristic = StraightLineHeuristic.load(heuristic_path) if heuristic_path is not None else None
+    _search = _bind_search(algorithm, heuristic)
+
+
+def _run_chunk(pairs):
+    return [_search(_graph, start, goal) for start, goal in pairs]
+
+
+def _chunks(pairs, size):
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def batch_search(graph, pairs, algorithm="ucs", workers=None, chunksize=256, coordinates=None):
+    """
+    Ejecuta `algorithm` (nombre de una búsqueda de ruta_euclidea) para cada
+    par (start, goal) y devuelve un iterador con los resultados en orden.
+
+    `graph` puede ser un dict de dicts, un CSRGraph o un grafo abierto con
+    open_binary (en ese caso se reutiliza su fichero). Con `coordinates`
+    las búsquedas informadas usan StraightLineHeuristic.
+    `workers` por defecto es el número de CPUs; con 1 las búsquedas se
+    hacen en este proceso, sobre `graph`, sin crear pool.
+
+    Los errores de los argumentos se lanzan en la propia llamada. Con pool,
+    el grafo (y la heurística, si la hay) se copia en ese momento a
+    ficheros temporales, que se borran al agotar o cerrar el iterador (o,
+    si se abandona, al recogerlo la memoria).
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algoritmo desconocido: {algorithm!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    informed = coordinates is not None and algorithm in INFORMED
+
+    if workers == 1:
+        heuristic = StraightLineHeuristic(graph, coordinates) if informed else None
+        search = _bind_search(algorithm, heuristic)
+        return (search(graph, start, goal) for start, goal in pairs)
+
+    # Con un CSRGraph los ids del fichero son los suyos y la heurística
+    # se puede guardar por id; un dict se convierte antes de guardarlo.
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    # Un grafo abierto con open_binary se reutiliza salvo que se hayan cambiado pesos
+    path = getattr(graph, "path", None) if graph.version == 0 else None
+    cleanup = []
+    try:
+        if path is None:
+            path = _temporary_file(".csrg", cleanup)
+            save_binary(graph, path)
+        heuristic_path = None
+        if informed:
+            heuristic_path = _temporary_file(".xy", cleanup)
+            StraightLineHeuristic(graph, coordinates).save(heuristic_path)
+    except BaseException:
+        _remove_all(cleanup)
+        raise
+
+    results = _pooled(path, heuristic_path, cleanup, pairs, algorithm, workers, chunksize)
+    if cleanup:
+        results = _RemoveOnClose(results, cleanup)
+    return results
+
+
+def _temporary_file(suffix, cleanup):
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    cleanup.append(path)
+    return path
+
+
+def _pooled(path, heuristic_path, cleanup, pairs, algorithm, workers, chunksize):
+    try:
+        with Pool(workers, initializer=_init_worker, initargs=(path, algorithm, heuristic_path)) as pool:
+            for results in pool.imap(_run_chunk, _chunks(pairs, chunksize)):
+                yield from results
+    finally:
+        _remove_all(cleanup)
+
+
+class _RemoveOnClose:
+    """Iterador que borra los ficheros temporales aunque nunca se llegue a recorrer."""
+
+    def __init__(self, results, paths):
+        self._results = results
+        self._finalizer = weakref.finalize(self, _remove_all, list(paths))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._results)
+
+    def close(self):
+        self._results.close()
+        self._finalizer()
+
+
+def _remove_all(paths):
+    for path in paths:
+        _remove_quietly(path)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# ---------------------------------------------------------
+# Ejecución principal
+
+if __name__ == "__main__":
+    import itertools
+    import time
+    from grafo import ruta_euclidea as graph, coordenadas
+
+    places = list(graph)
+    pairs = list(itertools.product(places, places)) * 50
+
+    t0 = time.perf_counter()
+    results = list(batch_search(graph, pairs, "a_star", coordinates=coordenadas))
+    elapsed = time.perf_counter() - t0
+    print(f"{len(results)} consultas A* en {elapsed:.2f} s "
+          f"({len(results) / elapsed:.0f} consultas/s, {os.cpu_count()} CPUs)")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import heapq
+from itertools import count
+from grafo_csr import graph_accessors
+from ruta_euclidea import bind_heuristic
+
+# ---------------------------------------------------------
+# Búsquedas con memoria acotada
+#
+# - IDA*: profundización iterativa sobre el umbral f = g + h.
+#   Solo guarda el camino actual (memoria O(profundidad)).
+# - SMA*: A* con un máximo de nodos en memoria. Cuando se llena
+#   olvida la hoja menos prometedora y guarda su f en el padre,
+#   que la regenerará si vuelve a ser la mejor opción.
+#
+# Ambas usan la misma interfaz que a_star (grafo, start, goal,
+# heurística) y una tabla de transposición acotada con el mejor g
+# conocido por nodo: llegar a un nodo con un g peor o igual no
+# puede dar una ruta mejor, así que esa rama se poda.
+
+
+class SearchBudgetExceeded(RuntimeError):
+    """La búsqueda ha superado el presupuesto de nodos indicado."""
+
+
+class _TranspositionTable:
+    """
+    Mejor (g, profundidad) conocido por nodo, con un número máximo de entradas.
+
+    La profundidad solo importa en SMA*, donde un camino más profundo
+    puede no caber en memoria. Con `strict=True` un empate exacto no
+    poda: SMA* regenera subárboles olvidados con los mismos (g, profundidad)
+    que ya anotó y no debe podarse a sí mismo.
+    """
+
+    def __init__(self, size, strict=False):
+        self.size = size
+        self.strict = strict
+        self.best = {}
+
+    def dominated(self, node, g, depth=0):
+        """True si ya se llegó a `node` con coste <= g y profundidad <= depth; si no, anota (g, depth)."""
+        best = self.best.get(node)
+        if best is not None:
+            if best[0] <= g and best[1] <= depth and not (self.strict and best == (g, depth)):
+                return True
+            if best[0] < g or best[0] == g and best[1] <= depth:
+                return False
+        if best is not None or len(self.best) < self.size:
+            self.best[node] = (g, depth)
+        return False
+
+
+# ---------------------------------------------------------
+# IDA* (Iterative Deepening A*)
+
+def ida_star(graph, start, goal, heuristic=None, max_nodes=None, table_size=100000):
+    """
+    IDA*. Devuelve (camino, coste) como a_star.
+    `max_nodes` limita el total de nodos generados (SearchBudgetExceeded si se supera).
+    `table_size` limita la tabla de transposición (0 para desactivarla).
+    """
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return None, float('inf')
+    if start == goal:
+        return [decode(start)], 0
+
+    h = bind_heuristic(heuristic, goal)
+    threshold = h(start)
+    generated = 0
+
+    while True:
+        table = _TranspositionTable(table_size)
+        table.dominated(start, 0)
+        next_threshold = float('inf')
+        path = [start]
+        on_path = {start}
+        stack = [(0, iter(neighbors(start)))]  # (g del nodo, iterador de vecinos)
+
+        while stack:
+            g, successors = stack[-1]
+            for neighbor, weight in successors:
+                if neighbor in on_path:
+                    continue
+                generated += 1
+                if max_nodes is not None and generated > max_nodes:
+                    raise SearchBudgetExceeded(f"IDA* superó {max_nodes} nodos")
+                g_new = g + weight
+                f = g_new + h(neighbor)
+                if f > threshold:
+                    next_threshold = min(next_threshold, f)
+                    continue
+                if neighbor == goal:
+                    return [decode(node) for node in path] + [decode(goal)], g_new
+                if table.dominated(neighbor, g_new):
+                    continue
+                path.append(neighbor)
+                on_path.add(neighbor)
+                stack.append((g_new, iter(neighbors(neighbor))))
+                break
+            else:
+                # Vecinos agotados: se retrocede
+                stack.pop()
+                on_path.discard(path.pop())
+
+        if next_threshold == float('inf'):
+            return None, float('inf')
+        threshold = next_threshold
+
+
+# ---------------------------------------------------------
+# SMA* (Simplified Memory-bounded A*)
+
+class _Node:
+    __slots__ = ("state", "parent", "g", "f", "depth", "successors", "next_index",
+                 "children", "forgotten", "alive")
+
+    def __init__(self, state, parent, g, f):
+        self.state = state
+        self.parent = parent
+        self.g = g
+        self.f = f
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.successors = None   # [(estado, peso)] sin ciclos, se calcula al expandir
+        self.next_index = 0      # siguiente sucesor aún no generado
+        self.children = {}       # estado -> _Node en memoria
+        self.forgotten = {}      # estado -> f del hijo olvidado
+        self.alive = True
+
+    def pending(self):
+        """¿Quedan sucesores por generar o por regenerar?"""
+        return (self.successors is None or self.next_index < len(self.successors)
+                or bool(self.forgotten))
+
+
+def sma_star(graph, start, goal, heuristic=None, max_nodes=10000, table_size=100000):
+    """
+    SMA*. Devuelve (camino, coste) como a_star guardando como mucho
+    `max_nodes` nodos del árbol de búsqueda en memoria. Es óptimo si la
+    heurística es admisible y el camino óptimo cabe en memoria
+    (profundidad < max_nodes); si no, devuelve la mejor ruta alcanzable
+    o (None, inf).
+    """
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return None, float('inf')
+    if max_nodes < 2:
+        raise ValueError("max_nodes debe ser al menos 2")
+
+    h = bind_heuristic(heuristic, goal)
+    table = _TranspositionTable(table_size, strict=True)
+    table.dominated(start, 0)
+    tie = count()
+
+    root = _Node(start, None, 0, h(start))
+    used = 1
+    # Frontera: menor f y, a igualdad, el más profundo
+    open_heap = [(root.f, -root.depth, next(tie), root)]
+    # Hojas candidatas a olvidar: mayor f y, a igualdad, la menos profunda
+    leaf_heap = []
+
+    def push_open(node):
+        heapq.heappush(open_heap, (node.f, -node.depth, next(tie), node))
+
+    def push_leaf(node):
+        heapq.heappush(leaf_heap, (-node.f, node.depth, next(tie), node))
+
+    def backup(node):
+        # f(n) = mínimo de sus hijos cuando ya no quedan sucesores sin generar
+        while node is not None and node.successors is not None \
+                and node.next_index == len(node.successors):
+            values = [child.f for child in node.children.values()]
+            values.extend(node.forgotten.values())
+            new_f = min(values) if values else float('inf')
+            if new_f == node.f:
+                break
+            node.f = new_f
+            if node.pending():
+                push_open(node)
+            if not node.children:
+                push_leaf(node)
+            node = node.parent
+
+    def forget_worst_leaf(keep):
+        """Olvida la peor hoja (distinta de `keep`); False si no hay ninguna."""
+        nonlocal used
+        skipped = []
+        forgotten = False
+        while leaf_heap:
+            entry = heapq.heappop(leaf_heap)
+            leaf = entry[3]
+            if not leaf.alive or leaf.children or leaf.parent is None or -entry[0] != leaf.f:
+                continue
+            if leaf is keep:
+                skipped.append(entry)
+                continue
+            parent = leaf.parent
+            leaf.alive = False
+            del parent.children[leaf.state]
+            previous = parent.forgotten.get(leaf.state, float('inf'))
+            parent.forgotten[leaf.state] = min(previous, leaf.f)
+            used -= 1
+            push_open(parent)
+            if not parent.children:
+                push_leaf(parent)
+            forgotten = True
+            break
+        for entry in skipped:
+            heapq.heappush(leaf_heap, entry)
+        return forgotten
+
+    while open_heap:
+        f, _, _, best = heapq.heappop(open_heap)
+        if not best.alive or f != best.f or not best.pending():
+            continue
+        if best.f == float('inf'):
+            return None, float('inf')
+
+        if best.state == goal:
+            path = []
+            node = best
+            while node is not None:
+                path.append(decode(node.state))
+                node = node.parent
+            path.reverse()
+            return path, best.g
+
+        if best.successors is None:
+            on_path = set()
+            node = best
+            while node is not None:
+                on_path.add(node.state)
+                node = node.parent
+            best.successors = [(s, w) for s, w in neighbors(best.state) if s not in on_path]
+
+        # Siguiente sucesor: uno nuevo o, si no quedan, el mejor olvidado
+        if best.next_index < len(best.successors):
+            state, weight = best.successors[best.next_index]
+            best.next_index += 1
+            g = best.g + weight
+            if state in best.children or (state != goal and
+                                          table.dominated(state, g, best.depth + 1)):
+                backup(best)
+                if best.pending():
+                    push_open(best)
+                continue
+            child_f = max(best.f, g + h(state))
+        elif best.forgotten:
+            state = min(best.forgotten, key=best.forgotten.get)
+            child_f = best.forgotten.pop(state)
+            weight = min(w for s, w in best.successors if s == state)
+            g = best.g + weight
+        else:
+            backup(best)
+            continue
+
+        if used >= max_nodes and not forget_worst_leaf(best):
+            # No cabe ni el camino actual: este sucesor queda inalcanzable
+            child_f = float('inf')
+
+        child = _Node(state, best, g, child_f)
+        if child.depth >= max_nodes - 1 and state != goal:
+            child.f = float('inf')
+        best.children[state] = child
+        used += 1
+        push_open(child)
+        push_leaf(child)
+
+        backup(best)
+        if best.pending():
+            push_open(best)
+
+    return None, float('inf')
+
+
+# ---------------------------------------------------------
+# Ejecución principal
+
+if __name__ == "__main__":
+    from grafo import ruta_euclidea as graph, coordenadas
+    from heuristicas import StraightLineHeuristic
+
+    start = "IES Punta del Verde"
+    goal = "Estadio La Cartuja\t"
+    heuristic = StraightLineHeuristic(graph, coordenadas)
+
+    path, cost = ida_star(graph, start, goal, heuristic)
+    print("--- IDA* ---")
+    print(" → ".join(node.strip() for node in path), f"({cost} unidades)")
+
+    for max_nodes in (1000, 10):
+        path, cost = sma_star(graph, start, goal, heuristic, max_nodes=max_nodes)
+        print(f"--- SMA* (máx. {max_nodes} nodos) ---")
+        print(" → ".join(node.strip() for node in path), f"({cost} unidades)")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from grafo_csr import changes_since
+from ruta_euclidea import a_star, bidirectional_a_star, ucs
+
+# ---------------------------------------------------------
+# Caché LRU de rutas
+#
+# Guarda el resultado (camino, coste) de las consultas
+# (start, goal, algoritmo) más recientes. Si el grafo es un
+# CSRGraph, antes de cada consulta se revisan los cambios de
+# peso ocurridos desde la última vez (graph.version/changes):
+#
+# - Si un peso sube, solo se invalidan las rutas que usan esa arista:
+#   las demás siguen siendo óptimas porque sus alternativas no mejoran.
+# - Si un peso baja, cualquier ruta podría tener ahora un atajo mejor
+#   y se vacía la caché.
+
+ALGORITHMS = {
+    "ucs": ucs,
+    "a_star": a_star,
+    "bidirectional_a_star": bidirectional_a_star,
+}
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __repr__(self):
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, invalidations={self.invalidations})")
+
+
+class RouteCache:
+    """
+    Caché LRU acotada delante de ucs / a_star / bidirectional_a_star.
+    `heuristic` se pasa a los algoritmos A* (ver heuristicas.py).
+    Con grafos dict de dicts no hay control de versión: tras modificar
+    el grafo hay que llamar a clear().
+    """
+
+    def __init__(self, graph, maxsize=1024, heuristic=None):
+        self.graph = graph
+        self.maxsize = maxsize
+        self.heuristic = heuristic
+        self.stats = CacheStats()
+        self._entries = OrderedDict()  # (start, goal, algoritmo) -> (camino, coste)
+        self._by_edge = {}             # (u, v) -> claves cuyas rutas usan la arista
+        self._version = getattr(graph, "version", 0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_edge.clear()
+
+    def query(self, start, goal, algorithm="ucs"):
+        """Devuelve (camino, coste) igual que el algoritmo, sirviéndolo de caché si se puede."""
+        self._sync()
+        key = (start, goal, algorithm)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+        self.stats.misses += 1
+        search = ALGORITHMS[algorithm]
+        if search is ucs:
+            entry = search(self.graph, start, goal)
+        else:
+            entry = search(self.graph, start, goal, self.heuristic)
+
+        self._entries[key] = entry
+        for edge in self._edges(entry[0]):
+            self._by_edge.setdefault(edge, set()).add(key)
+        if len(self._entries) > self.maxsize:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._unindex(old_key, old_entry[0])
+            self.stats.evictions += 1
+        return entry
+
+    def _edges(self, path):
+        if not path:
+            return []
+        index = getattr(self.graph, "index", None)
+        if index is not None:
+            path = [index[name] for name in path]
+        return list(zip(path, path[1:]))
+
+    def _unindex(self, key, path):
+        for edge in self._edges(path):
+            keys = self._by_edge.get(edge)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_edge[edge]
+
+    def _sync(self):
+        self._version, changes = changes_since(self.graph, self._version)
+        if changes == []:
+            return
+
+        # Si el registro ya no llega hasta nuestra versión, no sabemos qué cambió
+        if changes is None or any(new < old for _, _, _, old, new in changes):
+            self.clear()
+            return
+
+        for _, u, v, old, new in changes:
+            for key in self._by_edge.pop((u, v), ()):
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._unindex(key, entry[0])
+                    self.stats.invalidations += 1
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import tracemalloc
+
+# ---------------------------------------------------------
+# Estadísticas de una búsqueda
+#
+# Se pasa un SearchStats como `stats=` a bfs, dfs, ucs,
+# greedy_best_first o a_star y la búsqueda lo rellena.
+# Sin `stats` las búsquedas solo pagan una comparación con None.
+
+
+class SearchStats:
+    """
+    Contadores de una consulta:
+
+    - expanded: nodos extraídos de la frontera y expandidos.
+    - pushes: inserciones en la frontera (incluye mejoras decrease-key).
+    - peak_frontier: tamaño máximo de la frontera.
+    - peak_memory: pico de memoria en bytes durante la búsqueda
+      (solo con track_memory=True, porque tracemalloc ralentiza).
+    - elapsed: tiempo de la búsqueda en segundos.
+    """
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.reset()
+
+    def reset(self):
+        self.expanded = 0
+        self.pushes = 0
+        self.peak_frontier = 0
+        self.peak_memory = None
+        self.elapsed = 0.0
+
+    def start(self):
+        self.reset()
+        self._stop_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._stop_tracing = True
+            tracemalloc.reset_peak()
+            self._base_memory = tracemalloc.get_traced_memory()[0]
+        self._t0 = time.perf_counter()
+
+    def stop(self):
+        self.elapsed = time.perf_counter() - self._t0
+        if self.track_memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1] - self._base_memory
+            if self._stop_tracing:
+                tracemalloc.stop()
+
+    def frontier_size(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def as_dict(self):
+        return {
+            "expanded": self.expanded,
+            "pushes": self.pushes,
+            "peak_frontier": self.peak_frontier,
+            "peak_memory": self.peak_memory,
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"SearchStats({fields})"
@@ -98,3 +98,29 @@ ruta_euclidea = {
             }
         }
 
+
+# Coordenadas aproximadas (latitud, longitud) de cada lugar del grafo.
+# Permiten calcular una heurística en línea recta para A*.
+coordenadas = {
+        "IES Punta del Verde": (37.35571, -5.98898),
+        "Estadio Benito Villamarín": (37.35732, -5.98148),
+        "Pabellón de México": (37.36997, -5.98805),
+        "Palacio de San Telmo": (37.38008, -5.99426),
+        "Plaza de Cuba": (37.37955, -5.99849),
+        "Estadio La Cartuja	": (37.41563, -6.00407),
+        "Estadio La Cartuja": (37.41563, -6.00407),
+        "Puente de la Barqueta": (37.40300, -5.99327),
+        "Puente de Triana": (37.38613, -6.00264),
+        "Parque de los Príncipes": (37.37637, -6.00576),
+        "Torre Sevilla": (37.39127, -6.01033),
+        "Plaza de Armas": (37.39136, -6.00188),
+        "Hospital Virgen del Rocío": (37.36216, -5.98012),
+        "Plaza de España": (37.37789, -5.98689),
+        "Nervión Plaza": (37.38594, -5.97515),
+        "Sta. Justa": (37.39368, -5.97888),
+        "Parlamento de Andalucía": (37.39747, -5.98697),
+        "Glorieta Olímpica": (37.40698, -5.99270),
+        "Avenida de la paz": (37.37052, -5.96959),
+        "Pandora": (37.40740, -5.96560),
+        "Malandar": (37.39796, -5.99811)
+        }
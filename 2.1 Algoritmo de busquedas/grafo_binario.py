@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import mmap
+import struct
+from array import array
+from grafo_csr import CSRGraph
+
+# ---------------------------------------------------------
+# Carga de grafos grandes
+#
+# 1. load_edge_list: lee un fichero CSV/TSV (origen, destino, peso)
+#    línea a línea y construye el CSRGraph en una sola pasada, sin
+#    guardar el texto en memoria.
+# 2. save_binary / open_binary: formato binario compacto que se abre
+#    con mmap. Abrir no copia nada: los buffers del grafo son vistas
+#    sobre el fichero y el sistema operativo comparte las páginas
+#    entre todos los procesos que lo abren en solo lectura.
+#
+# Formato (orden de bytes nativo, secciones alineadas a 8 bytes):
+#
+#   cabecera   MAGIC, versión, tipo de peso, n, m, tamaño de nombres
+#   offsets    (n + 1) x int64
+#   targets    m x int32
+#   weights    m x int64 ('q') o float64 ('d')
+#   name_offsets (n + 1) x int64   -> inicio de cada nombre en el blob
+#   name_order n x int32           -> ids ordenados por nombre (búsqueda binaria)
+#   names      blob UTF-8 con todos los nombres seguidos
+
+MAGIC = b'CSRG'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('=4sIc3xQQQ')
+
+
+def load_edge_list(path, delimiter=None, undirected=False, encoding='utf-8'):
+    """
+    Construye un CSRGraph desde un fichero de aristas `origen,destino,peso`.
+    Se ignoran líneas vacías, comentarios (#) y una cabecera inicial cuyo peso no sea numérico.
+    Si no se indica `delimiter` se usa tabulador para .tsv y coma para el resto.
+    Con `undirected=True` se añade también la arista inversa.
+    """
+    if delimiter is None:
+        delimiter = '\t' if str(path).endswith('.tsv') else ','
+
+    names = []
+    index = {}
+    sources = array('i')
+    targets = array('i')
+    weights = array('q')
+
+    def intern(name):
+        node_id = index.get(name)
+        if node_id is None:
+            node_id = index[name] = len(names)
+            names.append(name)
+        return node_id
+
+    with open(path, newline='', encoding=encoding) as f:
+        for line_number, row in enumerate(csv.reader(f, delimiter=delimiter), 1):
+            if not row or row[0].startswith('#'):
+                continue
+            if len(row) < 3:
+                raise ValueError(f"{path}:{line_number}: se esperaban 3 columnas")
+            source, target, weight = row[0], row[1], row[2].strip()
+            try:
+                weight = int(weight)
+            except ValueError:
+                try:
+                    weight = float(weight)
+                except ValueError:
+                    if not targets:
+                        continue  # cabecera
+                    raise ValueError(f"{path}:{line_number}: peso no numérico {weight!r}")
+                if weights.typecode == 'q':
+                    weights = array('d', weights)
+
+            u, v = intern(source), intern(target)
+            sources.append(u)
+            targets.append(v)
+            weights.append(weight)
+            if undirected:
+                sources.append(v)
+                targets.append(u)
+                weights.append(weight)
+
+    return CSRGraph.from_edges(names, sources, targets, weights, index)
+
+
+# ---------------------------------------------------------
+# Formato binario
+
+class _NameTable:
+    """Vista perezosa de los nombres guardados en el blob (solo decodifica al acceder)."""
+
+    def __init__(self, blob, name_offsets):
+        self._blob = blob
+        self._offsets = name_offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node):
+        return self.raw(node).decode('utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def raw(self, node):
+        return bytes(self._blob[self._offsets[node]:self._offsets[node + 1]])
+
+
+class _NameIndex:
+    """Búsqueda nombre -> id por búsqueda binaria sobre name_order (sin diccionario)."""
+
+    def __init__(self, names, order):
+        self._names = names
+        self._order = order
+
+    def get(self, name, default=None):
+        key = name.encode('utf-8')
+        order, raw = self._order, self._names.raw
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if raw(order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and raw(order[lo]) == key:
+            return order[lo]
+        return default
+
+    def __getitem__(self, name):
+        node = self.get(name)
+        if node is None:
+            raise KeyError(name)
+        return node
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+def _pad(f):
+    extra = -f.tell() % 8
+    if extra:
+        f.write(b'\0' * extra)
+
+
+def save_binary(graph, path):
+    """Guarda un CSRGraph (o un dict de dicts) en el formato binario."""
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+
+    encoded = [name.encode('utf-8') for name in graph.names]
+    name_offsets = array('q', [0])
+    for raw in encoded:
+        name_offsets.append(name_offsets[-1] + len(raw))
+    order = sorted(range(len(encoded)), key=encoded.__getitem__)
+
+    weights = graph.weights
+    typecode = getattr(weights, 'typecode', None) or weights.format
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, typecode.encode(),
+                            len(graph), graph.num_edges, name_offsets[-1]))
+        for section in (array('q', graph.offsets), array('i', graph.targets),
+                        array(typecode, weights), name_offsets, array('i', order)):
+            _pad(f)
+            f.write(section.tobytes())
+        f.write(b''.join(encoded))
+
+
+def open_binary(path, copy_on_write=False):
+    """
+    Abre un grafo binario con mmap sin copiar los datos.
+    Por defecto es de solo lectura (compartible entre procesos); con
+    `copy_on_write=True` se permite set_weight sin tocar el fichero.
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY if copy_on_write else mmap.ACCESS_READ)
+
+    magic, version, typecode, n, m, names_size = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: no es un grafo binario (versión {FORMAT_VERSION})")
+    typecode = typecode.decode()
+
+    view = memoryview(mm)
+    position = HEADER.size
+
+    def section(fmt, count):
+        nonlocal position
+        position += -position % 8
+        size = struct.calcsize(fmt) * count
+        data = view[position:position + size].cast(fmt)
+        position += size
+        return data
+
+    offsets = section('q', n + 1)
+    targets = section('i', m)
+    weights = section(typecode, m)
+    name_offsets = section('q', n + 1)
+    order = section('i', n)
+    blob = view[position:position + names_size]
+
+    names = _NameTable(blob, name_offsets)
+    graph = CSRGraph(names, offsets, targets, weights, _NameIndex(names, order))
+    graph.mmap = mm  # mantiene vivo el mapeo mientras exista el grafo
+    graph.path = path
+    return graph
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import operator
+from array import array
+from collections import deque
+from monticulo import IndexedHeap
+
+INF = float('inf')
+
+# ---------------------------------------------------------
+# Grafo compacto en formato CSR (Compressed Sparse Row)
+#
+# Los nombres de los lugares se convierten una sola vez en
+# identificadores enteros (0..n-1) y la adyacencia se guarda
+# en tres buffers contiguos:
+#
+#   offsets[u] .. offsets[u + 1]  -> rango de aristas de u
+#   targets[i]                    -> nodo destino de la arista i
+#   weights[i]                    -> peso de la arista i
+
+
+class CSRGraph:
+    """
+    Grafo dirigido y ponderado en formato CSR.
+    Los algoritmos de búsqueda trabajan con los identificadores
+    enteros y solo traducen a nombres al construir el camino final.
+
+    La estructura (nodos y aristas) es fija, pero los pesos se pueden
+    cambiar con set_weight. Cada cambio incrementa `version` y se anota
+    en `changes` para que las cachés invaliden solo lo afectado.
+    Un peso inf cierra la arista: neighbors deja de devolverla.
+    """
+
+    # Cambios recordados; una caché más atrasada que esto se vacía entera
+    MAX_CHANGES = 4096
+
+    def __init__(self, names, offsets, targets, weights, index=None):
+        self.names = names
+        # `index` (nombre -> id) se puede dar ya construido, p. ej. desde disco
+        self.index = index if index is not None else {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.version = 0
+        self.changes = deque(maxlen=self.MAX_CHANGES)  # (versión, u, v, peso_anterior, peso_nuevo)
+        # Aristas con peso inf; mientras no haya ninguna, neighbors no filtra
+        self.closed_edges = _count_closed(weights)
+        self._incoming = None  # índice de predecesores, se construye al primer uso
+
+    @classmethod
+    def from_dict(cls, graph):
+        """
+        Construye el grafo CSR a partir de un diccionario de diccionarios
+        como grafo.ruta_euclidea. Los destinos que no aparecen como clave
+        (nodos sin aristas de salida) también reciben identificador.
+        """
+        names = []
+        index = {}
+
+        def intern(name):
+            node_id = index.get(name)
+            if node_id is None:
+                node_id = index[name] = len(names)
+                names.append(name)
+            return node_id
+
+        for node in graph:
+            intern(node)
+        for edges in graph.values():
+            for neighbor in edges:
+                intern(neighbor)
+
+        all_weights = [w for edges in graph.values() for w in edges.values()]
+        # Pesos enteros en 'q' para que los costes salgan idénticos a los del dict
+        typecode = 'q' if all(isinstance(w, int) for w in all_weights) else 'd'
+
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array(typecode)
+        for node_id, name in enumerate(names):
+            for neighbor, weight in graph.get(name, {}).items():
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, names, sources, targets, weights, index=None):
+        """
+        Construye el grafo a partir de tres listas/arrays paralelos de aristas
+        (ids de origen, ids de destino, pesos) con una ordenación por conteo.
+        """
+        n = len(names)
+        offsets = array('q', [0]) * (n + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        fill = array('q', offsets[:n])
+        typecode = getattr(weights, 'typecode', None) or \
+            ('q' if all(isinstance(w, int) for w in weights) else 'd')
+        csr_targets = array('i', [0]) * len(targets)
+        csr_weights = array(typecode, [0]) * len(weights)
+        for u, v, w in zip(sources, targets, weights):
+            i = fill[u]
+            csr_targets[i] = v
+            csr_weights[i] = w
+            fill[u] = i + 1
+        return cls(names, offsets, csr_targets, csr_weights, index)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbors(self, node):
+        """Devuelve pares (vecino, peso) del nodo entero `node`."""
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        edges = zip(self.targets[lo:hi], self.weights[lo:hi])
+        if self.closed_edges:
+            return [(v, w) for v, w in edges if w != INF]
+        return edges
+
+    def predecessors(self, node):
+        """
+        Devuelve pares (predecesor, peso) de las aristas que llegan a `node`.
+        Los pesos se leen de `weights` en cada llamada, así que siguen a
+        set_weight sin copiar el grafo; el índice (solo estructura) se
+        construye una vez y lo comparten todos los que lo consultan.
+        """
+        incoming = self._incoming
+        if incoming is None:
+            incoming = self._incoming = self._incoming_index()
+        offsets, sources, positions = incoming
+        weights = self.weights
+        edges = [(sources[i], weights[positions[i]]) for i in range(offsets[node], offsets[node + 1])]
+        if self.closed_edges:
+            return [(u, w) for u, w in edges if w != INF]
+        return edges
+
+    def _incoming_index(self):
+        """(offsets, orígenes, posición de cada arista en weights) agrupados por destino."""
+        n = len(self.names)
+        offsets = array('q', [0]) * (n + 1)
+        for v in self.targets:
+            offsets[v + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+        fill = array('q', offsets[:n])
+        sources = array('i', [0]) * len(self.targets)
+        positions = array('q', [0]) * len(self.targets)
+        for u in range(n):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                j = fill[v]
+                sources[j] = u
+                positions[j] = i
+                fill[v] = j + 1
+        return offsets, sources, positions
+
+    def edge_position(self, u, v):
+        """Posición en targets/weights de la arista u -> v (ids), o -1 si no existe."""
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[i] == v:
+                return i
+        return -1
+
+    def weight(self, start, goal):
+        """Peso de la arista entre dos nombres (KeyError si no existe)."""
+        i = self.edge_position(self.index[start], self.index[goal])
+        if i < 0:
+            raise KeyError((start, goal))
+        return self.weights[i]
+
+    def set_weight(self, start, goal, weight):
+        """
+        Cambia el peso de una arista existente y avanza la versión del grafo
+        (inf la cierra). Si los pesos eran enteros y el nuevo no lo es, el
+        buffer de pesos pasa a float64 (en un grafo mmap, a una copia en memoria).
+        """
+        u, v = self.index[start], self.index[goal]
+        i = self.edge_position(u, v)
+        if i < 0:
+            raise KeyError((start, goal))
+        old = self.weights[i]
+        if old == weight:
+            return
+        if (getattr(self.weights, 'typecode', None) or self.weights.format) != 'd':
+            try:
+                operator.index(weight)
+            except TypeError:
+                self.weights = array('d', self.weights)
+        self.weights[i] = weight
+        self.closed_edges += (weight == INF) - (old == INF)
+        self.version += 1
+        self.changes.append((self.version, u, v, old, weight))
+
+    def reversed(self):
+        """Grafo traspuesto (aristas invertidas) con los mismos identificadores."""
+        n = len(self.names)
+        counts = [0] * (n + 1)
+        for v in self.targets:
+            counts[v + 1] += 1
+        offsets = array('q', [0] * (n + 1))
+        for v in range(n):
+            offsets[v + 1] = offsets[v] + counts[v + 1]
+        fill = list(offsets[:n])
+        targets = array('i', [0] * len(self.targets))
+        typecode = getattr(self.weights, 'typecode', None) or self.weights.format
+        weights = array(typecode, [0] * len(self.weights))
+        # Aristas en bruto (también las cerradas, que siguen con peso inf):
+        # los offsets cuentan todas
+        for u in range(n):
+            lo, hi = self.offsets[u], self.offsets[u + 1]
+            for v, w in zip(self.targets[lo:hi], self.weights[lo:hi]):
+                i = fill[v]
+                targets[i] = u
+                weights[i] = w
+                fill[v] = i + 1
+        return CSRGraph(self.names, offsets, targets, weights, self.index)
+
+    def to_dict(self):
+        """Reconstruye el diccionario de diccionarios (útil para depurar)."""
+        names = self.names
+        return {
+            names[u]: {names[v]: w for v, w in self.neighbors(u)}
+            for u in range(len(names))
+            if self.offsets[u] != self.offsets[u + 1]
+        }
+
+
+def _count_closed(weights):
+    """Número de pesos inf (solo posibles en buffers float64)."""
+    if (getattr(weights, 'typecode', None) or getattr(weights, 'format', None)) != 'd':
+        return 0
+    if isinstance(weights, memoryview):
+        # Los buffers mmap de grafo_binario no tienen count
+        return sum(map(INF.__eq__, weights))
+    return weights.count(INF)
+
+
+def graph_accessors(graph):
+    """
+    Devuelve (neighbors, encode, decode) para cualquier grafo admitido:
+
+    - dict de dicts: los nodos son los propios nombres.
+    - CSRGraph: los nodos son enteros; encode/decode traducen nombres.
+    - cualquier objeto con un método accessors() que devuelva esa terna
+      (p. ej. vistas filtradas de otro grafo).
+
+    encode devuelve None si el nombre no existe en el grafo.
+    """
+    custom = getattr(graph, 'accessors', None)
+    if custom is not None:
+        return custom()
+    if isinstance(graph, CSRGraph):
+        return graph.neighbors, graph.index.get, graph.names.__getitem__
+
+    def neighbors(node):
+        return graph.get(node, {}).items()
+
+    def identity(node):
+        return node
+
+    return neighbors, identity, identity
+
+
+def reverse_graph(graph):
+    """Devuelve el grafo con las aristas invertidas, del mismo tipo que `graph`."""
+    if isinstance(graph, CSRGraph):
+        return graph.reversed()
+    reverse = {}
+    for node, edges in graph.items():
+        for neighbor, weight in edges.items():
+            reverse.setdefault(neighbor, {})[node] = weight
+    return reverse
+
+
+def changes_since(graph, version):
+    """
+    Cambios de peso de `graph` posteriores a `version`, para quien mantiene
+    datos derivados del grafo (cachés, planificadores).
+    Devuelve (versión actual, cambios) con cambios como lista de
+    (versión, u, v, peso_anterior, peso_nuevo), o None si el registro ya no
+    llega hasta `version` y hay que reconstruirlo todo.
+    """
+    current = getattr(graph, "version", 0)
+    if current == version:
+        return current, []
+    changes = [c for c in graph.changes if c[0] > version]
+    if not changes or changes[0][0] != version + 1:
+        return current, None
+    return current, changes
+
+
+def graph_nodes(graph):
+    """Lista de todos los nodos (en representación interna), incluidos los que solo son destino."""
+    if isinstance(graph, CSRGraph):
+        return list(range(len(graph.names)))
+    nodes = dict.fromkeys(graph)
+    for edges in graph.values():
+        nodes.update(dict.fromkeys(edges))
+    return list(nodes)
+
+
+# ---------------------------------------------------------
+# Dijkstra uno a todos sobre nodos internos
+#
+# Lo comparten las búsquedas (árboles de caminos mínimos) y las
+# heurísticas que precalculan distancias (landmarks).
+
+def dijkstra_all(neighbors, source, targets=None):
+    """
+    Dijkstra desde `source` sobre nodos internos.
+    Devuelve (dist, parents) como diccionarios de los nodos alcanzados.
+    Si se pasa `targets`, se detiene al asentar todos ellos.
+    """
+    dist = {source: 0}
+    parents = {source: None}
+    visited = set()
+    pending = set(targets) if targets is not None else None
+    frontier = IndexedHeap()
+    frontier.push(source, 0)
+
+    while frontier:
+        node, d = frontier.pop()
+        visited.add(node)
+        if pending is not None:
+            pending.discard(node)
+            if not pending:
+                break
+        for neighbor, weight in neighbors(node):
+            if neighbor not in visited:
+                if frontier.push_or_decrease(neighbor, d + weight):
+                    dist[neighbor] = d + weight
+                    parents[neighbor] = node
+    return dist, parents
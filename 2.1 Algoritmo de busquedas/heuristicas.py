@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+from array import array
+from grafo_csr import dijkstra_all, graph_accessors, graph_nodes, reverse_graph
+
+# ---------------------------------------------------------
+# Heurísticas admisibles para A*
+#
+# Una heurística es cualquier callable h(nodo, meta) que recibe
+# los nodos en la representación interna del grafo (nombres en
+# el dict de dicts, enteros en CSRGraph). Si además tiene un
+# método bind(meta), A* lo usa para precalcular lo que solo
+# depende de la meta y obtener una función h(nodo).
+
+
+def _distances_from(neighbors, source):
+    """Distancias de Dijkstra desde `source`: {nodo: distancia}."""
+    return dijkstra_all(neighbors, source)[0]
+
+
+# ---------------------------------------------------------
+# Heurística en línea recta a partir de coordenadas (lat, lon)
+
+class StraightLineHeuristic:
+    """
+    Distancia en línea recta entre el nodo y la meta.
+
+    Las coordenadas se proyectan una sola vez a un plano local en metros.
+    La distancia se multiplica por un factor <= 1 calibrado con las aristas
+    (mínimo de peso / distancia recta) para que la heurística sea consistente
+    aunque las coordenadas sean aproximadas: así A* devuelve la ruta óptima.
+    """
+
+    EARTH_RADIUS = 6371000.0
+
+    def __init__(self, graph, coordinates):
+        neighbors, encode, decode = graph_accessors(graph)
+        nodes = graph_nodes(graph)
+
+        missing = [decode(n) for n in nodes if decode(n) not in coordinates]
+        if missing:
+            raise ValueError(f"Faltan coordenadas para: {', '.join(map(repr, missing))}")
+
+        lat0 = math.radians(sum(coordinates[decode(n)][0] for n in nodes) / len(nodes))
+        kx = self.EARTH_RADIUS * math.cos(lat0) * math.pi / 180
+        ky = self.EARTH_RADIUS * math.pi / 180
+        self.xy = {}
+        for node in nodes:
+            lat, lon = coordinates[decode(node)]
+            self.xy[node] = (lon * kx, lat * ky)
+
+        scale = 1.0
+        for node in nodes:
+            x, y = self.xy[node]
+            for neighbor, weight in neighbors(node):
+                nx, ny = self.xy[neighbor]
+                d = math.hypot(x - nx, y - ny)
+                if d > 0:
+                    scale = min(scale, weight / d)
+        self.scale = scale
+
+    def save(self, path):
+        """
+        Guarda la escala y las coordenadas proyectadas en binario (float64:
+        escala y después x, y de cada id). Solo para grafos con nodos
+        enteros 0..n-1 (CSRGraph): así un proceso que abre el mismo grafo
+        con open_binary la recupera con load sin recibir las coordenadas.
+        """
+        data = array('d', [self.scale])
+        for node in range(len(self.xy)):
+            data.extend(self.xy[node])
+        with open(path, 'wb') as f:
+            data.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Heurística guardada con save, sin volver a proyectar ni calibrar."""
+        data = array('d')
+        with open(path, 'rb') as f:
+            data.frombytes(f.read())
+        heuristic = cls.__new__(cls)
+        heuristic.scale = data[0]
+        heuristic.xy = {node: (data[2 * node + 1], data[2 * node + 2]) for node in range(len(data) // 2)}
+        return heuristic
+
+    def __call__(self, node, goal):
+        x, y = self.xy[node]
+        gx, gy = self.xy[goal]
+        return self.scale * math.hypot(x - gx, y - gy)
+
+    def bind(self, goal):
+        xy, scale = self.xy, self.scale
+        gx, gy = xy[goal]
+        hypot = math.hypot
+
+        def h(node):
+            x, y = xy[node]
+            return scale * hypot(x - gx, y - gy)
+        return h
+
+
+# ---------------------------------------------------------
+# ALT: A* + Landmarks + desigualdad Triangular
+#
+# Para cada landmark L se guardan d(L, n) y d(n, L) para todo n.
+# Por la desigualdad triangular:
+#   d(n, t) >= d(L, t) - d(L, n)
+#   d(n, t) >= d(n, L) - d(t, L)
+# y la heurística es el máximo de esas cotas sobre los landmarks.
+
+class LandmarkHeuristic:
+    """
+    Heurística ALT. Los landmarks se eligen por el método "farthest":
+    cada nuevo landmark es el nodo más alejado de los ya elegidos.
+    Las tablas de distancias se calculan una sola vez en el constructor.
+    """
+
+    def __init__(self, graph, num_landmarks=4, landmarks=None):
+        neighbors, encode, decode = graph_accessors(graph)
+        reverse_neighbors, _, _ = graph_accessors(reverse_graph(graph))
+        nodes = graph_nodes(graph)
+
+        if landmarks is not None:
+            chosen = [encode(name) for name in landmarks]
+            known = set(nodes)
+            unknown = [name for name, node in zip(landmarks, chosen) if node not in known]
+            if unknown:
+                raise ValueError(f"Landmarks que no están en el grafo: {', '.join(map(repr, unknown))}")
+        else:
+            chosen = self._pick_landmarks(neighbors, nodes, num_landmarks)
+
+        self.landmarks = [decode(n) for n in chosen]
+        self.tables = [
+            (_distances_from(neighbors, landmark), _distances_from(reverse_neighbors, landmark))
+            for landmark in chosen
+        ]
+
+        # Vectores por nodo, para no recorrer las tablas en cada llamada:
+        # from_landmarks[n][i] = d(L_i, n) y to_landmarks[n][i] = d(n, L_i).
+        # Las distancias desconocidas son NaN: cualquier cota con ellas
+        # también es NaN y nunca gana la comparación con la mejor.
+        nan = float('nan')
+        self.from_landmarks = {n: tuple(fwd.get(n, nan) for fwd, _ in self.tables) for n in nodes}
+        self.to_landmarks = {n: tuple(bwd.get(n, nan) for _, bwd in self.tables) for n in nodes}
+        self._unknown = (nan,) * len(self.tables)
+
+    @staticmethod
+    def _pick_landmarks(neighbors, nodes, num_landmarks):
+        if not nodes:
+            return []
+        # El primero: el nodo más lejano a un nodo cualquiera
+        dist = _distances_from(neighbors, nodes[0])
+        chosen = [max(dist, key=dist.get)]
+        closest = _distances_from(neighbors, chosen[0])
+        while len(chosen) < min(num_landmarks, len(nodes)):
+            candidates = [n for n in nodes if n not in chosen]
+            # Los nodos inalcanzables desde todos los landmarks se eligen primero
+            landmark = max(candidates, key=lambda n: closest.get(n, float('inf')))
+            chosen.append(landmark)
+            for node, d in _distances_from(neighbors, landmark).items():
+                if d < closest.get(node, float('inf')):
+                    closest[node] = d
+        return chosen
+
+    def __call__(self, node, goal):
+        # Sin bind: la A* bidireccional la llama con la meta cambiando en cada nodo
+        unknown = self._unknown
+        return _alt_bound(self.from_landmarks.get(goal, unknown), self.to_landmarks.get(goal, unknown),
+                          self.from_landmarks.get(node, unknown), self.to_landmarks.get(node, unknown))
+
+    def bind(self, goal):
+        # Vectores de la meta (d(L, t), d(t, L)) leídos una sola vez
+        unknown = self._unknown
+        from_landmarks, to_landmarks = self.from_landmarks, self.to_landmarks
+        from_goal = from_landmarks.get(goal, unknown)
+        to_goal = to_landmarks.get(goal, unknown)
+
+        def h(node):
+            return _alt_bound(from_goal, to_goal, from_landmarks.get(node, unknown),
+                              to_landmarks.get(node, unknown))
+        return h
+
+
+def _alt_bound(from_goal, to_goal, from_node, to_node):
+    """max(0, d(L, t) - d(L, n), d(n, L) - d(t, L)) sobre los landmarks."""
+    best = 0
+    for goal_d, node_d in zip(from_goal, from_node):
+        if goal_d - node_d > best:
+            best = goal_d - node_d
+    for node_d, goal_d in zip(to_node, to_goal):
+        if node_d - goal_d > best:
+            best = node_d - goal_d
+    return best
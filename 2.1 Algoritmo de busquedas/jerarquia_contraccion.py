@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+from grafo_csr import CSRGraph
+from monticulo import IndexedHeap
+
+# ---------------------------------------------------------
+# Jerarquía de contracción (Contraction Hierarchies)
+#
+# Preproceso (una sola vez, offline):
+#   1. Se ordenan los nodos por "importancia" y se contraen uno a uno.
+#   2. Al contraer v, para cada par u -> v -> w sin un camino alternativo
+#      (witness) igual de barato se añade un atajo u -> w con nodo medio v.
+#
+# Consulta: Dijkstra bidireccional en el que cada sentido solo sube
+# de rango. Los atajos del camino se desempaquetan recursivamente
+# para devolver la ruta completa por las aristas originales.
+
+
+class ContractionHierarchy:
+    """
+    Grafo preprocesado para consultas punto a punto repetidas.
+    Se construye con ContractionHierarchy.build(graph) y se guarda
+    o recupera de disco con save(path) / ContractionHierarchy.load(path).
+    """
+
+    def __init__(self, names, rank, up, down, middle):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.rank = rank
+        self.up = up          # up[u]   = [(v, peso)] con rank[v] > rank[u]
+        self.down = down      # down[v] = [(u, peso)] aristas u -> v con rank[u] > rank[v]
+        self.middle = middle  # (u, v) -> nodo medio del atajo
+
+    # -----------------------------------------------------
+    # Preproceso
+
+    @classmethod
+    def build(cls, graph, witness_limit=50):
+        """
+        Contrae todos los nodos de `graph` (dict de dicts o CSRGraph).
+        `witness_limit` acota los nodos asentados en cada búsqueda de
+        testigos; si se agota se añade el atajo (nunca es incorrecto).
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = len(graph)
+
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in range(n):
+            for v, w in graph.neighbors(u):
+                if u != v and w < out_edges[u].get(v, float('inf')):
+                    out_edges[u][v] = w
+                    in_edges[v][u] = w
+
+        middle = {}
+        rank = [-1] * n
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+        deleted_neighbors = [0] * n
+
+        def witness_distances(source, excluded, max_cost):
+            dist = {source: 0}
+            done = set()
+            frontier = IndexedHeap()
+            frontier.push(source, 0)
+            while frontier and len(done) < witness_limit:
+                node, d = frontier.pop()
+                if d > max_cost:
+                    break
+                done.add(node)
+                for neighbor, w in out_edges[node].items():
+                    if neighbor != excluded and neighbor not in done:
+                        if frontier.push_or_decrease(neighbor, d + w):
+                            dist[neighbor] = d + w
+            return dist
+
+        def shortcuts_for(v):
+            shortcuts = []
+            outgoing = out_edges[v]
+            for u, w_in in in_edges[v].items():
+                if not outgoing:
+                    break
+                max_cost = w_in + max(outgoing.values())
+                dist = witness_distances(u, v, max_cost)
+                for w, w_out in outgoing.items():
+                    if w != u and dist.get(w, float('inf')) > w_in + w_out:
+                        shortcuts.append((u, w, w_in + w_out))
+            return shortcuts
+
+        def priority(v):
+            edge_difference = len(shortcuts_for(v)) - len(in_edges[v]) - len(out_edges[v])
+            return edge_difference + deleted_neighbors[v]
+
+        order = IndexedHeap()
+        for v in range(n):
+            order.push(v, priority(v))
+
+        next_rank = 0
+        while order:
+            v, _ = order.pop()
+            # Actualización perezosa: si ya no es el mínimo, se reinserta
+            current = priority(v)
+            if order and current > order.peek()[1]:
+                order.push(v, current)
+                continue
+
+            for u, w, cost in shortcuts_for(v):
+                if cost < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    middle[(u, w)] = v
+
+            rank[v] = next_rank
+            next_rank += 1
+            for w, cost in out_edges[v].items():
+                up[v].append((w, cost))
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            for u, cost in in_edges[v].items():
+                down[v].append((u, cost))
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+        return cls(list(graph.names), rank, up, down, middle)
+
+    # -----------------------------------------------------
+    # Consulta
+
+    def query(self, start, goal):
+        """Devuelve (camino, coste) con el mismo contrato que ucs/a_star."""
+        s, t = self.index.get(start), self.index.get(goal)
+        if s is None or t is None:
+            return None, float('inf')
+        if s == t:
+            return [start], 0
+
+        # (aristas, frontera, distancias, predecesores) de cada sentido
+        sides = [
+            (self.up, IndexedHeap(), {s: 0}, {s: None}),
+            (self.down, IndexedHeap(), {t: 0}, {t: None}),
+        ]
+        sides[0][1].push(s, 0)
+        sides[1][1].push(t, 0)
+        best_cost = float('inf')
+        meeting = None
+
+        while sides[0][1] or sides[1][1]:
+            for this, other in ((0, 1), (1, 0)):
+                adjacent, frontier, dist, parents = sides[this]
+                if not frontier:
+                    continue
+                node, d = frontier.pop()
+                if d >= best_cost:
+                    # Este sentido ya no puede mejorar el resultado
+                    frontier.clear()
+                    continue
+                other_d = sides[other][2].get(node)
+                if other_d is not None and d + other_d < best_cost:
+                    best_cost = d + other_d
+                    meeting = node
+                for neighbor, w in adjacent[node]:
+                    if d + w < dist.get(neighbor, float('inf')):
+                        dist[neighbor] = d + w
+                        parents[neighbor] = node
+                        frontier.push_or_decrease(neighbor, d + w)
+
+        if meeting is None:
+            return None, float('inf')
+
+        # Secuencia de nodos en el grafo con atajos: s .. meeting .. t
+        forward_parents, backward_parents = sides[0][3], sides[1][3]
+        overlay = []
+        node = meeting
+        while node is not None:
+            overlay.append(node)
+            node = forward_parents[node]
+        overlay.reverse()
+        node = backward_parents[meeting]
+        while node is not None:
+            overlay.append(node)
+            node = backward_parents[node]
+
+        path = [overlay[0]]
+        for u, v in zip(overlay, overlay[1:]):
+            self._unpack(u, v, path)
+        return [self.names[node] for node in path], best_cost
+
+    def _unpack(self, u, v, path):
+        """Añade a `path` los nodos originales de la arista u -> v (sin u)."""
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            m = self.middle.get((a, b))
+            if m is None:
+                path.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+
+    # -----------------------------------------------------
+    # Persistencia en disco (JSON)
+
+    def save(self, path):
+        data = {
+            "names": self.names,
+            "rank": self.rank,
+            "up": [[x for edge in edges for x in edge] for edges in self.up],
+            "down": [[x for edge in edges for x in edge] for edges in self.down],
+            "middle": [[u, v, m] for (u, v), m in self.middle.items()],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        def pairs(flat):
+            return list(zip(flat[0::2], flat[1::2]))
+
+        return cls(
+            data["names"],
+            data["rank"],
+            [pairs(edges) for edges in data["up"]],
+            [pairs(edges) for edges in data["down"]],
+            {(u, v): m for u, v, m in data["middle"]},
+        )
+
+
+# ---------------------------------------------------------
+# Ejecución principal
+
+if __name__ == "__main__":
+    import sys
+    from grafo import ruta_euclidea
+
+    ch = ContractionHierarchy.build(ruta_euclidea)
+    shortcuts = len(ch.middle)
+    print(f"Jerarquía construida: {len(ch.names)} nodos, {shortcuts} atajos")
+
+    if len(sys.argv) > 1:
+        ch.save(sys.argv[1])
+        ch = ContractionHierarchy.load(sys.argv[1])
+        print(f"Guardada y recargada desde {sys.argv[1]}")
+
+    path, cost = ch.query("IES Punta del Verde", "Estadio La Cartuja\t")
+    print("Camino CH:", " → ".join(path))
+    print(f"Coste total: {cost} unidades")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import heapq
+from itertools import count
+from grafo_csr import CSRGraph, graph_accessors, reverse_graph
+from ruta_euclidea import a_star, shortest_path_tree
+
+# ---------------------------------------------------------
+# K rutas más cortas sin ciclos (algoritmo de Yen)
+#
+# Para la ruta k+1 se toma cada nodo de la ruta k como "nodo de
+# desvío": se fija el tramo inicial (raíz), se bloquean las aristas
+# que ya usaron las rutas anteriores con esa misma raíz y los nodos
+# de la raíz, y se busca el mejor desvío hasta la meta.
+#
+# Reutilización: antes de empezar se calcula una sola vez el árbol
+# de caminos mínimos hacia la meta (Dijkstra sobre el grafo
+# traspuesto). Bloquear aristas o nodos solo puede alargar las
+# distancias, así que d(n, meta) del grafo completo es una heurística
+# consistente para todas las búsquedas de desvío, que se hacen con
+# A* y exploran muy pocos nodos.
+
+
+class _SpurView:
+    """Vista del grafo sin ciertos nodos y aristas (en representación interna)."""
+
+    def __init__(self, graph, blocked_nodes, blocked_edges):
+        self.graph = graph
+        self.blocked_nodes = blocked_nodes
+        self.blocked_edges = blocked_edges
+
+    def accessors(self):
+        neighbors, encode, decode = graph_accessors(self.graph)
+        blocked_nodes, blocked_edges = self.blocked_nodes, self.blocked_edges
+
+        def filtered(node):
+            return [(v, w) for v, w in neighbors(node)
+                    if v not in blocked_nodes and (node, v) not in blocked_edges]
+        return filtered, encode, decode
+
+
+class _DistanceToGoal:
+    """Heurística exacta del grafo completo: d(n, meta) del árbol inverso."""
+
+    def __init__(self, dist, csr):
+        self.dist = dist
+        self.csr = csr
+
+    def __call__(self, node, goal):
+        return self.bind(goal)(node)
+
+    def bind(self, goal):
+        dist = self.dist
+        if self.csr:
+            return dist.__getitem__
+        inf = float('inf')
+        return lambda node: dist.get(node, inf)
+
+
+def k_shortest_paths(graph, start, goal, k=None):
+    """
+    Generador de rutas sin ciclos de `start` a `goal` en orden de coste,
+    como pares (camino, coste). Se detiene tras `k` rutas (o cuando no
+    quedan más si k es None). Las rutas se calculan bajo demanda.
+    Un `k` negativo lanza ValueError en la propia llamada.
+    """
+    if k is not None and k < 0:
+        raise ValueError(f"k debe ser >= 0 (se recibió {k})")
+    return _yen(graph, start, goal, k)
+
+
+def _yen(graph, start, goal, k):
+    if k == 0:
+        return
+    neighbors, encode, decode = graph_accessors(graph)
+    if encode(start) is None or encode(goal) is None:
+        return
+
+    dist, _ = shortest_path_tree(reverse_graph(graph), goal)
+    heuristic = _DistanceToGoal(dist, isinstance(graph, CSRGraph))
+
+    path, cost = a_star(graph, start, goal, heuristic)
+    if path is None:
+        return
+
+    def edge_weight(u, v):
+        return min(w for n, w in neighbors(u) if n == v)
+
+    found = [[encode(node) for node in path]]
+    yield path, cost
+    produced = 1
+
+    candidates = []
+    seen = {tuple(found[0])}
+    tie = count()
+
+    while k is None or produced < k:
+        previous = found[-1]
+        root_cost = 0
+        for i in range(len(previous) - 1):
+            spur, root = previous[i], previous[:i + 1]
+            blocked_edges = {(p[i], p[i + 1]) for p in found if len(p) > i + 1 and p[:i + 1] == root}
+            blocked_nodes = set(root[:-1])
+
+            view = _SpurView(graph, blocked_nodes, blocked_edges)
+            spur_path, spur_cost = a_star(view, decode(spur), goal, heuristic)
+            if spur_path is not None:
+                total = root[:-1] + [encode(node) for node in spur_path]
+                key = tuple(total)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (root_cost + spur_cost, next(tie), total))
+
+            root_cost += edge_weight(previous[i], previous[i + 1])
+
+        if not candidates:
+            return
+        cost, _, best = heapq.heappop(candidates)
+        found.append(best)
+        yield [decode(node) for node in best], cost
+        produced += 1
+
+
+# ---------------------------------------------------------
+# Ejecución principal
+
+if __name__ == "__main__":
+    from grafo import ruta_euclidea as graph
+
+    start = "IES Punta del Verde"
+    goal = "Estadio La Cartuja\t"
+    print(f"--- 5 RUTAS MÁS CORTAS: {start} → {goal.strip()} ---")
+    for i, (path, cost) in enumerate(k_shortest_paths(graph, start, goal, k=5), 1):
+        print(f"{i}. {cost} unidades: " + " → ".join(node.strip() for node in path))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---------------------------------------------------------
+# Montículo binario indexado (min-heap con decrease-key)
+#
+# A diferencia de queue.PriorityQueue no usa cerrojos, y a
+# diferencia de heapq con entradas duplicadas cada nodo aparece
+# como mucho una vez en la frontera: si se encuentra un camino
+# mejor se reduce su prioridad en el sitio (decrease-key).
+#
+# Cada entrada es una lista [prioridad, orden, clave]; el orden
+# de inserción rompe los empates (FIFO) y evita comparar claves.
+
+
+class IndexedHeap:
+    """
+    Min-heap direccionable por clave.
+    Operaciones: push, decrease_key, push_or_decrease, update, remove,
+    pop, peek, `clave in heap`, len(heap) y priority(clave).
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._pos = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, key):
+        return key in self._pos
+
+    def priority(self, key):
+        return self._heap[self._pos[key]][0]
+
+    def clear(self):
+        self._heap.clear()
+        self._pos.clear()
+
+    def peek(self):
+        """Devuelve (clave, prioridad) del mínimo sin extraerlo."""
+        entry = self._heap[0]
+        return entry[2], entry[0]
+
+    def push(self, key, priority):
+        """Inserta una clave nueva. Lanza KeyError si ya está en el montículo."""
+        if key in self._pos:
+            raise KeyError(key)
+        entry = [priority, self._counter, key]
+        self._counter += 1
+        self._heap.append(entry)
+        self._pos[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def decrease_key(self, key, priority):
+        """Reduce la prioridad de una clave existente (no hace nada si no mejora)."""
+        index = self._pos[key]
+        entry = self._heap[index]
+        if priority < entry[0]:
+            entry[0] = priority
+            self._sift_up(index)
+
+    def push_or_decrease(self, key, priority):
+        """
+        Inserta la clave o mejora su prioridad.
+        Devuelve True si la frontera ha cambiado (para actualizar el predecesor).
+        """
+        index = self._pos.get(key)
+        if index is None:
+            self.push(key, priority)
+            return True
+        entry = self._heap[index]
+        if priority < entry[0]:
+            entry[0] = priority
+            self._sift_up(index)
+            return True
+        return False
+
+    def update(self, key, priority):
+        """Inserta la clave o cambia su prioridad en cualquier sentido."""
+        index = self._pos.get(key)
+        if index is None:
+            self.push(key, priority)
+            return
+        entry = self._heap[index]
+        old = entry[0]
+        entry[0] = priority
+        if priority < old:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self, key):
+        """Elimina una clave del montículo (KeyError si no está)."""
+        index = self._pos.pop(key)
+        heap = self._heap
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._pos[last[2]] = index
+            self._sift_up(index)
+            self._sift_down(self._pos[last[2]])
+
+    def pop(self):
+        """Extrae la clave de menor prioridad. Devuelve (clave, prioridad)."""
+        heap = self._heap
+        last = heap.pop()
+        if heap:
+            top = heap[0]
+            heap[0] = last
+            self._pos[last[2]] = 0
+            self._sift_down(0)
+        else:
+            top = last
+        del self._pos[top[2]]
+        return top[2], top[0]
+
+    def _sift_up(self, index):
+        heap, pos = self._heap, self._pos
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_entry = heap[parent]
+            if entry < parent_entry:
+                heap[index] = parent_entry
+                pos[parent_entry[2]] = index
+                index = parent
+            else:
+                break
+        heap[index] = entry
+        pos[entry[2]] = index
+
+    def _sift_down(self, index):
+        heap, pos = self._heap, self._pos
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+            if heap[child] < entry:
+                heap[index] = heap[child]
+                pos[heap[index][2]] = index
+                index = child
+            else:
+                break
+        heap[index] = entry
+        pos[entry[2]] = index
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from grafo_csr import CSRGraph, changes_since, graph_accessors, reverse_graph
+from monticulo import IndexedHeap
+from ruta_euclidea import bind_heuristic
+
+# ---------------------------------------------------------
+# Replanificación incremental: Lifelong Planning A* (LPA*)
+#
+# Cada nodo guarda g (coste de la última expansión) y rhs (coste
+# previsto a partir de sus predecesores). Un nodo es "inconsistente"
+# si g != rhs y solo esos entran en la frontera. Cuando cambia el peso
+# de una arista basta con recalcular rhs de su destino: la búsqueda
+# siguiente repara solo la zona afectada en lugar de empezar de cero.
+#
+# Clave de prioridad: (min(g, rhs) + h(n), min(g, rhs)).
+
+INF = float('inf')
+
+
+class IncrementalPlanner:
+    """
+    Planificador incremental entre un `start` y un `goal` fijos.
+
+    - update_edge(u, v, w): cambia el peso de la arista u -> v
+      (w = inf la elimina; en dict de dicts también se pueden crear aristas).
+    - replan(): repara la búsqueda y devuelve (camino, coste).
+
+    Con un CSRGraph compartido, replan() también recoge los cambios hechos
+    con graph.set_weight por otros (p. ej. otros planificadores o el feed
+    de tráfico) leyendo graph.changes. Sucesores y predecesores se leen
+    del propio grafo (graph.predecessors), así que cada planificador solo
+    guarda su estado g/rhs. Con un dict de dicts los predecesores salen de
+    `reverse` (reverse_graph(graph)), que se puede compartir entre los
+    planificadores del mismo grafo.
+    La heurística debe ser consistente también con los pesos nuevos.
+    """
+
+    def __init__(self, graph, start, goal, heuristic=None, reverse=None):
+        self.graph = graph
+        self._successors, encode, self._decode = graph_accessors(graph)
+        self._encode = encode
+        self.start, self.goal = encode(start), encode(goal)
+        if self.start is None or self.goal is None:
+            raise KeyError(start if self.start is None else goal)
+        self._h = bind_heuristic(heuristic, self.goal)
+        if isinstance(graph, CSRGraph):
+            self.reverse = None
+            self._predecessors = graph.predecessors
+        else:
+            self.reverse = reverse if reverse is not None else reverse_graph(graph)
+            self._predecessors = lambda node: self.reverse.get(node, {}).items()
+        self._version = getattr(graph, "version", 0)
+        self._reset()
+
+    def _reset(self):
+        self.g = {}
+        self.rhs = {self.start: 0}
+        self.frontier = IndexedHeap()
+        self.frontier.push(self.start, self._key(self.start))
+
+    def _key(self, node):
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + self._h(node), best)
+
+    def _update_vertex(self, node):
+        if node != self.start:
+            best = INF
+            g = self.g
+            for pred, weight in self._predecessors(node):
+                cost = g.get(pred, INF) + weight
+                if cost < best:
+                    best = cost
+            self.rhs[node] = best
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self.frontier.update(node, self._key(node))
+        elif node in self.frontier:
+            self.frontier.remove(node)
+
+    def _compute_shortest_path(self):
+        frontier, g, rhs, goal = self.frontier, self.g, self.rhs, self.goal
+        while frontier and (frontier.peek()[1] < self._key(goal)
+                            or rhs.get(goal, INF) != g.get(goal, INF)):
+            node, _ = frontier.pop()
+            if g.get(node, INF) > rhs.get(node, INF):
+                g[node] = rhs[node]
+            else:
+                g[node] = INF
+                self._update_vertex(node)
+            for successor, _ in self._successors(node):
+                self._update_vertex(successor)
+
+    def update_edge(self, u, v, weight):
+        """Cambia el peso de la arista u -> v (nombres) en el grafo y en el planificador."""
+        if isinstance(self.graph, CSRGraph):
+            # Se aplica al recoger el registro de cambios en replan()
+            self.graph.set_weight(u, v, weight)
+            return
+        if weight == INF:
+            self.graph.get(u, {}).pop(v, None)
+            self.reverse.get(v, {}).pop(u, None)
+        else:
+            self.graph.setdefault(u, {})[v] = weight
+            self.reverse.setdefault(v, {})[u] = weight
+        self._update_vertex(v)
+
+    def _sync(self):
+        graph = self.graph
+        self._version, changes = changes_since(graph, self._version)
+        if changes is None:
+            # Registro incompleto: se empieza de cero (las aristas ya se leen del grafo)
+            self._reset()
+            return
+        # Los pesos nuevos ya están en el grafo: basta con recalcular rhs de cada destino
+        for _, _, v, _, _ in changes:
+            self._update_vertex(v)
+
+    def replan(self):
+        """Repara la búsqueda tras los cambios y devuelve (camino, coste)."""
+        self._sync()
+        self._compute_shortest_path()
+
+        cost = self.g.get(self.goal, INF)
+        if cost == INF:
+            return None, INF
+
+        # Camino hacia atrás: el predecesor que justifica g de cada nodo
+        path = [self.goal]
+        node = self.goal
+        g = self.g
+        while node != self.start:
+            node = min(self._predecessors(node),
+                       key=lambda item: g.get(item[0], INF) + item[1])[0]
+            path.append(node)
+        path.reverse()
+        return [self._decode(node) for node in path], cost
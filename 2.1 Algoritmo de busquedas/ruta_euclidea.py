@@ -1,178 +1,501 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from array import array
 from collections import deque
-import heapq
 from grafo import ruta_euclidea as graph   
+from grafo import coordenadas
+from grafo_csr import CSRGraph, dijkstra_all, graph_accessors, reverse_graph
+from monticulo import IndexedHeap
+
+# ---------------------------------------------------------
+# Reconstrucción del camino a partir de los predecesores
+#
+# Las búsquedas no copian el camino en cada expansión: guardan
+# el predecesor de cada nodo y solo al llegar a la meta se
+# recorre la cadena de predecesores hacia atrás.
+
+def reconstruct_path(parents, goal, decode=None):
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node if decode is None else decode(node))
+        node = parents[node]
+    path.reverse()
+    return path
+
+
+def finish(stats, result):
+    """Cierra las estadísticas (si las hay) y devuelve el resultado tal cual."""
+    if stats is not None:
+        stats.stop()
+    return result
+
+
+def bind_heuristic(heuristic, goal):
+    """Convierte una heurística h(nodo, meta) en una función h(nodo) para `goal`."""
+    if heuristic is None:
+        return lambda node: 0
+    bind = getattr(heuristic, 'bind', None)
+    if bind is not None:
+        return bind(goal)
+    return lambda node: heuristic(node, goal)
+
 
 # ---------------------------------------------------------
 # Paso 1: Búsqueda en anchura (BFS)
 
-def bfs(graph, start, goal):
-    queue = deque([[start]])
-    visited = set([start])
+def bfs(graph, start, goal, stats=None):
+    if stats is not None:
+        stats.start()
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return finish(stats, None)
+
+    queue = deque([start])
+    parents = {start: None}  # hace también de conjunto de visitados
 
     while queue:
-        path = queue.popleft()
-        node = path[-1]
+        node = queue.popleft()
+        if stats is not None:
+            stats.expanded += 1
 
         if node == goal:
-            return path
+            return finish(stats, reconstruct_path(parents, goal, decode))
 
-        for neighbor in graph.get(node, {}):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = list(path)
-                new_path.append(neighbor)
-                queue.append(new_path)
-    return None
+        for neighbor, _ in neighbors(node):
+            if neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+                    stats.frontier_size(len(queue))
+    return finish(stats, None)
 
 
 # ---------------------------------------------------------
 # Paso 2: Búsqueda en profundidad (DFS)
 
-def dfs(graph, start, goal):
-    stack = [[start]]
-    visited = set([start])
+def dfs(graph, start, goal, stats=None):
+    if stats is not None:
+        stats.start()
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return finish(stats, None)
+
+    stack = [start]
+    parents = {start: None}
 
     while stack:
-        path = stack.pop()
-        node = path[-1]
+        node = stack.pop()
+        if stats is not None:
+            stats.expanded += 1
 
         if node == goal:
-            return path
+            return finish(stats, reconstruct_path(parents, goal, decode))
 
-        for neighbor in graph.get(node, {}):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = list(path)
-                new_path.append(neighbor)
-                stack.append(new_path)
-    return None
+        for neighbor, _ in neighbors(node):
+            if neighbor not in parents:
+                parents[neighbor] = node
+                stack.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+                    stats.frontier_size(len(stack))
+    return finish(stats, None)
 
 
 # ---------------------------------------------------------
 # Paso 3: Búsqueda de coste uniforme (UCS)
 
-def ucs(graph, start, goal):
+def ucs(graph, start, goal, stats=None):
     """
     Búsqueda de coste uniforme (Uniform Cost Search)
     Devuelve el camino más barato y su coste total.
     """
-    priority_queue = [(0, [start])]  # (coste_acumulado, camino)
+    if stats is not None:
+        stats.start()
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return finish(stats, (None, float('inf')))
+
+    # Como en la búsqueda voraz, los empates de coste se rompen por el
+    # camino completo en orden lexicográfico (ver _PathOrder), igual que
+    # las tuplas (coste, camino) de la versión que copiaba caminos.
+    parents = {start: None}
+    order = _PathOrder(parents, {start: 0}, decode)
+    frontier = IndexedHeap()  # nodo -> (coste acumulado, camino) (cada nodo una sola vez)
+    frontier.push(start, _PathPriority(0, None, start, order))
     visited = set()
 
-    while priority_queue:
-        cost, path = heapq.heappop(priority_queue)
-        node = path[-1]
-
-        if node in visited:
-            continue
+    while frontier:
+        node, priority = frontier.pop()
+        cost = priority.value
         visited.add(node)
+        order.expand(node, priority.parent)
+        if stats is not None:
+            stats.expanded += 1
 
         if node == goal:
-            return path, cost
+            return finish(stats, (reconstruct_path(parents, goal, decode), cost))
 
-        for neighbor, weight in graph.get(node, {}).items():
+        for neighbor, weight in neighbors(node):
             if neighbor not in visited:
-                new_cost = cost + weight
-                new_path = path + [neighbor]
-                heapq.heappush(priority_queue, (new_cost, new_path))
+                candidate = _PathPriority(cost + weight, node, neighbor, order)
+                if frontier.push_or_decrease(neighbor, candidate) and stats is not None:
+                    stats.pushes += 1
+                    stats.frontier_size(len(frontier))
 
-    return None, float('inf')
+    return finish(stats, (None, float('inf')))
 
 
 # ---------------------------------------------------------
 # Paso 4: Búsqueda Voraz (Greedy Best-First Search)
 
-def greedy_best_first(graph, start, goal):
+def greedy_best_first(graph, start, goal, heuristic=None, stats=None):
     """
     Búsqueda voraz (Greedy Best-First Search)
     Expande siempre el nodo más cercano al objetivo según la heurística h(n).
+    `heuristic` sigue el mismo protocolo que en a_star (ver heuristicas.py).
     """
-    from queue import PriorityQueue
-
-    def heuristic(node):
-        """
-        Heurística: distancia directa si existe conexión,
-        o la mínima de sus vecinos como estimación.
-        """
-        if goal in graph.get(node, {}):
-            return graph[node][goal]
-        else:
-            return min(graph[node].values()) if graph.get(node) else float('inf')
-
-    pq = PriorityQueue()
-    pq.put((0, [start]))
+    if stats is not None:
+        stats.start()
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return finish(stats, None)
+
+    if heuristic is None:
+        def heuristic(node):
+            """
+            Heurística: distancia directa si existe conexión,
+            o la mínima de sus vecinos como estimación.
+            """
+            best = float('inf')
+            for neighbor, weight in neighbors(node):
+                if neighbor == goal:
+                    return weight
+                best = min(best, weight)
+            return best
+    else:
+        heuristic = bind_heuristic(heuristic, goal)
+
+    # Cada nodo de la frontera guarda su mejor camino candidato como
+    # (h, predecesor); los empates de h se rompen comparando los caminos
+    # completos en orden lexicográfico, igual que las tuplas (h, camino)
+    # de la versión que copiaba caminos, pero recorriendo predecesores.
+    parents = {start: None}
+    order = _PathOrder(parents, {start: 0}, decode)
+    frontier = IndexedHeap()
+    frontier.push(start, _PathPriority(0, None, start, order))
     visited = set()
 
-    while not pq.empty():
-        _, path = pq.get()
-        node = path[-1]
+    while frontier:
+        node, priority = frontier.pop()
+        visited.add(node)
+        order.expand(node, priority.parent)
+        if stats is not None:
+            stats.expanded += 1
 
         if node == goal:
-            return path
-
-        if node not in visited:
-            visited.add(node)
-            for neighbor in graph.get(node, {}):
-                if neighbor not in visited:
-                    new_path = list(path)
-                    new_path.append(neighbor)
-                    priority = heuristic(neighbor)
-                    pq.put((priority, new_path))
+            return finish(stats, reconstruct_path(parents, goal, decode))
 
-    return None
+        for neighbor, _ in neighbors(node):
+            if neighbor not in visited:
+                candidate = _PathPriority(heuristic(neighbor), node, neighbor, order)
+                if frontier.push_or_decrease(neighbor, candidate) and stats is not None:
+                    stats.pushes += 1
+                    stats.frontier_size(len(frontier))
+
+    return finish(stats, None)
+
+
+class _PathOrder:
+    """Orden lexicográfico de caminos (por nombre) a partir de los predecesores de nodos expandidos."""
+
+    def __init__(self, parents, depth, decode):
+        self.parents = parents
+        self.depth = depth
+        self.decode = decode
+
+    def expand(self, node, parent):
+        """Fija el predecesor de un nodo expandido (su camino ya no cambia)."""
+        self.parents[node] = parent
+        self.depth[node] = 0 if parent is None else self.depth[parent] + 1
+
+    def precedes(self, parent_a, node_a, parent_b, node_b):
+        """¿camino(parent_a) + [node_a] < camino(parent_b) + [node_b]?"""
+        if parent_a == parent_b:
+            return self.decode(node_a) < self.decode(node_b)
+        parents, depth = self.parents, self.depth
+        a, b = parent_a, parent_b
+        next_a, next_b = node_a, node_b   # elemento que sigue a `a` / `b` en su camino
+        while depth[a] > depth[b]:
+            a, next_a = parents[a], a
+        while depth[b] > depth[a]:
+            b, next_b = parents[b], b
+        if a == b:
+            # Un camino es prefijo del otro hasta `a`: decide el siguiente elemento
+            if next_a != next_b:
+                return self.decode(next_a) < self.decode(next_b)
+            return depth[parent_a] < depth[parent_b]
+        while parents[a] != parents[b]:
+            a, b = parents[a], parents[b]
+        return self.decode(a) < self.decode(b)
+
+
+class _PathPriority:
+    """Prioridad de UCS (coste) y de la búsqueda voraz (h): el valor y, a igualdad, el camino candidato."""
+
+    __slots__ = ("value", "parent", "node", "order")
+
+    def __init__(self, value, parent, node, order):
+        self.value = value
+        self.parent = parent
+        self.node = node
+        self.order = order
+
+    def __eq__(self, other):
+        return self.value == other.value and self.parent == other.parent and self.node == other.node
+
+    def __lt__(self, other):
+        if self.value != other.value:
+            return self.value < other.value
+        if self.node == other.node and self.parent == other.parent:
+            return False
+        if self.parent is None or other.parent is None:
+            return self.parent is None
+        return self.order.precedes(self.parent, self.node, other.parent, other.node)
 
 
 # ---------------------------------------------------------
 # Paso 5: Algoritmo A* (A estrella)
 
-def a_star(graph, start, goal):
+def a_star(graph, start, goal, heuristic=None, stats=None):
     """
     Algoritmo A* (A estrella)
     Combina el coste real (g) con una heurística estimada (h).
-    """
-    from queue import PriorityQueue
-
-    def heuristic(node):
-        """
-        Heurística simple: distancia directa si existe conexión,
-        o la mínima de sus vecinos como estimación.
-        """
-        if goal in graph.get(node, {}):
-            return graph[node][goal]
-        else:
-            return min(graph[node].values()) if graph.get(node) else float('inf')
 
-    pq = PriorityQueue()
-    pq.put((0, 0, [start]))  # (f = g + h, g, camino)
+    `heuristic` es un callable h(nodo, meta), por ejemplo
+    heuristicas.StraightLineHeuristic o heuristicas.LandmarkHeuristic.
+    Sin heurística se usa h = 0 (equivale a UCS). Con una heurística
+    admisible y consistente el camino devuelto es óptimo.
+    `stats` (estadisticas.SearchStats) recoge contadores y tiempos.
+    """
+    if stats is not None:
+        stats.start()
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return finish(stats, (None, float('inf')))
+
+    heuristic = bind_heuristic(heuristic, goal)
+
+    frontier = IndexedHeap()  # nodo -> f = g + h
+    frontier.push(start, 0)
+    g_score = {start: 0}
+    parents = {start: None}
     visited = set()
 
-    while not pq.empty():
-        f, g, path = pq.get()
-        node = path[-1]
-
-        if node in visited:
-            continue
+    while frontier:
+        node, _ = frontier.pop()
         visited.add(node)
+        g = g_score[node]
+        if stats is not None:
+            stats.expanded += 1
 
         if node == goal:
-            return path, g  # camino y coste real acumulado
+            # camino y coste real acumulado
+            return finish(stats, (reconstruct_path(parents, goal, decode), g))
 
-        for neighbor, cost in graph.get(node, {}).items():
+        for neighbor, cost in neighbors(node):
             if neighbor not in visited:
                 g_new = g + cost
-                f_new = g_new + heuristic(neighbor)
-                pq.put((f_new, g_new, path + [neighbor]))
+                if g_new < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = g_new
+                    parents[neighbor] = node
+                    frontier.push_or_decrease(neighbor, g_new + heuristic(neighbor))
+                    if stats is not None:
+                        stats.pushes += 1
+                        stats.frontier_size(len(frontier))
+
+    return finish(stats, (None, float('inf')))
+
 
-    return None, float('inf')
+# ---------------------------------------------------------
+# Paso 6: Búsqueda bidireccional (UCS / A*)
+#
+# Se busca a la vez hacia delante desde `start` (grafo original)
+# y hacia atrás desde `goal` (grafo traspuesto). Para A* se usan
+# potenciales promediados, p(n) = (h(n, goal) - h(start, n)) / 2,
+# que mantienen los costes reducidos no negativos en ambos sentidos.
+# Criterio de parada: top_adelante + top_atrás >= mejor coste (mu).
+
+def bidirectional_a_star(graph, start, goal, heuristic=None, reverse=None):
+    """
+    A* bidireccional. Devuelve (camino, coste) igual que a_star.
+    `reverse` es el grafo traspuesto; conviene precalcularlo con
+    grafo_csr.reverse_graph si se hacen muchas consultas.
+    Sin heurística equivale a UCS bidireccional.
+    """
+    neighbors, encode, decode = graph_accessors(graph)
+    start, goal = encode(start), encode(goal)
+    if start is None or goal is None:
+        return None, float('inf')
+    if start == goal:
+        return [decode(start)], 0
+
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    reverse_neighbors, _, _ = graph_accessors(reverse)
+
+    if heuristic is None:
+        def potential(node):
+            return 0
+    else:
+        h_forward = bind_heuristic(heuristic, goal)
+
+        def potential(node):
+            return (h_forward(node) - heuristic(start, node)) / 2
+
+    # Estado de cada sentido: frontera, g, predecesores, cerrados, signo del potencial
+    sides = [
+        (neighbors, IndexedHeap(), {start: 0}, {start: None}, set(), 1),
+        (reverse_neighbors, IndexedHeap(), {goal: 0}, {goal: None}, set(), -1),
+    ]
+    sides[0][1].push(start, potential(start))
+    sides[1][1].push(goal, -potential(goal))
+
+    best_cost = float('inf')
+    meeting = None
+
+    while sides[0][1] and sides[1][1]:
+        _, top_forward = sides[0][1].peek()
+        _, top_backward = sides[1][1].peek()
+        if top_forward + top_backward >= best_cost:
+            break
+
+        # Se expande el sentido con la frontera más pequeña
+        this, other = (0, 1) if len(sides[0][1]) <= len(sides[1][1]) else (1, 0)
+        adjacent, frontier, g_score, parents, closed, sign = sides[this]
+        other_g = sides[other][2]
+
+        node, _ = frontier.pop()
+        closed.add(node)
+        g = g_score[node]
+
+        for neighbor, weight in adjacent(node):
+            if neighbor in closed:
+                continue
+            g_new = g + weight
+            if g_new < g_score.get(neighbor, float('inf')):
+                g_score[neighbor] = g_new
+                parents[neighbor] = node
+                frontier.push_or_decrease(neighbor, g_new + sign * potential(neighbor))
+            if neighbor in other_g and g_score[neighbor] + other_g[neighbor] < best_cost:
+                best_cost = g_score[neighbor] + other_g[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return None, float('inf')
+
+    path = reconstruct_path(sides[0][3], meeting, decode)
+    node = sides[1][3][meeting]
+    while node is not None:
+        path.append(decode(node))
+        node = sides[1][3][node]
+    return path, best_cost
+
+
+def bidirectional_ucs(graph, start, goal, reverse=None):
+    """Búsqueda de coste uniforme bidireccional (Dijkstra bidireccional)."""
+    return bidirectional_a_star(graph, start, goal, None, reverse)
+
+
+# ---------------------------------------------------------
+# Paso 7: Árbol de caminos mínimos (uno a todos) y matriz de distancias
+#
+# Un único Dijkstra desde el origen sirve para todos los destinos:
+# una matriz N x M cuesta N búsquedas y no N x M. El Dijkstra
+# sobre nodos internos (dijkstra_all) vive en grafo_csr.
+
+def shortest_path_tree(graph, source, targets=None):
+    """
+    Árbol de caminos mínimos desde `source` (un Dijkstra hasta el final,
+    o hasta asentar `targets` si se indican).
+
+    - dict de dicts: devuelve dos dict {nombre: distancia} y
+      {nombre: predecesor} con los nodos alcanzados.
+    - CSRGraph: devuelve array('d') de distancias (inf si no se alcanza)
+      y array('i') de predecesores (-1 si no tiene) indexados por id.
+    """
+    neighbors, encode, decode = graph_accessors(graph)
+    node = encode(source)
+    if node is None:
+        raise KeyError(source)
+    if targets is not None:
+        targets = [t for t in map(encode, targets) if t is not None]
+
+    dist, parents = dijkstra_all(neighbors, node, targets)
+
+    if not isinstance(graph, CSRGraph):
+        return dist, parents
+    dist_array = array('d', [float('inf')]) * len(graph)
+    parent_array = array('i', [-1]) * len(graph)
+    for node, d in dist.items():
+        dist_array[node] = d
+        parent = parents[node]
+        parent_array[node] = -1 if parent is None else parent
+    return dist_array, parent_array
+
+
+def path_from_tree(graph, tree, target):
+    """
+    Camino desde la raíz hasta `target` a partir del par (dist, parents)
+    devuelto por shortest_path_tree. None si `target` no se alcanza.
+    """
+    dist, parents = tree
+    if isinstance(graph, CSRGraph):
+        node = graph.index.get(target)
+        if node is None or dist[node] == float('inf'):
+            return None
+        path = []
+        while node != -1:
+            path.append(graph.names[node])
+            node = parents[node]
+        path.reverse()
+        return path
+    if target not in parents:
+        return None
+    return reconstruct_path(parents, target)
+
+
+def distance_matrix(graph, sources, targets):
+    """
+    Matriz de distancias: fila i = origen sources[i], columna j = destino targets[j].
+    Hace un árbol de caminos mínimos por origen (parando al alcanzar todos los destinos).
+    """
+    csr = isinstance(graph, CSRGraph)
+    matrix = []
+    for source in sources:
+        dist, _ = shortest_path_tree(graph, source, targets)
+        if csr:
+            row = [dist[graph.index[t]] if t in graph.index else float('inf') for t in targets]
+        else:
+            row = [dist.get(t, float('inf')) for t in targets]
+        matrix.append(row)
+    return matrix
 
 
 # ---------------------------------------------------------
 # Ejecución principal
 
 if __name__ == "__main__":
+    from estadisticas import SearchStats
+    from heuristicas import LandmarkHeuristic, StraightLineHeuristic
+
     start = "IES Punta del Verde"
     goal = "Estadio La Cartuja\t"  # ⚠️ cuidado con el tabulador en el nombre
 
@@ -214,9 +537,39 @@ if __name__ == "__main__":
 
     # A*
     print("\n--- ALGORITMO A* (A ESTRELLA) ---")
-    path_astar, cost_astar = a_star(graph, start, goal)
+    path_astar, cost_astar = a_star(graph, start, goal, StraightLineHeuristic(graph, coordenadas))
     if path_astar:
         print("Camino A*:", " → ".join(path_astar))
         print(f"Coste total: {cost_astar} unidades")
     else:
         print("No se encontró un camino con A*.")
+
+    # A* con landmarks (ALT)
+    print("\n--- ALGORITMO A* CON LANDMARKS (ALT) ---")
+    alt = LandmarkHeuristic(graph, num_landmarks=4)
+    path_alt, cost_alt = a_star(graph, start, goal, alt)
+    if path_alt:
+        print("Landmarks:", ", ".join(name.strip() for name in alt.landmarks))
+        print("Camino ALT:", " → ".join(path_alt))
+        print(f"Coste total: {cost_alt} unidades")
+    else:
+        print("No se encontró un camino con ALT.")
+
+    # A* BIDIRECCIONAL
+    print("\n--- A* BIDIRECCIONAL ---")
+    path_bi, cost_bi = bidirectional_a_star(graph, start, goal, StraightLineHeuristic(graph, coordenadas))
+    if path_bi:
+        print("Camino A* bidireccional:", " → ".join(path_bi))
+        print(f"Coste total: {cost_bi} unidades")
+    else:
+        print("No se encontró un camino con A* bidireccional.")
+
+    # ESTADÍSTICAS: nodos expandidos por UCS frente a A* con cada heurística
+    print("\n--- ESTADÍSTICAS DE BÚSQUEDA ---")
+    for name, search in (("UCS", lambda st: ucs(graph, start, goal, stats=st)),
+                         ("A* línea recta", lambda st: a_star(graph, start, goal, StraightLineHeuristic(graph, coordenadas), st)),
+                         ("A* ALT", lambda st: a_star(graph, start, goal, alt, st))):
+        stats = SearchStats()
+        search(stats)
+        print(f"{name}: {stats.expanded} expandidos, {stats.pushes} inserciones, "
+              f"frontera máx. {stats.peak_frontier}, {stats.elapsed * 1000:.3f} ms")
\ No newline at end of file
@@ -0,0 +1,94 @@
+import gc
+import glob
+import itertools
+import os
+import tempfile
+
+import pytest
+
+from busqueda_lotes import batch_search
+from grafo import coordenadas, ruta_euclidea as graph
+from ruta_euclidea import a_star, ucs
+from heuristicas import StraightLineHeuristic
+
+PAIRS = list(itertools.product(list(graph)[:5], list(graph)[-5:]))
+
+
+def _temporary_graphs():
+    return {path for suffix in ("*.csrg", "*.xy") for path in glob.glob(os.path.join(tempfile.gettempdir(), suffix))}
+
+
+def test_unknown_algorithm_fails_at_call_time():
+    with pytest.raises(ValueError):
+        batch_search(graph, PAIRS, "nope")
+
+
+def test_single_worker_runs_in_process_without_temp_file():
+    before = _temporary_graphs()
+    results = batch_search(graph, PAIRS, "ucs", workers=1)
+    assert _temporary_graphs() == before
+    assert list(results) == [ucs(graph, s, g) for s, g in PAIRS]
+
+
+def test_single_worker_uses_heuristic():
+    heuristic = StraightLineHeuristic(graph, coordenadas)
+    results = list(batch_search(graph, PAIRS, "a_star", workers=1, coordinates=coordenadas))
+    assert results == [a_star(graph, s, g, heuristic) for s, g in PAIRS]
+
+
+def test_pool_results_and_temp_file_cleanup():
+    before = _temporary_graphs()
+    assert list(batch_search(graph, PAIRS, "ucs", workers=2, chunksize=4)) == [ucs(graph, s, g) for s, g in PAIRS]
+    assert _temporary_graphs() == before
+
+    # Un iterador abandonado sin empezar también borra su fichero
+    results = batch_search(graph, PAIRS, "ucs", workers=2)
+    assert len(_temporary_graphs() - before) == 1
+    del results
+    gc.collect()
+    assert _temporary_graphs() == before
+
+
+def test_pool_workers_skip_closed_edges():
+    from grafo_csr import CSRGraph
+    from ruta_euclidea import bfs
+
+    csr = CSRGraph.from_dict(graph)
+    start, goal = PAIRS[0]
+    path = bfs(csr, start, goal)
+    csr.set_weight(path[0], path[1], float('inf'))
+    pooled = list(batch_search(csr, [(start, goal)], "bfs", workers=2))
+    assert pooled == list(batch_search(csr, [(start, goal)], "bfs", workers=1)) == [bfs(csr, start, goal)]
+    assert pooled != [path]
+
+
+def test_pool_workers_load_the_heuristic_from_file(monkeypatch):
+    import busqueda_lotes
+
+    # Los procesos solo reciben rutas de fichero, nunca las coordenadas
+    sent = []
+    real_pool = busqueda_lotes.Pool
+
+    def recording_pool(*args, **kwargs):
+        sent.append(kwargs["initargs"])
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(busqueda_lotes, "Pool", recording_pool)
+
+    before = _temporary_graphs()
+    heuristic = StraightLineHeuristic(graph, coordenadas)
+    results = list(batch_search(graph, PAIRS, "a_star", workers=2, coordinates=coordenadas))
+    assert results == [a_star(graph, s, g, heuristic) for s, g in PAIRS]
+    path, algorithm, heuristic_path = sent[0]
+    assert algorithm == "a_star" and path.endswith(".csrg") and heuristic_path.endswith(".xy")
+    assert _temporary_graphs() == before
+
+
+def test_straight_line_heuristic_round_trips_through_a_file(tmp_path):
+    from grafo_csr import CSRGraph
+
+    csr = CSRGraph.from_dict(graph)
+    heuristic = StraightLineHeuristic(csr, coordenadas)
+    heuristic.save(str(tmp_path / "h.xy"))
+    loaded = StraightLineHeuristic.load(str(tmp_path / "h.xy"))
+    assert (loaded.scale, loaded.xy) == (heuristic.scale, heuristic.xy)
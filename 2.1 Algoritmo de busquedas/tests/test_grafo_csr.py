@@ -0,0 +1,65 @@
+import copy
+
+from cache_rutas import RouteCache
+from grafo import ruta_euclidea as graph
+from grafo_binario import open_binary, save_binary
+from grafo_csr import CSRGraph
+from ruta_euclidea import bfs, bidirectional_ucs, ucs
+
+START = "IES Punta del Verde"
+GOAL = "Estadio La Cartuja\t"
+
+
+def test_set_weight_accepts_floats_on_integer_graph():
+    csr = CSRGraph.from_dict(graph)
+    u, v = next((u, v) for u in graph for v in graph[u])
+    csr.set_weight(u, v, 12.5)
+    assert csr.weight(u, v) == 12.5
+    assert csr.changes[-1][1:] == (csr.index[u], csr.index[v], graph[u][v], 12.5)
+    # Los demás pesos se conservan
+    assert all(csr.weight(a, b) == graph[a][b] for a in graph for b in graph[a] if (a, b) != (u, v))
+
+
+def test_infinite_weight_closes_edge():
+    csr = CSRGraph.from_dict(graph)
+    path, cost = ucs(csr, START, GOAL)
+    u, v = path[0], path[1]
+    csr.set_weight(u, v, float('inf'))
+
+    reduced = copy.deepcopy(graph)
+    del reduced[u][v]
+    assert ucs(csr, START, GOAL) == ucs(reduced, START, GOAL)
+
+    csr.set_weight(u, v, graph[u][v])
+    assert ucs(csr, START, GOAL) == (path, cost)
+
+
+def test_route_cache_follows_float_updates():
+    csr = CSRGraph.from_dict(graph)
+    cache = RouteCache(csr)
+    path, _ = cache.query(START, GOAL)
+    csr.set_weight(path[0], path[1], graph[path[0]][path[1]] + 0.5)
+    assert cache.query(START, GOAL) == ucs(csr, START, GOAL)
+
+
+def test_reversed_graph_keeps_closed_edges_closed():
+    g = {"A": {"B": 10, "X1": 50, "X2": 50, "X3": 50}, "B": {"C": 10}, "D": {"C": 1}}
+    csr = CSRGraph.from_dict(g)
+    csr.set_weight("D", "C", float('inf'))
+    reverse = csr.reversed()
+    assert reverse.closed_edges == 1
+    assert reverse.to_dict() == {"B": {"A": 10}, "X1": {"A": 50}, "X2": {"A": 50}, "X3": {"A": 50},
+                                 "C": {"B": 10}}
+    assert bidirectional_ucs(csr, "A", "C") == (["A", "B", "C"], 20.0)
+
+
+def test_closed_edge_survives_save_and_open_binary(tmp_path):
+    csr = CSRGraph.from_dict(graph)
+    path = bfs(csr, START, GOAL)
+    csr.set_weight(path[0], path[1], float('inf'))
+    expected = bfs(csr, START, GOAL), ucs(csr, START, GOAL)
+
+    save_binary(csr, str(tmp_path / "cerrado.csrg"))
+    reopened = open_binary(str(tmp_path / "cerrado.csrg"))
+    assert reopened.closed_edges == 1
+    assert (bfs(reopened, START, GOAL), ucs(reopened, START, GOAL)) == expected
@@ -0,0 +1,55 @@
+import pytest
+
+from grafo import ruta_euclidea as graph
+from grafo_csr import CSRGraph
+from heuristicas import LandmarkHeuristic
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+def test_unknown_landmark_is_rejected(backend):
+    g = graph if backend == "dict" else CSRGraph.from_dict(graph)
+    known = next(iter(graph))
+    with pytest.raises(ValueError, match="Atlantis"):
+        LandmarkHeuristic(g, landmarks=[known, "Atlantis"])
+
+
+def test_given_landmarks_are_used():
+    names = list(graph)[:2]
+    assert LandmarkHeuristic(CSRGraph.from_dict(graph), landmarks=names).landmarks == names
+
+
+def _reference_bound(alt, node, goal):
+    """La cota ALT calculada directamente sobre las tablas de distancias."""
+    best = 0
+    for fwd, bwd in alt.tables:
+        if goal in fwd and node in fwd:
+            best = max(best, fwd[goal] - fwd[node])
+        if goal in bwd and node in bwd:
+            best = max(best, bwd[node] - bwd[goal])
+    return best
+
+
+# Un grafo con nodos inalcanzables desde algunos landmarks
+PARTIAL = {"A": {"B": 1}, "B": {"C": 2}, "D": {"A": 5}, "E": {"C": 1}}
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+@pytest.mark.parametrize("base", [graph, PARTIAL], ids=["sevilla", "partial"])
+def test_landmark_vectors_give_the_table_bounds(backend, base):
+    g = base if backend == "dict" else CSRGraph.from_dict(base)
+    alt = LandmarkHeuristic(g, num_landmarks=3)
+    nodes = list(alt.from_landmarks)
+    for goal in nodes:
+        h = alt.bind(goal)
+        for node in nodes:
+            assert h(node) == alt(node, goal) == _reference_bound(alt, node, goal)
+
+
+def test_bidirectional_a_star_with_landmarks_is_optimal():
+    from ruta_euclidea import bidirectional_a_star, ucs
+
+    csr = CSRGraph.from_dict(graph)
+    alt = LandmarkHeuristic(csr, num_landmarks=4)
+    for start in list(graph)[:6]:
+        for goal in graph:
+            assert bidirectional_a_star(csr, start, goal, alt)[1] == ucs(csr, start, goal)[1]
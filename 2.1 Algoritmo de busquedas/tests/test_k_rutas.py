@@ -0,0 +1,25 @@
+import itertools
+
+import pytest
+
+from grafo import ruta_euclidea as graph
+from k_rutas import k_shortest_paths
+
+START = "IES Punta del Verde"
+GOAL = "Estadio La Cartuja\t"
+
+
+def test_k_zero_yields_nothing():
+    assert list(k_shortest_paths({0: {1: 1}, 1: {2: 1}}, 0, 2, 0)) == []
+
+
+def test_negative_k_is_rejected_at_call_time():
+    with pytest.raises(ValueError):
+        k_shortest_paths(graph, START, GOAL, -1)
+
+
+def test_k_limits_the_number_of_routes():
+    routes = list(k_shortest_paths(graph, START, GOAL, 3))
+    assert len(routes) == 3
+    assert routes == list(itertools.islice(k_shortest_paths(graph, START, GOAL), 3))
+    assert [cost for _, cost in routes] == sorted(cost for _, cost in routes)
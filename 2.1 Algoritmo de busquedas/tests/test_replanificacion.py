@@ -0,0 +1,63 @@
+import copy
+
+from grafo import ruta_euclidea as graph
+from grafo_csr import CSRGraph
+from replanificacion import IncrementalPlanner
+from ruta_euclidea import ucs
+
+START = "IES Punta del Verde"
+GOAL = "Estadio La Cartuja\t"
+
+
+def test_planner_closes_edges_on_csr_graph():
+    csr = CSRGraph.from_dict(graph)
+    reference = copy.deepcopy(graph)
+    planner = IncrementalPlanner(csr, START, GOAL)
+    assert planner.replan()[1] == ucs(reference, START, GOAL)[1]
+
+    # Se cierran una a una las aristas de la ruta actual
+    for _ in range(3):
+        path, _ = planner.replan()
+        if path is None:
+            break
+        u, v = path[0], path[1]
+        planner.update_edge(u, v, float('inf'))
+        del reference[u][v]
+        assert planner.replan()[1] == ucs(reference, START, GOAL)[1]
+
+    # Y se reabre la última con un peso no entero
+    planner.update_edge(u, v, 7.5)
+    reference[u][v] = 7.5
+    assert planner.replan()[1] == ucs(reference, START, GOAL)[1]
+
+
+def test_planners_share_the_graph_and_follow_its_changes():
+    import random
+
+    csr = CSRGraph.from_dict(graph)
+    names = list(graph)
+    pairs = [(START, GOAL), (names[1], names[-2]), (names[-1], names[2])]
+    planners = [IncrementalPlanner(csr, s, g) for s, g in pairs]
+    assert all(p.reverse is None for p in planners)
+
+    rnd = random.Random(0)
+    edges = [(u, v) for u in graph for v in graph[u]]
+    for _ in range(40):
+        u, v = rnd.choice(edges)
+        csr.set_weight(u, v, rnd.choice([float('inf'), graph[u][v], graph[u][v] * 2, 1]))
+        for planner, (s, g) in zip(planners, pairs):
+            assert planner.replan()[1] == ucs(csr, s, g)[1]
+
+
+def test_planner_on_dict_graph_with_shared_reverse():
+    from grafo_csr import reverse_graph
+
+    g = copy.deepcopy(graph)
+    reverse = reverse_graph(g)
+    planner = IncrementalPlanner(g, START, GOAL, reverse=reverse)
+    other = IncrementalPlanner(g, GOAL, START, reverse=reverse)
+    path, _ = planner.replan()
+    other.replan()
+    planner.update_edge(path[0], path[1], float('inf'))
+    assert planner.replan()[1] == ucs(g, START, GOAL)[1]
+    assert reverse == reverse_graph(g)
@@ -0,0 +1,90 @@
+import heapq
+import random
+from queue import PriorityQueue
+
+import pytest
+
+from grafo import ruta_euclidea as graph
+from grafo_csr import CSRGraph
+from ruta_euclidea import greedy_best_first, ucs
+
+
+def baseline_greedy_best_first(graph, start, goal):
+    """La búsqueda voraz original, que copiaba el camino en cada inserción."""
+    def heuristic(node):
+        if goal in graph.get(node, {}):
+            return graph[node][goal]
+        else:
+            return min(graph[node].values()) if graph.get(node) else float('inf')
+
+    pq = PriorityQueue()
+    pq.put((0, [start]))
+    visited = set()
+
+    while not pq.empty():
+        _, path = pq.get()
+        node = path[-1]
+
+        if node == goal:
+            return path
+
+        if node not in visited:
+            visited.add(node)
+            for neighbor in graph.get(node, {}):
+                if neighbor not in visited:
+                    new_path = list(path)
+                    new_path.append(neighbor)
+                    priority = heuristic(neighbor)
+                    pq.put((priority, new_path))
+
+    return None
+
+
+def baseline_ucs(graph, start, goal):
+    """La UCS original, con tuplas (coste, camino) en un heapq."""
+    priority_queue = [(0, [start])]
+    visited = set()
+
+    while priority_queue:
+        cost, path = heapq.heappop(priority_queue)
+        node = path[-1]
+
+        if node in visited:
+            continue
+        visited.add(node)
+
+        if node == goal:
+            return path, cost
+
+        for neighbor, weight in graph.get(node, {}).items():
+            if neighbor not in visited:
+                heapq.heappush(priority_queue, (cost + weight, path + [neighbor]))
+
+    return None, float('inf')
+
+
+def random_graph(seed, n=14, degree=4):
+    """Grafo dirigido con pesos enteros pequeños, para que haya muchos empates de coste."""
+    rnd = random.Random(seed)
+    names = [f"N{i}" for i in range(n)]
+    rnd.shuffle(names)
+    return {u: {v: rnd.randint(1, 3) for v in rnd.sample(names, degree) if v != u} for u in names}
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+def test_ucs_matches_baseline_on_tied_costs(backend):
+    for seed in range(30):
+        g = random_graph(seed)
+        search_graph = g if backend == "dict" else CSRGraph.from_dict(g)
+        for start in g:
+            for goal in g:
+                assert ucs(search_graph, start, goal) == baseline_ucs(g, start, goal), (seed, start, goal)
+
+
+@pytest.mark.parametrize("backend", ["dict", "csr"])
+def test_greedy_matches_baseline_on_every_pair(backend):
+    g = graph if backend == "dict" else CSRGraph.from_dict(graph)
+    for start in graph:
+        for goal in graph:
+            assert greedy_best_first(g, start, goal) == baseline_greedy_best_first(graph, start, goal), \
+                (start, goal)
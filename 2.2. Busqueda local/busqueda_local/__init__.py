@@ -0,0 +1,59 @@
+# =========================================================================
+# BÚSQUEDA LOCAL
+# =========================================================================
+#
+# Paquete con los algoritmos de búsqueda local de rutas:
+#
+# - rutas:         costo de una ruta y deltas de movimientos
+# - enfriamiento:  enfriamiento simulado (simulated annealing)
+# - escalada:      escalada simple, máxima pendiente, tabú y reinicios
+# - esquemas:      esquemas de enfriamiento
+# - vecindarios:   operadores de vecindad válidos por construcción
+# - paralelo:      multi-arranque y templado paralelo
+# - matriz_costos: matriz densa de costos con NumPy
+# - multiparada:   rutas con varias paradas (TSP / VRP)
+# - problemas:     carga de problemas desde JSON y resolución
+# - trayectoria:   registro binario de ejecuciones y reproducción exacta
+#
+# Importar el paquete no ejecuta nada ni carga los submódulos: cada
+# nombre se importa la primera vez que se usa (así NumPy o
+# multiprocessing solo se cargan si hacen falta).
+
+import importlib
+
+_EXPORTS = {
+    "GRAFO_SEVILLA": "datos", "COSTOS": "datos", "INICIO": "datos", "META": "datos",
+    "calcular_costo_ruta": "rutas", "costo_tramo": "rutas", "delta_movimiento": "rutas",
+    "ruta_aleatoria": "rutas",
+    "simulated_annealing": "enfriamiento",
+    "hill_climbing": "escalada", "hill_climbing_maxima_pendiente": "escalada",
+    "busqueda_tabu": "escalada", "reinicios_aleatorios": "escalada",
+    "EsquemaEnfriamiento": "esquemas", "Geometrico": "esquemas", "Lineal": "esquemas",
+    "Logaritmico": "esquemas", "LundyMees": "esquemas", "Adaptativo": "esquemas",
+    "ESQUEMAS": "esquemas", "crear_esquema": "esquemas",
+    "Vecindario": "vecindarios", "Desvio": "vecindarios", "EliminarNodo": "vecindarios",
+    "InvertirTramo": "vecindarios",
+    "multi_arranque": "paralelo", "templado_paralelo": "paralelo",
+    "MatrizCostos": "matriz_costos", "descenso_maximo": "matriz_costos", "mejor_de_k": "matriz_costos",
+    "ProblemaRutas": "multiparada", "optimizar_rutas": "multiparada",
+    "matriz_distancias": "multiparada",
+    "cargar_problema": "problemas", "resolver": "problemas", "guardar_resultado": "problemas",
+    "ALGORITMOS": "problemas",
+    "RegistroTrayectoria": "trayectoria", "leer_trayectoria": "trayectoria", "reproducir": "trayectoria",
+    "tasa_aceptacion": "trayectoria",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,89 @@
+import argparse
+import json
+import sys
+
+from .problemas import ALGORITMOS, cargar_problema, guardar_resultado, problema_de_ejemplo, resolver
+
+# =========================================================================
+# LÍNEA DE COMANDOS
+# =========================================================================
+#
+#   python -m busqueda_local [problema.json] [--algoritmo NOMBRE]
+#          [--semilla N] [--param clave=valor ...] [--salida resultado.json]
+#          [--trayectoria corrida.tray]
+#   python -m busqueda_local [problema.json] --reproducir corrida.tray
+#
+# Sin fichero se resuelve el grafo de ejemplo. Los valores de --param se
+# leen como JSON (números, listas, true/false) y si no, como texto.
+# --trayectoria guarda cada iteración del enfriamiento simulado y
+# --reproducir la repite y comprueba que sale idéntica.
+
+
+def _parametro(texto):
+    clave, separador, valor = texto.partition("=")
+    if not separador or not clave:
+        raise argparse.ArgumentTypeError(f"se esperaba clave=valor: {texto!r}")
+    try:
+        return clave, json.loads(valor)
+    except json.JSONDecodeError:
+        return clave, valor
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog="busqueda_local",
+                                     description="Búsqueda local de rutas (enfriamiento simulado, escalada...).")
+    parser.add_argument("problema", nargs="?", help="fichero JSON del problema (por defecto, el grafo de ejemplo)")
+    parser.add_argument("-a", "--algoritmo", choices=sorted(ALGORITMOS),
+                        help="algoritmo a usar (por defecto según el tipo de problema)")
+    parser.add_argument("-s", "--semilla", type=int, help="semilla aleatoria para reproducir la ejecución")
+    parser.add_argument("-p", "--param", type=_parametro, action="append", default=[], metavar="CLAVE=VALOR",
+                        help="parámetro extra del algoritmo (se puede repetir)")
+    parser.add_argument("-o", "--salida", help="guarda el resultado en este fichero JSON")
+    parser.add_argument("-t", "--trayectoria", metavar="FICHERO",
+                        help="guarda la trayectoria del enfriamiento simulado en este fichero binario")
+    parser.add_argument("-r", "--reproducir", metavar="FICHERO",
+                        help="repite la corrida guardada en este fichero de trayectoria")
+    return parser
+
+
+def _reproducir(problema, fichero):
+    from .trayectoria import reproducir, tasa_aceptacion
+
+    if "grafo" not in problema:
+        raise ValueError("solo se pueden reproducir problemas de ruta sobre un grafo")
+    ruta, costo, columnas = reproducir(fichero, problema["grafo"], problema["costos"])
+    print(f"Ruta: {' -> '.join(map(str, ruta))}")
+    print(f"Costo: {costo} ({len(columnas['iteracion'])} iteraciones idénticas, "
+          f"tasa de aceptación {tasa_aceptacion(columnas):.1%})")
+    return 0
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.trayectoria and args.algoritmo not in (None, "enfriamiento"):
+        parser.error("--trayectoria solo sirve con el algoritmo enfriamiento")
+    parametros = dict(args.param)
+    if args.trayectoria:
+        from .trayectoria import RegistroTrayectoria
+
+        parametros["registro"] = RegistroTrayectoria(fichero=args.trayectoria)
+    try:
+        problema = cargar_problema(args.problema) if args.problema else problema_de_ejemplo()
+        if args.reproducir:
+            return _reproducir(problema, args.reproducir)
+        resultado = resolver(problema, args.algoritmo, args.semilla, **parametros)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        print(f"busqueda_local: error: {error}", file=sys.stderr)
+        return 1
+
+    if "ruta" in resultado:
+        print(f"Ruta: {' -> '.join(map(str, resultado['ruta']))}")
+    else:
+        for i, ruta in enumerate(resultado["rutas"], 1):
+            print(f"Vehículo {i}: {' -> '.join(map(str, ruta))}")
+    print(f"Costo: {resultado['costo']} ({resultado['algoritmo']}, {resultado['segundos']:.2f} s)")
+
+    if args.salida:
+        guardar_resultado(resultado, args.salida)
+    return 0
@@ -0,0 +1,32 @@
+# =========================================================================
+# DATOS DE EJEMPLO
+# =========================================================================
+
+# Nodos: IES (Inicio) y ESTADIO (Meta).
+GRAFO_SEVILLA = {
+    'IES': ['A', 'B', 'C'],
+    'A': ['IES', 'D'],
+    'B': ['IES', 'D', 'E'],
+    'C': ['IES', 'F'],
+    'D': ['A', 'B', 'ESTADIO'],
+    'E': ['B', 'ESTADIO'],
+    'F': ['C', 'ESTADIO'],
+    'ESTADIO': ['D', 'E', 'F']
+}
+
+# Costos g(n) - (Tiempo o Distancia Real)
+COSTOS = {
+    ('IES', 'A'): 5, ('A', 'IES'): 5,
+    ('IES', 'B'): 15, ('B', 'IES'): 15,
+    ('IES', 'C'): 10, ('C', 'IES'): 10,
+    ('A', 'D'): 5, ('D', 'A'): 5,
+    ('B', 'D'): 1, ('D', 'B'): 1, # El camino corto "secreto"
+    ('B', 'E'): 7, ('E', 'B'): 7,
+    ('C', 'F'): 8, ('F', 'C'): 8,
+    ('D', 'ESTADIO'): 15, ('ESTADIO', 'D'): 15, # El camino caro
+    ('E', 'ESTADIO'): 4, ('ESTADIO', 'E'): 4,
+    ('F', 'ESTADIO'): 5, ('ESTADIO', 'F'): 5
+}
+
+INICIO = 'IES'
+META = 'ESTADIO'
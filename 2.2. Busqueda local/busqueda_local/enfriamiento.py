@@ -0,0 +1,253 @@
+import math
+import random
+from collections import Counter
+
+from .esquemas import Geometrico, crear_esquema
+from .rutas import (calcular_costo_ruta, delta_movimiento, ruta_inicial_en_grafo, ruta_con_movimiento,
+                    aplicar_en_sitio)
+from .trayectoria import ACEPTADO, RECHAZADO, INVALIDO
+
+# =========================================================================
+# 1. RUTA INICIAL Y OPERADOR DE VECINDAD
+# =========================================================================
+
+def generar_ruta_inicial_valida(grafo, inicio, meta, rng=None):
+    """Genera una ruta válida aleatoria (o una ruta inicial simple)"""
+    # Para este ejemplo, usaremos una ruta simple que pasa por el nodo B;
+    # en otros grafos, una ruta aleatoria sacada de `rng`
+    return ruta_inicial_en_grafo([inicio, 'B', 'E', meta], grafo, inicio, meta,
+                                 rng if rng is not None else random.Random(0))
+
+# El operador de vecindad es clave en SA. Aquí, cambiamos un nodo intermedio.
+def proponer_vecino(ruta, grafo, inicio, meta, costos, rng=random, en_ruta=None):
+    """
+    Elige un pequeño cambio de la ruta sin copiarla. Devuelve el
+    movimiento (delta, i, nodo, insertar) (ver rutas) o None si la ruta
+    no cambia: delta es la variación de costo calculada solo con las
+    aristas que cambian. `en_ruta` es el Counter de los nodos de la ruta
+    (si falta se cuenta, recorriéndola) y `rng` la fuente de azar (un
+    random.Random para poder reproducirlo).
+    """
+    # Solo cambiamos los nodos intermedios (no inicio ni meta)
+    if len(ruta) <= 2:
+        return None
+    if en_ruta is None:
+        en_ruta = Counter(ruta)
+
+    # 1. Seleccionar un índice para el nodo a cambiar (excluyendo inicio y meta)
+    idx_a_cambiar = rng.randint(1, len(ruta) - 2)
+    nodo_anterior = ruta[idx_a_cambiar - 1]
+    nodo_siguiente = ruta[idx_a_cambiar + 1]
+
+    # 2. Buscar posibles reemplazos (vecinos comunes de anterior y siguiente, o re-enrutar)
+    vecinos_anteriores = grafo.get(nodo_anterior, [])
+    candidatos = [n for n in vecinos_anteriores if n != nodo_siguiente and n != nodo_anterior and n not in en_ruta]
+    
+    # 3. Si hay candidatos, reemplazamos: cambian (anterior, x) y (x, siguiente)
+    if candidatos:
+        nodo_viejo = ruta[idx_a_cambiar]
+        nuevo_nodo = rng.choice(candidatos)
+        delta = delta_movimiento(
+            [(nodo_anterior, nuevo_nodo), (nuevo_nodo, nodo_siguiente)],
+            [(nodo_anterior, nodo_viejo), (nodo_viejo, nodo_siguiente)], costos)
+        return delta, idx_a_cambiar, nuevo_nodo, False
+    # 4. Si no, insertamos un nodo vecino válido al azar: (anterior, x) pasa a ser (anterior, nuevo, x)
+    nuevo_nodo = rng.choice([n for n in vecinos_anteriores if n != inicio])
+    nodo_desplazado = ruta[idx_a_cambiar]
+    delta = delta_movimiento(
+        [(nodo_anterior, nuevo_nodo), (nuevo_nodo, nodo_desplazado)],
+        [(nodo_anterior, nodo_desplazado)], costos)
+    return delta, idx_a_cambiar, nuevo_nodo, True
+
+def generar_vecino(ruta, grafo, inicio, meta, costos, rng=random):
+    """
+    Genera una nueva ruta vecina válida haciendo un pequeño cambio.
+    Devuelve (ruta_vecina, delta); simulated_annealing usa directamente
+    proponer_vecino para no copiar la ruta en cada iteración.
+    """
+    movimiento = proponer_vecino(ruta, grafo, inicio, meta, costos, rng)
+    if movimiento is None:
+        return list(ruta), 0
+    return ruta_con_movimiento(ruta, movimiento), movimiento[0]
+
+# =========================================================================
+# 2. ALGORITMO DE ENFRIAMIENTO SIMULADO
+# =========================================================================
+
+def simulated_annealing(grafo, inicio, meta, costos, T_inicial=100.0, factor_enfriamiento=0.99, iteraciones_max=1000,
+                        verificar_cada=1000, ruta_inicial=None, mostrar=False, esquema=None, T_minima=0.1,
+                        recalentar_tras=None, max_recalentamientos=3, fraccion_recalentamiento=0.5,
+                        ventana_convergencia=None, vecindario=None, semilla=None, rng=None, registro=None):
+    """
+    El costo de cada vecino se obtiene sumando el delta del movimiento.
+    Cada `verificar_cada` iteraciones (y siempre que la ruta actual no sea
+    válida) se recalcula el costo completo con calcular_costo_ruta.
+    `ruta_inicial` permite arrancar desde otra ruta (multi-arranque) y
+    `mostrar=True` imprime el progreso.
+
+    Enfriamiento:
+    - `esquema`: un EsquemaEnfriamiento (ver esquemas) o su
+      nombre (ajustado a iteraciones_max y T_minima con crear_esquema);
+      por defecto Geometrico(factor_enfriamiento).
+    - `recalentar_tras`: si el mejor costo no mejora en tantas iteraciones
+      (o T baja de T_minima), la temperatura vuelve a
+      fraccion_recalentamiento * T_inicial, como mucho max_recalentamientos veces.
+    - `ventana_convergencia`: se para si el mejor costo no mejora en
+      tantas iteraciones seguidas.
+
+    `vecindario` (ver vecindarios.Vecindario) sustituye a generar_vecino por
+    operadores que solo proponen rutas válidas y cuentan su tasa de aceptación.
+
+    Azar y trazas:
+    - `semilla` siembra un random.Random propio de la ejecución; sin
+      semilla se toma una del módulo random (y queda anotada). Se puede
+      pasar directamente un `rng`, pero entonces no se podrá reproducir.
+    - `registro` (ver trayectoria.RegistroTrayectoria) guarda cada
+      iteración en un buffer binario; trayectoria.reproducir la repite.
+    """
+    if rng is None:
+        if semilla is None:
+            semilla = random.randrange(2 ** 32)
+        rng = random.Random(semilla)
+    else:
+        semilla = None
+
+    if registro is not None:
+        registro.iniciar({
+            "inicio": inicio, "meta": meta, "semilla": semilla,
+            "parametros": {
+                "T_inicial": T_inicial, "factor_enfriamiento": factor_enfriamiento,
+                "iteraciones_max": iteraciones_max, "verificar_cada": verificar_cada,
+                "ruta_inicial": ruta_inicial, "T_minima": T_minima,
+                "recalentar_tras": recalentar_tras, "max_recalentamientos": max_recalentamientos,
+                "fraccion_recalentamiento": fraccion_recalentamiento,
+                "ventana_convergencia": ventana_convergencia,
+                "esquema": esquema if esquema is None or isinstance(esquema, str) else type(esquema).__name__,
+                "vecindario": None if vecindario is None else {
+                    "operadores": [type(op).__name__ for op in vecindario.operadores],
+                    "pesos": vecindario.pesos,
+                    "rng_propio": vecindario.rng is not None,
+                },
+            },
+        })
+        anotar = registro.anotar
+    
+    # Inicialización
+    if ruta_inicial is None:
+        ruta_inicial = generar_ruta_inicial_valida(grafo, inicio, meta, rng)
+    ruta_actual = list(ruta_inicial)
+    en_ruta = Counter(ruta_actual)
+    costo_actual = calcular_costo_ruta(ruta_actual, costos)
+    
+    mejor_ruta = list(ruta_actual)
+    mejor_costo = costo_actual
+
+    if esquema is None:
+        esquema = Geometrico(factor_enfriamiento)
+    elif isinstance(esquema, str):
+        esquema = crear_esquema(esquema, iteraciones_max, T_minima, factor_enfriamiento)
+    esquema.iniciar(T_inicial)
+    
+    temperatura = T_inicial
+    sin_mejora = 0          # iteraciones desde la última mejora del mejor costo
+    sin_mejora_tramo = 0    # lo mismo, pero se reinicia al recalentar
+    recalentamientos = 0
+
+    if mostrar:
+        print(f"Ruta inicial: {' -> '.join(ruta_actual)} | Costo: {costo_actual}")
+        print("-" * 40)
+
+    for i in range(iteraciones_max):
+        # Verificación periódica del costo acumulado con deltas
+        if verificar_cada and i and i % verificar_cada == 0:
+            costo_actual = calcular_costo_ruta(ruta_actual, costos)
+
+        # 1. Generar un vecino (el costo sale del delta del movimiento).
+        # El movimiento de proponer_vecino solo se aplica si se acepta.
+        movimiento = None
+        if vecindario is not None:
+            ruta_vecina, delta_costo = vecindario.generar(ruta_actual, rng)
+        else:
+            movimiento = proponer_vecino(ruta_actual, grafo, inicio, meta, costos, rng, en_ruta)
+            ruta_vecina = ruta_actual
+            delta_costo = movimiento[0] if movimiento is not None else 0
+        if costo_actual == float('inf'):
+            costo_vecino = calcular_costo_ruta(
+                ruta_vecina if movimiento is None else ruta_con_movimiento(ruta_actual, movimiento), costos)
+        else:
+            costo_vecino = costo_actual + delta_costo
+
+        aceptado = False
+        valido = ruta_vecina[-1] == meta
+        sin_mejora += 1
+        sin_mejora_tramo += 1
+        
+        # Verificar si la ruta sigue siendo válida (llega al destino).
+        # Un vecino inválido se rechaza, pero la iteración cuenta y se enfría igual.
+        if valido:
+            # 2. Calcular diferencia de energía/costo
+            delta_costo = costo_vecino - costo_actual
+
+            # 3. Decisión de Transición
+
+            # A) Aceptar si es mejor (delta_costo es negativo)
+            if delta_costo < 0:
+                aceptado = True
+
+            # B) Aceptar si es peor con una probabilidad (probabilidad de escape)
+            elif temperatura > 0:
+                # Fórmula de Metropolis: e^(-delta_costo / T)
+                probabilidad = math.exp(-delta_costo / temperatura)
+                aceptado = rng.random() < probabilidad
+
+            if aceptado:
+                if movimiento is not None:
+                    aplicar_en_sitio(ruta_actual, en_ruta, movimiento)
+                else:
+                    ruta_actual = ruta_vecina
+                costo_actual = costo_vecino
+
+                # Actualizar el mejor global (copia: ruta_actual cambia en sitio)
+                if costo_actual < mejor_costo:
+                    mejor_costo = costo_actual
+                    mejor_ruta = list(ruta_actual)
+                    sin_mejora = sin_mejora_tramo = 0
+
+        if vecindario is not None:
+            vecindario.registrar(aceptado)
+
+        if registro is not None:
+            anotar(i, temperatura, costo_actual, mejor_costo,
+                   ACEPTADO if aceptado else RECHAZADO if valido else INVALIDO)
+        
+        # 4. Enfriamiento (Schedule)
+        temperatura = esquema.siguiente(temperatura, aceptado)
+        
+        if mostrar and i % 100 == 0:
+            print(f"Iteración {i:04d} | Temp: {temperatura:.2f} | Costo Actual: {costo_actual:.1f} | Mejor Costo: {mejor_costo:.1f}")
+
+        # Convergencia: demasiadas iteraciones sin mejorar el mejor costo
+        if ventana_convergencia and sin_mejora >= ventana_convergencia:
+            if mostrar:
+                print(f"Convergencia en la iteración {i}: {sin_mejora} iteraciones sin mejora")
+            break
+
+        # Recalentamiento si la cadena se estanca o se enfría del todo
+        estancada = recalentar_tras and sin_mejora_tramo >= recalentar_tras
+        if (estancada or temperatura < T_minima) and recalentar_tras \
+                and recalentamientos < max_recalentamientos:
+            recalentamientos += 1
+            temperatura = fraccion_recalentamiento * T_inicial
+            esquema.iniciar(temperatura)
+            sin_mejora_tramo = 0
+            if mostrar:
+                print(f"Recalentamiento {recalentamientos} en la iteración {i}: Temp {temperatura:.2f}")
+            continue
+        
+        # Detener si la temperatura es demasiado baja
+        if temperatura < T_minima:
+            break
+
+    if registro is not None:
+        registro.cerrar()
+    return mejor_ruta, mejor_costo
@@ -0,0 +1,313 @@
+import os
+import random
+from collections import Counter, deque
+
+from .rutas import (calcular_costo_ruta, delta_movimiento, ruta_aleatoria, ruta_inicial_en_grafo,
+                    ruta_con_movimiento, aplicar_en_sitio)
+
+# =========================================================================
+# 1. RUTA INICIAL Y OPERADOR DE VECINDAD
+# =========================================================================
+
+def generar_ruta_inicial_valida(grafo, inicio, meta, rng=None):
+    """Genera una ruta válida aleatoria (o una ruta inicial simple)"""
+    # Usaremos una ruta inicial que NO es la mejor para ver si HC la mejora;
+    # en otros grafos, una ruta aleatoria sacada de `rng`
+    return ruta_inicial_en_grafo([inicio, 'C', 'F', meta], grafo, inicio, meta,
+                                 rng if rng is not None else random.Random(0))
+
+def proponer_vecino(ruta, grafo, inicio, meta, costos, rng=random, en_ruta=None):
+    """
+    Elige un pequeño cambio de la ruta (igual que en SA) sin copiarla.
+    Devuelve el movimiento (delta, i, nodo, insertar) (ver rutas) o None
+    si la ruta no cambia. `en_ruta` es el Counter de los nodos de la ruta
+    (si falta se cuenta) y `rng` la fuente de azar.
+    """
+    if len(ruta) <= 2:
+        return None
+    if en_ruta is None:
+        en_ruta = Counter(ruta)
+
+    # Seleccionar un índice para el nodo a cambiar (excluyendo inicio y meta)
+    idx_a_cambiar = rng.randint(1, len(ruta) - 2)
+    nodo_anterior = ruta[idx_a_cambiar - 1]
+    nodo_siguiente = ruta[idx_a_cambiar + 1]
+    nodo_actual = ruta[idx_a_cambiar]
+    
+    # Buscar un vecino válido del nodo_anterior para insertar
+    vecinos_anteriores = grafo.get(nodo_anterior, [])
+    candidatos = [n for n in vecinos_anteriores if n != inicio and n != meta and n not in en_ruta]
+    
+    nuevo_nodo = nodo_actual
+    if candidatos:
+        # Reemplazar el nodo actual por un vecino del nodo anterior
+        nuevo_nodo = rng.choice(candidatos)
+    else:
+         # Si no hay candidatos, intentar cambiar la conexión a un nodo intermedio
+        vecinos_actuales = grafo.get(nodo_actual, [])
+        candidatos_reemplazo = [n for n in vecinos_actuales if n != nodo_anterior and n != inicio and n != meta and n not in en_ruta]
+        if candidatos_reemplazo:
+            nuevo_nodo = rng.choice(candidatos_reemplazo)
+
+    if nuevo_nodo == nodo_actual:
+        return None
+
+    # Solo cambian las aristas (anterior, x) y (x, siguiente)
+    delta = delta_movimiento(
+        [(nodo_anterior, nuevo_nodo), (nuevo_nodo, nodo_siguiente)],
+        [(nodo_anterior, nodo_actual), (nodo_actual, nodo_siguiente)], costos)
+    return delta, idx_a_cambiar, nuevo_nodo, False
+
+def generar_vecino(ruta, grafo, inicio, meta, costos, rng=random):
+    """
+    Genera una nueva ruta vecina válida haciendo un pequeño cambio (igual que en SA).
+    Devuelve (ruta_vecina, delta); hill_climbing usa directamente
+    proponer_vecino para no copiar la ruta en cada intento.
+    """
+    movimiento = proponer_vecino(ruta, grafo, inicio, meta, costos, rng)
+    if movimiento is None:
+        return list(ruta), 0
+    return ruta_con_movimiento(ruta, movimiento), movimiento[0]
+
+
+# =========================================================================
+# 2. ALGORITMO DE ESCALADA SIMPLE (SIMPLE HILL CLIMBING)
+# =========================================================================
+
+def hill_climbing(grafo, inicio, meta, costos, max_intentos=1000, verificar_cada=1000, vecindario=None,
+                  max_sin_mejora=None, ruta_inicial=None, mostrar=False, semilla=None, rng=None):
+    """
+    El costo de cada vecino se obtiene sumando el delta del movimiento;
+    cada `verificar_cada` intentos se recalcula el costo completo.
+    `vecindario` (ver vecindarios.Vecindario) sustituye a generar_vecino por
+    operadores que solo proponen rutas válidas.
+    `max_sin_mejora` detiene la búsqueda tras tantos intentos seguidos sin
+    mejora en lugar de agotar siempre max_intentos. `mostrar=True` imprime
+    cada mejora.
+    `semilla` siembra un random.Random propio de la ejecución (también lo
+    usa el vecindario si no tiene rng propio); también se puede pasar `rng`.
+    """
+    if rng is None:
+        rng = random.Random(semilla)
+    
+    # Inicialización
+    if ruta_inicial is None:
+        ruta_inicial = generar_ruta_inicial_valida(grafo, inicio, meta, rng)
+    ruta_actual = list(ruta_inicial)
+    en_ruta = Counter(ruta_actual)
+    costo_actual = calcular_costo_ruta(ruta_actual, costos)
+    sin_mejora = 0
+    
+    # Bucle principal de Hill Climbing
+    for i in range(max_intentos):
+        # Verificación periódica del costo acumulado con deltas
+        if verificar_cada and i and i % verificar_cada == 0:
+            costo_actual = calcular_costo_ruta(ruta_actual, costos)
+
+        # Generar un vecino (el movimiento de proponer_vecino solo se aplica si mejora)
+        movimiento = None
+        if vecindario is not None:
+            ruta_vecina, delta_costo = vecindario.generar(ruta_actual, rng)
+        else:
+            movimiento = proponer_vecino(ruta_actual, grafo, inicio, meta, costos, rng, en_ruta)
+            ruta_vecina = ruta_actual
+            delta_costo = movimiento[0] if movimiento is not None else 0
+        if costo_actual == float('inf'):
+            costo_vecino = calcular_costo_ruta(
+                ruta_vecina if movimiento is None else ruta_con_movimiento(ruta_actual, movimiento), costos)
+        else:
+            costo_vecino = costo_actual + delta_costo
+
+        if vecindario is not None:
+            vecindario.registrar(costo_vecino < costo_actual)
+
+        # Asegurarse de que el vecino sea una ruta válida
+        valido = ruta_vecina[-1] == meta and costo_vecino != float('inf')
+
+        # Regla de Escalada: Aceptar solo si es mejor (menor costo)
+        if valido and costo_vecino < costo_actual:
+            if mostrar:
+                print(f"Mejora encontrada en intento {i+1}: Costo {costo_actual} -> {costo_vecino}")
+            if movimiento is not None:
+                aplicar_en_sitio(ruta_actual, en_ruta, movimiento)
+            else:
+                ruta_actual = ruta_vecina
+            costo_actual = costo_vecino
+            sin_mejora = 0
+            # Si se encuentra una mejora, volvemos a intentar mejorar desde el nuevo punto
+            # En la versión simple, esto podría reiniciarse o continuar el bucle.
+        
+        else:
+            sin_mejora += 1
+            if i == max_intentos - 1 or (max_sin_mejora and sin_mejora >= max_sin_mejora):
+                if mostrar:
+                    print(f"Algoritmo detenido en intento {i+1}. No se encontraron más mejoras.")
+                break
+    
+    return ruta_actual, costo_actual
+
+# =========================================================================
+# 3. MÁXIMA PENDIENTE, REINICIOS ALEATORIOS Y BÚSQUEDA TABÚ
+# =========================================================================
+#
+# Vecindario completo de una ruta válida: quitar, cambiar o insertar un
+# nodo intermedio. Cada movimiento se describe como (delta, tipo, i, v) y
+# solo se copia la ruta del movimiento que se aplica.
+
+QUITAR, CAMBIAR, INSERTAR = "quitar", "cambiar", "insertar"
+
+
+def movimientos_vecinos(ruta, grafo, costos):
+    """Genera todos los movimientos válidos (delta, tipo, i, v) de una ruta válida."""
+    en_ruta = set(ruta)
+    for i in range(1, len(ruta) - 1):
+        anterior, nodo, siguiente = ruta[i - 1], ruta[i], ruta[i + 1]
+        viejo = costos[(anterior, nodo)] + costos[(nodo, siguiente)]
+        if (anterior, siguiente) in costos:
+            yield costos[(anterior, siguiente)] - viejo, QUITAR, i, None
+        for v in grafo.get(anterior, []):
+            if v not in en_ruta and (anterior, v) in costos and (v, siguiente) in costos:
+                yield costos[(anterior, v)] + costos[(v, siguiente)] - viejo, CAMBIAR, i, v
+    for i in range(1, len(ruta)):
+        anterior, nodo = ruta[i - 1], ruta[i]
+        for v in grafo.get(anterior, []):
+            if v not in en_ruta and (anterior, v) in costos and (v, nodo) in costos:
+                yield costos[(anterior, v)] + costos[(v, nodo)] - costos[(anterior, nodo)], INSERTAR, i, v
+
+
+def aplicar_movimiento(ruta, tipo, i, v):
+    if tipo == QUITAR:
+        return ruta[:i] + ruta[i + 1:]
+    if tipo == CAMBIAR:
+        return ruta[:i] + [v] + ruta[i + 1:]
+    return ruta[:i] + [v] + ruta[i:]
+
+
+def nodos_movidos(ruta, tipo, i, v):
+    """Nodos que entran o salen de la ruta con el movimiento."""
+    if tipo == QUITAR:
+        return (ruta[i],)
+    if tipo == CAMBIAR:
+        return (ruta[i], v)
+    return (v,)
+
+
+def _ruta_de_partida(grafo, inicio, meta, costos, ruta_inicial):
+    ruta = list(ruta_inicial) if ruta_inicial is not None else generar_ruta_inicial_valida(grafo, inicio, meta)
+    costo = calcular_costo_ruta(ruta, costos)
+    if costo == float('inf'):
+        raise ValueError(f"La ruta inicial no es válida: {ruta}")
+    return ruta, costo
+
+
+def hill_climbing_maxima_pendiente(grafo, inicio, meta, costos, ruta_inicial=None, max_pasos=10000):
+    """
+    Escalada por máxima pendiente: en cada paso se evalúa el vecindario
+    completo y se aplica el mejor movimiento. Se detiene en cuanto
+    ningún vecino mejora (óptimo local). Devuelve (ruta, costo).
+    """
+    ruta, costo = _ruta_de_partida(grafo, inicio, meta, costos, ruta_inicial)
+    for _ in range(max_pasos):
+        mejor = min(movimientos_vecinos(ruta, grafo, costos), key=lambda m: m[0], default=None)
+        if mejor is None or mejor[0] >= 0:
+            break
+        delta, tipo, i, v = mejor
+        ruta = aplicar_movimiento(ruta, tipo, i, v)
+        costo += delta
+    return ruta, costo
+
+
+def busqueda_tabu(grafo, inicio, meta, costos, ruta_inicial=None, tamano_tabu=5,
+                  max_iteraciones=1000, paciencia=100):
+    """
+    Búsqueda tabú: en cada iteración se aplica el mejor movimiento no tabú
+    aunque empeore, lo que permite salir de óptimos locales. Los nodos que
+    entran o salen de la ruta quedan tabú durante las `tamano_tabu`
+    siguientes entradas (cola de tamaño fijo + conjunto para consultar en
+    O(1)). Un movimiento tabú se permite si mejora el mejor costo
+    (aspiración). Se detiene tras `paciencia` iteraciones sin mejorar.
+    Devuelve (mejor_ruta, mejor_costo).
+    """
+    ruta, costo = _ruta_de_partida(grafo, inicio, meta, costos, ruta_inicial)
+    mejor_ruta, mejor_costo = ruta, costo
+    cola_tabu = deque()
+    tabu = set()
+    sin_mejora = 0
+
+    for _ in range(max_iteraciones):
+        elegido = None
+        for delta, tipo, i, v in movimientos_vecinos(ruta, grafo, costos):
+            if elegido is not None and delta >= elegido[0]:
+                continue
+            es_tabu = any(n in tabu for n in nodos_movidos(ruta, tipo, i, v))
+            if es_tabu and costo + delta >= mejor_costo:
+                continue
+            elegido = (delta, tipo, i, v)
+        if elegido is None:
+            break
+
+        delta, tipo, i, v = elegido
+        for n in nodos_movidos(ruta, tipo, i, v):
+            if n not in tabu:
+                tabu.add(n)
+                cola_tabu.append(n)
+                if len(cola_tabu) > tamano_tabu:
+                    tabu.discard(cola_tabu.popleft())
+        ruta = aplicar_movimiento(ruta, tipo, i, v)
+        costo += delta
+
+        if costo < mejor_costo:
+            mejor_ruta, mejor_costo = ruta, costo
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
+            if sin_mejora >= paciencia:
+                break
+
+    return mejor_ruta, mejor_costo
+
+
+# Reinicios aleatorios en un pool de procesos. El grafo y los costos se
+# envían una sola vez a cada proceso (inicializador del pool).
+
+_problema = None
+
+
+def _init_worker(grafo, inicio, meta, costos):
+    global _problema
+    _problema = (grafo, inicio, meta, costos)
+
+
+def _reinicio(args):
+    semilla, tabu, parametros = args
+    grafo, inicio, meta, costos = _problema
+    ruta = ruta_aleatoria(grafo, inicio, meta, random.Random(semilla))
+    if ruta is None:
+        return None, float('inf')
+    busqueda = busqueda_tabu if tabu else hill_climbing_maxima_pendiente
+    return busqueda(grafo, inicio, meta, costos, ruta_inicial=ruta, **parametros)
+
+
+def reinicios_aleatorios(grafo, inicio, meta, costos, reinicios=None, semilla=0, workers=None,
+                         tabu=False, **parametros):
+    """
+    Lanza `reinicios` escaladas por máxima pendiente (o búsquedas tabú con
+    tabu=True) desde rutas iniciales aleatorias, repartidas en un pool de
+    `workers` procesos, y devuelve la mejor (ruta, costo).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if reinicios is None:
+        reinicios = 4 * workers
+    tareas = [(semilla + k, tabu, parametros) for k in range(reinicios)]
+
+    if workers == 1:
+        _init_worker(grafo, inicio, meta, costos)
+        resultados = [_reinicio(t) for t in tareas]
+    else:
+        from multiprocessing import Pool
+
+        with Pool(workers, initializer=_init_worker, initargs=(grafo, inicio, meta, costos)) as pool:
+            resultados = pool.map(_reinicio, tareas)
+
+    return min(resultados, key=lambda r: r[1])
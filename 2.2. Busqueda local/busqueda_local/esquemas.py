@@ -0,0 +1,123 @@
+import math
+from abc import ABC, abstractmethod
+
+# =========================================================================
+# ESQUEMAS DE ENFRIAMIENTO PARA SIMULATED ANNEALING
+# =========================================================================
+#
+# Un esquema decide la temperatura de la siguiente iteración. Todos
+# comparten la misma interfaz:
+#
+#   esquema.iniciar(T_inicial)          al empezar (y al recalentar)
+#   T = esquema.siguiente(T, aceptado)  tras cada iteración
+#
+# `aceptado` indica si el vecino de esa iteración se aceptó; solo lo usa
+# el esquema adaptativo.
+
+
+class EsquemaEnfriamiento(ABC):
+    """Base de los esquemas: guarda T_inicial y el número de iteraciones k."""
+
+    def iniciar(self, T_inicial):
+        self.T_inicial = T_inicial
+        self.k = 0
+
+    def siguiente(self, T, aceptado):
+        self.k += 1
+        return self.enfriar(T, aceptado)
+
+    @abstractmethod
+    def enfriar(self, T, aceptado):
+        """Temperatura de la iteración self.k a partir de la anterior."""
+
+
+class Geometrico(EsquemaEnfriamiento):
+    """T_{k+1} = factor * T_k (el esquema original)."""
+
+    def __init__(self, factor=0.99):
+        self.factor = factor
+
+    def enfriar(self, T, aceptado):
+        return T * self.factor
+
+
+class Lineal(EsquemaEnfriamiento):
+    """T_k = T_inicial - (T_inicial - T_final) * k / iteraciones: llega a T_final en `iteraciones` pasos."""
+
+    def __init__(self, iteraciones=1000, T_final=0.0):
+        self.iteraciones = iteraciones
+        self.T_final = T_final
+
+    def enfriar(self, T, aceptado):
+        if self.k >= self.iteraciones:
+            return self.T_final
+        return self.T_inicial - (self.T_inicial - self.T_final) * self.k / self.iteraciones
+
+
+class Logaritmico(EsquemaEnfriamiento):
+    """T_k = T_inicial * log(2) / log(k + 2). Muy lento, con garantía teórica de convergencia."""
+
+    def enfriar(self, T, aceptado):
+        return self.T_inicial * math.log(2) / math.log(self.k + 2)
+
+
+class LundyMees(EsquemaEnfriamiento):
+    """T_{k+1} = T_k / (1 + beta * T_k): enfría rápido en caliente y despacio en frío."""
+
+    def __init__(self, beta=0.001):
+        self.beta = beta
+
+    def enfriar(self, T, aceptado):
+        return T / (1 + self.beta * T)
+
+
+class Adaptativo(EsquemaEnfriamiento):
+    """
+    Ajusta T para seguir una tasa de aceptación objetivo. Cada `ventana`
+    iteraciones compara la tasa observada con el objetivo (si se acepta
+    de más, enfría; si se acepta de menos, calienta) y el objetivo baja
+    multiplicándose por `decaimiento`, de modo que la cadena acaba fría.
+    """
+
+    def __init__(self, objetivo=0.5, ventana=100, ganancia=2.0, decaimiento=0.95):
+        self.objetivo_inicial = objetivo
+        self.ventana = ventana
+        self.ganancia = ganancia
+        self.decaimiento = decaimiento
+
+    def iniciar(self, T_inicial):
+        super().iniciar(T_inicial)
+        self.objetivo = self.objetivo_inicial
+        self.aceptados = 0
+
+    def enfriar(self, T, aceptado):
+        self.aceptados += aceptado
+        if self.k % self.ventana:
+            return T
+        tasa = self.aceptados / self.ventana
+        self.aceptados = 0
+        T *= math.exp(self.ganancia * (self.objetivo - tasa))
+        self.objetivo *= self.decaimiento
+        return T
+
+
+ESQUEMAS = {
+    "geometrico": Geometrico,
+    "lineal": Lineal,
+    "logaritmico": Logaritmico,
+    "lundy_mees": LundyMees,
+    "adaptativo": Adaptativo,
+}
+
+
+def crear_esquema(nombre, iteraciones, T_final=0.0, factor=0.99):
+    """
+    Esquema de ESQUEMAS por nombre, ajustado a la ejecución: el geométrico
+    usa `factor` y el lineal llega a T_final justo en `iteraciones` pasos
+    (con los valores por defecto se pararía a las 1000 iteraciones).
+    """
+    if nombre == "geometrico":
+        return Geometrico(factor)
+    if nombre == "lineal":
+        return Lineal(iteraciones, T_final)
+    return ESQUEMAS[nombre]()
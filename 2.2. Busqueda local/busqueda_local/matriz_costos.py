@@ -0,0 +1,259 @@
+import numpy as np
+
+# =========================================================================
+# MATRIZ DENSA DE COSTOS Y EVALUACIÓN DE VECINOS POR LOTES
+# =========================================================================
+#
+# La tabla COSTOS {(origen, destino): costo} se compila una sola vez en una
+# matriz N x N indexada por id de nodo (inf = no hay arista). Una ruta pasa
+# a ser un array de ids y el costo de cualquier movimiento sale de unas
+# pocas lecturas de la matriz, así que se pueden puntuar cientos de vecinos
+# a la vez con indexado de arrays en lugar de bucles de Python.
+#
+# Movimientos (los mismos que usa generar_vecino):
+#   REEMPLAZO   (i, v): la posición i pasa a ser el nodo v
+#   INSERCION   (i, v): se inserta v antes de la posición i
+#   ELIMINACION (i, -): se quita el nodo de la posición i
+# Inicio y meta (primera y última posición) nunca cambian y una ruta
+# no repite nodos.
+
+REEMPLAZO, INSERCION, ELIMINACION = 0, 1, 2
+
+
+class MatrizCostos:
+    """Tabla de costos compilada en una matriz densa de NumPy."""
+
+    def __init__(self, grafo, costos):
+        nodos = list(grafo)
+        vistos = set(nodos)
+        for vecinos in grafo.values():
+            for n in vecinos:
+                if n not in vistos:
+                    vistos.add(n)
+                    nodos.append(n)
+        for par in costos:
+            for n in par:
+                if n not in vistos:
+                    vistos.add(n)
+                    nodos.append(n)
+
+        self.nodos = nodos
+        self.indice = {n: i for i, n in enumerate(nodos)}
+        self.matriz = np.full((len(nodos), len(nodos)), np.inf)
+        for (origen, destino), costo in costos.items():
+            self.matriz[self.indice[origen], self.indice[destino]] = costo
+
+        # Sucesores de cada nodo en formato CSR, para muestrear candidatos
+        # entre los vecinos del nodo anterior (como generar_vecino)
+        origenes, destinos = np.nonzero(np.isfinite(self.matriz))
+        self.desplazamientos = np.zeros(len(nodos) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(origenes, minlength=len(nodos)), out=self.desplazamientos[1:])
+        self.sucesores = destinos.astype(np.intp)
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def codificar(self, ruta):
+        return np.fromiter((self.indice[n] for n in ruta), dtype=np.intp, count=len(ruta))
+
+    def decodificar(self, ids):
+        return [self.nodos[i] for i in ids]
+
+    def costo_ruta(self, ids):
+        """Equivalente vectorizado de calcular_costo_ruta."""
+        return float(self.matriz[ids[:-1], ids[1:]].sum())
+
+
+# =========================================================================
+# EVALUACIÓN POR LOTES
+# =========================================================================
+
+def evaluar_candidatos(matriz, ids, tipos, posiciones, nodos):
+    """
+    Delta de costo de K movimientos a la vez (arrays de longitud K).
+    Los movimientos que repetirían un nodo de la ruta dan inf.
+    La ruta `ids` debe ser válida (costo finito).
+    """
+    M = matriz.matriz
+    ultimo = len(ids) - 1
+    anterior = ids[posiciones - 1]
+    actual = ids[posiciones]
+    siguiente = ids[np.minimum(posiciones + 1, ultimo)]
+
+    tramo_actual = M[anterior, actual]
+    with np.errstate(invalid='ignore'):  # inf - inf en tramos que no existen
+        reemplazo = M[anterior, nodos] + M[nodos, siguiente] - tramo_actual - M[actual, siguiente]
+        insercion = M[anterior, nodos] + M[nodos, actual] - tramo_actual
+        eliminacion = M[anterior, siguiente] - tramo_actual - M[actual, siguiente]
+
+    deltas = np.where(tipos == REEMPLAZO, reemplazo,
+                      np.where(tipos == INSERCION, insercion, eliminacion))
+
+    en_ruta = np.zeros(len(M), dtype=bool)
+    en_ruta[ids] = True
+    deltas[(tipos != ELIMINACION) & en_ruta[nodos]] = np.inf
+    deltas[np.isnan(deltas)] = np.inf
+    return deltas
+
+
+def muestrear_candidatos(matriz, ids, k, rng):
+    """
+    K movimientos al azar: (tipos, posiciones, nodos). El nodo nuevo se
+    elige entre los sucesores del nodo anterior a la posición.
+    """
+    intermedios = len(ids) - 2
+    if intermedios > 0:
+        tipos = rng.integers(0, 3, size=k)
+    else:
+        tipos = np.full(k, INSERCION)
+    # Reemplazo/eliminación: posiciones 1..L-2; inserción: 1..L-1
+    limite = np.where(tipos == INSERCION, len(ids) - 1, max(intermedios, 1))
+    posiciones = 1 + (rng.random(k) * limite).astype(np.intp)
+
+    anterior = ids[posiciones - 1]
+    inicio = matriz.desplazamientos[anterior]
+    grado = matriz.desplazamientos[anterior + 1] - inicio
+    elegido = inicio + (rng.random(k) * grado).astype(np.intp)
+    # Sin sucesores: cualquier nodo (el movimiento saldrá con costo inf)
+    nodos = rng.integers(0, len(matriz), size=k)
+    con_sucesores = grado > 0
+    nodos[con_sucesores] = matriz.sucesores[elegido[con_sucesores]]
+    return tipos, posiciones, nodos
+
+
+def evaluar_vecindario(matriz, ids):
+    """
+    Vecindario completo en forma de arrays:
+    (deltas de reemplazo (L-2, N), de inserción (L-1, N), de eliminación (L-2,)).
+    """
+    M = matriz.matriz
+    anterior, actual, siguiente = ids[:-2], ids[1:-1], ids[2:]
+
+    en_ruta = np.zeros(len(M), dtype=bool)
+    en_ruta[ids] = True
+
+    viejo = M[anterior, actual] + M[actual, siguiente]
+    with np.errstate(invalid='ignore'):
+        reemplazo = M[anterior, :] + M[:, siguiente].T - viejo[:, None]
+        insercion = M[ids[:-1], :] + M[:, ids[1:]].T - M[ids[:-1], ids[1:]][:, None]
+        eliminacion = M[anterior, siguiente] - viejo
+    reemplazo[:, en_ruta] = np.inf
+    insercion[:, en_ruta] = np.inf
+
+    for deltas in (reemplazo, insercion, eliminacion):
+        deltas[np.isnan(deltas)] = np.inf
+    return reemplazo, insercion, eliminacion
+
+
+def aplicar_movimiento(ids, tipo, posicion, nodo):
+    if tipo == REEMPLAZO:
+        nuevos = ids.copy()
+        nuevos[posicion] = nodo
+        return nuevos
+    if tipo == INSERCION:
+        return np.insert(ids, posicion, nodo)
+    return np.delete(ids, posicion)
+
+
+# =========================================================================
+# ESTRATEGIAS
+# =========================================================================
+
+def descenso_maximo(matriz, ruta, max_pasos=10000):
+    """
+    Descenso de máxima pendiente: en cada paso se evalúa el vecindario
+    completo y se aplica el mejor movimiento. Se detiene en un óptimo
+    local (ningún movimiento mejora). Devuelve (ruta, costo).
+    """
+    ids = matriz.codificar(ruta)
+    costo = matriz.costo_ruta(ids)
+
+    for _ in range(max_pasos):
+        reemplazo, insercion, eliminacion = evaluar_vecindario(matriz, ids)
+        mejor = (0, None)
+        for tipo, deltas in ((REEMPLAZO, reemplazo), (INSERCION, insercion), (ELIMINACION, eliminacion)):
+            if deltas.size == 0:
+                continue
+            plano = int(np.argmin(deltas))
+            if deltas.flat[plano] < mejor[0]:
+                mejor = (deltas.flat[plano], (tipo, plano))
+        if mejor[1] is None:
+            break
+
+        tipo, plano = mejor[1]
+        if tipo == ELIMINACION:
+            posicion, nodo = plano + 1, None
+        else:
+            fila, nodo = divmod(plano, len(matriz))
+            posicion = fila + 1
+        ids = aplicar_movimiento(ids, tipo, posicion, nodo)
+        costo += float(mejor[0])
+
+    return matriz.decodificar(ids), costo
+
+
+def mejor_de_k(matriz, ruta, k=256, max_pasos=10000, paciencia=50, semilla=None):
+    """
+    Muestreo best-of-K: en cada paso se generan y puntúan K vecinos al azar
+    de una sola vez y se aplica el mejor si mejora. Se detiene tras
+    `paciencia` pasos seguidos sin mejora. Devuelve (ruta, costo).
+    """
+    rng = np.random.default_rng(semilla)
+    ids = matriz.codificar(ruta)
+    costo = matriz.costo_ruta(ids)
+    sin_mejora = 0
+
+    for _ in range(max_pasos):
+        tipos, posiciones, nodos = muestrear_candidatos(matriz, ids, k, rng)
+        deltas = evaluar_candidatos(matriz, ids, tipos, posiciones, nodos)
+        mejor = int(np.argmin(deltas))
+        if deltas[mejor] < 0:
+            ids = aplicar_movimiento(ids, tipos[mejor], posiciones[mejor], nodos[mejor])
+            costo += float(deltas[mejor])
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
+            if sin_mejora >= paciencia:
+                break
+
+    return matriz.decodificar(ids), costo
+
+
+# =========================================================================
+# EJECUCIÓN
+# =========================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Instancia grande de prueba: rejilla de 60 x 60 con diagonales y costos aleatorios
+    lado = 60
+    rnd = random.Random(0)
+    grafo, costos = {}, {}
+    for f in range(lado):
+        for c in range(lado):
+            nodo = (f, c)
+            grafo[nodo] = []
+            for df, dc in ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)):
+                vecino = (f + df, c + dc)
+                if 0 <= vecino[0] < lado and 0 <= vecino[1] < lado:
+                    grafo[nodo].append(vecino)
+                    if (vecino, nodo) in costos:
+                        costos[(nodo, vecino)] = costos[(vecino, nodo)]
+                    else:
+                        costos[(nodo, vecino)] = rnd.randint(1, 20)
+
+    # Ruta inicial: bajar por la primera columna y cruzar por la última fila
+    ruta_inicial = [(f, 0) for f in range(lado)] + [(lado - 1, c) for c in range(1, lado)]
+
+    t0 = time.perf_counter()
+    matriz = MatrizCostos(grafo, costos)
+    print(f"Matriz {len(matriz)} x {len(matriz)} compilada en {time.perf_counter() - t0:.2f} s")
+    print(f"Costo inicial: {matriz.costo_ruta(matriz.codificar(ruta_inicial)):.0f}")
+
+    for nombre, estrategia in (("Descenso máximo", descenso_maximo),
+                               ("Mejor de K=256", lambda m, r: mejor_de_k(m, r, semilla=0))):
+        t0 = time.perf_counter()
+        ruta, costo = estrategia(matriz, ruta_inicial)
+        print(f"{nombre}: costo {costo:.0f} ({len(ruta)} nodos) en {time.perf_counter() - t0:.2f} s")
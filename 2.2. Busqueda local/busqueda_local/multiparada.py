@@ -0,0 +1,385 @@
+import heapq
+import math
+import random
+
+from .esquemas import Geometrico
+
+# =========================================================================
+# OPTIMIZACIÓN DE RUTAS CON VARIAS PARADAS (TSP / VRP)
+# =========================================================================
+#
+# Generaliza simulated_annealing y hill_climbing de un único camino
+# INICIO -> META a visitar muchas paradas con uno o varios vehículos que
+# salen y vuelven al depósito, con capacidad limitada.
+#
+# - Distancias: matriz completa entre depósito (índice 0) y paradas
+#   (1..n-1), precalculada una vez (matriz_distancias hace Dijkstra desde
+#   cada parada sobre un grafo como GRAFO_SEVILLA / COSTOS).
+# - Movimientos, todos con delta O(1) a partir de la matriz:
+#     2-opt:     invierte un tramo de una ruta (O(1) con matriz simétrica;
+#                con una asimétrica se suma el tramo invertido, O(tramo))
+#     Or-opt:    mueve un tramo de 1 a 3 paradas a otra posición de su ruta
+#     relocate:  mueve un tramo de 1 a 3 paradas a otra ruta (si cabe)
+# - Listas de vecinos cercanos: solo se prueban movimientos que dejan una
+#   parada junto a una de sus k paradas más próximas, lo que permite
+#   instancias con miles de paradas.
+
+
+def matriz_distancias(grafo, costos, paradas):
+    """Matriz de costos mínimos entre `paradas` (Dijkstra desde cada una; inf si no hay camino)."""
+    indice = {p: i for i, p in enumerate(paradas)}
+    matriz = [[math.inf] * len(paradas) for _ in paradas]
+    for i, origen in enumerate(paradas):
+        distancias = {origen: 0}
+        frontera = [(0, 0, origen)]
+        contador = 1
+        pendientes = len(paradas)
+        while frontera and pendientes:
+            d, _, nodo = heapq.heappop(frontera)
+            if d > distancias[nodo]:
+                continue
+            if nodo in indice:
+                matriz[i][indice[nodo]] = d
+                pendientes -= 1
+            for vecino in grafo.get(nodo, []):
+                costo = costos.get((nodo, vecino))
+                if costo is None:
+                    continue
+                if d + costo < distancias.get(vecino, math.inf):
+                    distancias[vecino] = d + costo
+                    heapq.heappush(frontera, (d + costo, contador, vecino))
+                    contador += 1
+    return matriz
+
+
+class ProblemaRutas:
+    """
+    Instancia: `distancias` (n x n, índice 0 = depósito), `demandas` por
+    parada (la del depósito se ignora), `capacidad` de cada vehículo
+    (None = sin límite) y número de `vehiculos`.
+    """
+
+    def __init__(self, distancias, demandas=None, capacidad=None, vehiculos=1, vecinos_cercanos=10):
+        self.d = distancias
+        self.n = len(distancias)
+        self.demandas = list(demandas) if demandas is not None else [0] * self.n
+        self.demandas[0] = 0
+        self.capacidad = capacidad if capacidad is not None else math.inf
+        self.vehiculos = vehiculos
+        # Grafos dirigidos dan matrices asimétricas: invertir un tramo cambia su costo
+        self.simetrica = all(distancias[i][j] == distancias[j][i] for i in range(self.n) for j in range(i))
+
+        # k paradas más cercanas de cada parada (sin el depósito)
+        k = min(vecinos_cercanos, self.n - 2)
+        self.vecinos = [[] for _ in range(self.n)]
+        for i in range(1, self.n):
+            fila = distancias[i]
+            self.vecinos[i] = heapq.nsmallest(k, (j for j in range(1, self.n) if j != i), key=fila.__getitem__)
+
+
+class Solucion:
+    """Rutas (listas de paradas, sin el depósito) con posición y carga de cada parada/ruta."""
+
+    def __init__(self, problema, rutas):
+        self.p = problema
+        self.rutas = [list(r) for r in rutas]
+        self.ruta_de = [None] * problema.n
+        self.pos = [None] * problema.n
+        self.carga = [sum(problema.demandas[x] for x in r) for r in self.rutas]
+        for k in range(len(self.rutas)):
+            self._indexar(k)
+        self.costo = sum(self.costo_ruta(r) for r in self.rutas)
+
+    def _indexar(self, k, desde=0):
+        ruta, pos, ruta_de = self.rutas[k], self.pos, self.ruta_de
+        for i in range(desde, len(ruta)):
+            pos[ruta[i]] = i
+            ruta_de[ruta[i]] = k
+
+    def costo_ruta(self, ruta):
+        d = self.p.d
+        if not ruta:
+            return 0
+        return d[0][ruta[0]] + sum(d[a][b] for a, b in zip(ruta, ruta[1:])) + d[ruta[-1]][0]
+
+    def anterior(self, x):
+        i = self.pos[x]
+        return self.rutas[self.ruta_de[x]][i - 1] if i > 0 else 0
+
+    def siguiente(self, x):
+        ruta = self.rutas[self.ruta_de[x]]
+        i = self.pos[x]
+        return ruta[i + 1] if i + 1 < len(ruta) else 0
+
+    def copiar_rutas(self):
+        return [list(r) for r in self.rutas]
+
+    # ---------------------------------------------------------------------
+    # Movimientos: delta_* devuelve el delta O(1) (o None si no aplica) y
+    # aplicar_* modifica la solución.
+
+    def delta_2opt(self, x, y):
+        """Deja y justo después de x invirtiendo el tramo entre ambos (misma ruta)."""
+        if self.ruta_de[x] != self.ruta_de[y]:
+            return None
+        if self.pos[x] > self.pos[y]:
+            x, y = y, x
+        if self.pos[y] == self.pos[x] + 1:
+            return None
+        d = self.p.d
+        b, e = self.siguiente(x), self.siguiente(y)
+        delta = d[x][y] + d[b][e] - d[x][b] - d[y][e]
+        if not self.p.simetrica:
+            tramo = self.rutas[self.ruta_de[x]][self.pos[b]:self.pos[y] + 1]
+            delta += sum(d[v][u] - d[u][v] for u, v in zip(tramo, tramo[1:]))
+        return delta
+
+    def aplicar_2opt(self, x, y):
+        if self.pos[x] > self.pos[y]:
+            x, y = y, x
+        k = self.ruta_de[x]
+        i, j = self.pos[x] + 1, self.pos[y]
+        ruta = self.rutas[k]
+        ruta[i:j + 1] = ruta[i:j + 1][::-1]
+        self._indexar(k, i)
+
+    def _tramo(self, x, longitud):
+        ruta = self.rutas[self.ruta_de[x]]
+        i = self.pos[x]
+        return ruta[i:i + longitud]
+
+    def delta_mover(self, x, longitud, y, despues):
+        """
+        Mueve el tramo de `longitud` paradas que empieza en x para dejarlo
+        después (o antes) de y. Si y está en otra ruta es un relocate y
+        debe caber en el vehículo.
+        """
+        tramo = self._tramo(x, longitud)
+        if len(tramo) < longitud or y in tramo:
+            return None
+        s0, sl = tramo[0], tramo[-1]
+        if despues:
+            a, b = y, self.siguiente(y)
+        else:
+            a, b = self.anterior(y), y
+        if a == sl or b == s0:
+            return None  # el tramo ya está ahí
+        if self.ruta_de[y] != self.ruta_de[x]:
+            demanda = sum(self.p.demandas[s] for s in tramo)
+            if self.carga[self.ruta_de[y]] + demanda > self.p.capacidad:
+                return None
+        d = self.p.d
+        p, q = self.anterior(s0), self.siguiente(sl)
+        return (d[p][q] - d[p][s0] - d[sl][q]) + (d[a][s0] + d[sl][b] - d[a][b])
+
+    def aplicar_mover(self, x, longitud, y, despues):
+        kx, ky = self.ruta_de[x], self.ruta_de[y]
+        origen = self.rutas[kx]
+        i = self.pos[x]
+        tramo = origen[i:i + longitud]
+        del origen[i:i + longitud]
+        destino = self.rutas[ky]
+        j = destino.index(y) if kx == ky else self.pos[y]
+        j = j + 1 if despues else j
+        destino[j:j] = tramo
+        if kx != ky:
+            demanda = sum(self.p.demandas[s] for s in tramo)
+            self.carga[kx] -= demanda
+            self.carga[ky] += demanda
+            self._indexar(kx, i)
+            self._indexar(ky, j)
+        else:
+            self._indexar(kx, min(i, j))
+
+    def proponer(self, x, y, rng):
+        """Movimiento al azar que acerca x a y: (delta, aplicar) o None."""
+        if rng.random() < 0.5:
+            delta = self.delta_2opt(x, y)
+            if delta is not None:
+                return delta, lambda: self.aplicar_2opt(x, y)
+        longitud = rng.randint(1, 3)
+        despues = rng.random() < 0.5
+        delta = self.delta_mover(x, longitud, y, despues)
+        if delta is None:
+            return None
+        return delta, lambda: self.aplicar_mover(x, longitud, y, despues)
+
+
+# =========================================================================
+# SOLUCIÓN INICIAL
+# =========================================================================
+
+def vecino_mas_cercano(problema):
+    """Cada vehículo sale del depósito y va a la parada libre más cercana que cabe."""
+    d, demandas = problema.d, problema.demandas
+    libres = set(range(1, problema.n))
+    rutas = []
+    for _ in range(problema.vehiculos):
+        ruta, carga, actual = [], 0, 0
+        while libres:
+            fila = d[actual]
+            candidatos = [j for j in libres if carga + demandas[j] <= problema.capacidad]
+            if not candidatos:
+                break
+            actual = min(candidatos, key=fila.__getitem__)
+            libres.remove(actual)
+            ruta.append(actual)
+            carga += demandas[actual]
+        rutas.append(ruta)
+    if libres:
+        raise ValueError(f"{len(libres)} paradas no caben en {problema.vehiculos} vehículos")
+    return Solucion(problema, rutas)
+
+
+# =========================================================================
+# BÚSQUEDA LOCAL
+# =========================================================================
+
+def escalada(problema, solucion=None, max_pasadas=1000):
+    """
+    Hill climbing con primera mejora: recorre cada parada y sus vecinos
+    cercanos probando 2-opt, Or-opt y relocate; aplica el primer
+    movimiento que mejora. Termina cuando una pasada completa no mejora
+    (óptimo local). Devuelve la Solucion.
+    """
+    if solucion is None:
+        solucion = vecino_mas_cercano(problema)
+    for _ in range(max_pasadas):
+        mejora = False
+        for x in range(1, problema.n):
+            for y in problema.vecinos[x]:
+                delta = solucion.delta_2opt(x, y)
+                if delta is not None and delta < -1e-9:
+                    solucion.aplicar_2opt(x, y)
+                    solucion.costo += delta
+                    mejora = True
+                    continue
+                for longitud in (1, 2, 3):
+                    for despues in (True, False):
+                        delta = solucion.delta_mover(x, longitud, y, despues)
+                        if delta is not None and delta < -1e-9:
+                            solucion.aplicar_mover(x, longitud, y, despues)
+                            solucion.costo += delta
+                            mejora = True
+                            break
+                    else:
+                        continue
+                    break
+        if not mejora:
+            break
+    return solucion
+
+
+def enfriamiento(problema, solucion=None, iteraciones=1000000, T_inicial=None, esquema=None,
+                 semilla=None, ventana_convergencia=None):
+    """
+    Simulated annealing sobre los movimientos 2-opt / Or-opt / relocate.
+    Cada iteración elige una parada x y una de sus vecinas cercanas y, con
+    el delta O(1), aplica el criterio de Metropolis. Por defecto el esquema
+    es geométrico y lleva la temperatura de T_inicial a T_inicial / 1000 en
+    `iteraciones`. Termina con una escalada y devuelve la mejor Solucion.
+    """
+    rng = random.Random(semilla)
+    if solucion is None:
+        solucion = vecino_mas_cercano(problema)
+    if problema.n < 3:
+        return solucion
+    if T_inicial is None:
+        # Del orden de un tramo medio de la solución inicial
+        T_inicial = solucion.costo / max(1, problema.n - 1)
+    if esquema is None:
+        esquema = Geometrico(0.001 ** (1 / iteraciones))
+    esquema.iniciar(T_inicial)
+
+    temperatura = T_inicial
+    mejor_costo = solucion.costo
+    mejor_rutas = solucion.copiar_rutas()
+    en_mejor = True  # la solución actual es la mejor y aún no se ha copiado
+    sin_mejora = 0
+
+    for _ in range(iteraciones):
+        x = rng.randrange(1, problema.n)
+        y = rng.choice(problema.vecinos[x])
+        propuesta = solucion.proponer(x, y, rng)
+        aceptado = False
+        if propuesta is not None:
+            delta, aplicar = propuesta
+            if delta < 0 or (temperatura > 0 and rng.random() < math.exp(-delta / temperatura)):
+                # Solo se copia la mejor solución justo antes de abandonarla
+                if en_mejor and delta > 0:
+                    mejor_rutas = solucion.copiar_rutas()
+                    en_mejor = False
+                aplicar()
+                solucion.costo += delta
+                aceptado = True
+                if solucion.costo < mejor_costo - 1e-9:
+                    mejor_costo = solucion.costo
+                    en_mejor = True
+                    sin_mejora = -1
+        sin_mejora += 1
+        temperatura = esquema.siguiente(temperatura, aceptado)
+        if ventana_convergencia and sin_mejora >= ventana_convergencia:
+            break
+
+    if not en_mejor:
+        solucion = Solucion(problema, mejor_rutas)
+    return escalada(problema, solucion)
+
+
+def optimizar_rutas(distancias, demandas=None, capacidad=None, vehiculos=1, metodo="enfriamiento",
+                    nombres=None, **parametros):
+    """
+    Punto de entrada: devuelve (rutas, costo) con cada ruta como lista de
+    paradas que empieza y acaba en el depósito (nombres[0] si se dan).
+    `metodo` es "enfriamiento" o "escalada". La escalada es determinista:
+    acepta `semilla` (como el enfriamiento) pero no la usa.
+    """
+    problema = ProblemaRutas(distancias, demandas, capacidad, vehiculos)
+    if metodo == "escalada":
+        parametros.pop("semilla", None)
+        solucion = escalada(problema, **parametros)
+    elif metodo == "enfriamiento":
+        solucion = enfriamiento(problema, **parametros)
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r}")
+
+    nombre = nombres.__getitem__ if nombres is not None else (lambda i: i)
+    rutas = [[nombre(0)] + [nombre(x) for x in r] + [nombre(0)] for r in solucion.rutas if r]
+    costo = sum(solucion.costo_ruta(r) for r in solucion.rutas)
+    return rutas, costo
+
+
+# =========================================================================
+# EJECUCIÓN
+# =========================================================================
+
+if __name__ == "__main__":
+    import time
+
+    # Paradas sobre el grafo de ejemplo (distancias por Dijkstra)
+    from .datos import GRAFO_SEVILLA, COSTOS
+    paradas = ['IES', 'A', 'C', 'E', 'ESTADIO']
+    rutas, costo = optimizar_rutas(matriz_distancias(GRAFO_SEVILLA, COSTOS, paradas),
+                                   nombres=paradas, semilla=0)
+    print("### RUTA CON VARIAS PARADAS (GRAFO DE EJEMPLO) ###")
+    print(f"{' -> '.join(rutas[0])} | Costo: {costo}")
+
+    # Instancia grande: 2000 paradas en el plano, 20 vehículos con capacidad
+    rnd = random.Random(0)
+    n = 2000
+    puntos = [(rnd.uniform(0, 1000), rnd.uniform(0, 1000)) for _ in range(n + 1)]
+    distancias = [[math.dist(a, b) for b in puntos] for a in puntos]
+    demandas = [0] + [rnd.randint(1, 10) for _ in range(n)]
+    capacidad = math.ceil(sum(demandas) / 20 * 1.1)
+
+    print(f"\n### {n} PARADAS, 20 VEHÍCULOS (capacidad {capacidad}) ###")
+    t0 = time.perf_counter()
+    problema = ProblemaRutas(distancias, demandas, capacidad, vehiculos=20)
+    inicial = vecino_mas_cercano(problema)
+    print(f"Vecino más cercano: {inicial.costo:.0f} ({time.perf_counter() - t0:.2f} s)")
+    t0 = time.perf_counter()
+    solucion = escalada(problema, Solucion(problema, inicial.rutas))
+    print(f"Escalada: {solucion.costo:.0f} ({time.perf_counter() - t0:.2f} s)")
+    t0 = time.perf_counter()
+    solucion = enfriamiento(problema, Solucion(problema, inicial.rutas), semilla=0)
+    print(f"Enfriamiento simulado: {solucion.costo:.0f} ({time.perf_counter() - t0:.2f} s)")
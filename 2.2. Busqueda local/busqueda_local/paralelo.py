@@ -0,0 +1,193 @@
+import math
+import os
+import random
+from collections import Counter
+from multiprocessing import Pool
+
+from .enfriamiento import simulated_annealing, proponer_vecino
+from .rutas import calcular_costo_ruta, ruta_aleatoria, ruta_con_movimiento, aplicar_en_sitio
+
+# =========================================================================
+# ENFRIAMIENTO SIMULADO EN PARALELO
+# =========================================================================
+#
+# Dos formas de aprovechar varios núcleos:
+#
+# - Multi-arranque: N cadenas independientes de simulated_annealing, cada
+#   una con su semilla y su ruta inicial aleatoria, repartidas en un pool
+#   de procesos. Se devuelve la mejor de todas.
+# - Templado paralelo (parallel tempering): R réplicas a temperaturas fijas
+#   de una escalera T_1 < ... < T_R. Cada ronda todas avanzan en paralelo
+#   unos pasos de Metropolis y después las réplicas vecinas intercambian
+#   sus rutas con probabilidad min(1, exp((1/T_i - 1/T_j) * (E_i - E_j))).
+#   Las frías afinan y las calientes exploran y les pasan buenas rutas.
+#
+# El grafo y los costos se envían una sola vez a cada proceso
+# (inicializador del pool); por cada tarea solo viajan rutas y semillas.
+
+_grafo = None
+_costos = None
+_inicio = None
+_meta = None
+
+
+def _init_worker(grafo, inicio, meta, costos):
+    global _grafo, _inicio, _meta, _costos
+    _grafo, _inicio, _meta, _costos = grafo, inicio, meta, costos
+
+
+def _pool(workers, grafo, inicio, meta, costos):
+    return Pool(workers, initializer=_init_worker, initargs=(grafo, inicio, meta, costos))
+
+
+# =========================================================================
+# 1. MULTI-ARRANQUE
+# =========================================================================
+
+def _cadena(args):
+    semilla, parametros = args
+    ruta_inicial = ruta_aleatoria(_grafo, _inicio, _meta, random.Random(semilla))
+    if ruta_inicial is None:
+        return None, float('inf')
+    return simulated_annealing(_grafo, _inicio, _meta, _costos, ruta_inicial=ruta_inicial, semilla=semilla,
+                               **parametros)
+
+
+def multi_arranque(grafo, inicio, meta, costos, cadenas=None, semilla=0, workers=None, **parametros):
+    """
+    Ejecuta `cadenas` cadenas de simulated_annealing (semillas semilla,
+    semilla+1, ...) en un pool de `workers` procesos y devuelve la mejor
+    (ruta, costo), o (None, inf) si no hay ninguna ruta de inicio a meta.
+    `parametros` se pasan a simulated_annealing (T_inicial,
+    factor_enfriamiento, iteraciones_max...).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if cadenas is None:
+        cadenas = workers
+    tareas = [(semilla + i, parametros) for i in range(cadenas)]
+
+    if workers == 1:
+        _init_worker(grafo, inicio, meta, costos)
+        resultados = [_cadena(t) for t in tareas]
+    else:
+        with _pool(workers, grafo, inicio, meta, costos) as pool:
+            resultados = pool.map(_cadena, tareas)
+
+    return min(resultados, key=lambda r: r[1])
+
+
+# =========================================================================
+# 2. TEMPLADO PARALELO
+# =========================================================================
+
+def _metropolis(args):
+    """Pasos de Metropolis a temperatura fija. Devuelve (ruta, costo, mejor_ruta, mejor_costo)."""
+    ruta, costo, temperatura, pasos, semilla = args
+    rng = random.Random(semilla)
+    ruta = list(ruta)
+    en_ruta = Counter(ruta)
+    mejor_ruta, mejor_costo = list(ruta), costo
+
+    for _ in range(pasos):
+        movimiento = proponer_vecino(ruta, _grafo, _inicio, _meta, _costos, rng, en_ruta)
+        if movimiento is None:
+            costo_vecino = costo if costo != float('inf') else calcular_costo_ruta(ruta, _costos)
+        elif costo == float('inf'):
+            costo_vecino = calcular_costo_ruta(ruta_con_movimiento(ruta, movimiento), _costos)
+        else:
+            costo_vecino = costo + movimiento[0]
+        delta = costo_vecino - costo
+
+        if delta < 0 or rng.random() < math.exp(-delta / temperatura):
+            if movimiento is not None:
+                aplicar_en_sitio(ruta, en_ruta, movimiento)
+            costo = costo_vecino
+            if costo < mejor_costo:
+                mejor_ruta, mejor_costo = list(ruta), costo
+
+    return ruta, calcular_costo_ruta(ruta, _costos), mejor_ruta, mejor_costo
+
+
+def escalera_temperaturas(t_min, t_max, replicas):
+    """Temperaturas en progresión geométrica de t_min a t_max."""
+    if replicas == 1:
+        return [t_min]
+    razon = (t_max / t_min) ** (1 / (replicas - 1))
+    return [t_min * razon ** i for i in range(replicas)]
+
+
+def templado_paralelo(grafo, inicio, meta, costos, temperaturas=None, rondas=100,
+                      pasos_por_ronda=100, semilla=0, workers=None):
+    """
+    Templado paralelo con una réplica por temperatura. Tras cada ronda de
+    `pasos_por_ronda` pasos se proponen intercambios entre réplicas
+    vecinas (alternando pares pares e impares). Devuelve (ruta, costo)
+    de la mejor ruta vista por cualquier réplica.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if temperaturas is None:
+        temperaturas = escalera_temperaturas(1.0, 1000.0, max(workers, 4))
+    temperaturas = sorted(temperaturas)
+    rng = random.Random(semilla)
+
+    # Cada réplica arranca desde una ruta aleatoria distinta
+    estados = []
+    for _ in temperaturas:
+        ruta = ruta_aleatoria(grafo, inicio, meta, rng)
+        if ruta is None:
+            return None, float('inf')
+        estados.append((ruta, calcular_costo_ruta(ruta, costos)))
+    mejor_ruta, mejor_costo = min(estados, key=lambda e: e[1])
+
+    if workers == 1:
+        _init_worker(grafo, inicio, meta, costos)
+        pool = None
+        mapear = lambda f, tareas: list(map(f, tareas))
+    else:
+        pool = _pool(min(workers, len(temperaturas)), grafo, inicio, meta, costos)
+        mapear = pool.map
+
+    try:
+        for ronda in range(rondas):
+            tareas = [(ruta, costo, t, pasos_por_ronda, rng.getrandbits(32))
+                      for (ruta, costo), t in zip(estados, temperaturas)]
+            estados = []
+            for ruta, costo, ruta_r, costo_r in mapear(_metropolis, tareas):
+                estados.append((ruta, costo))
+                if costo_r < mejor_costo:
+                    mejor_ruta, mejor_costo = ruta_r, costo_r
+
+            # Intercambios entre temperaturas vecinas
+            for i in range(ronda % 2, len(temperaturas) - 1, 2):
+                (_, e_i), (_, e_j) = estados[i], estados[i + 1]
+                if e_i == float('inf') or e_j == float('inf'):
+                    aceptar = e_j < e_i
+                else:
+                    x = (1 / temperaturas[i] - 1 / temperaturas[i + 1]) * (e_i - e_j)
+                    aceptar = x >= 0 or rng.random() < math.exp(x)
+                if aceptar:
+                    estados[i], estados[i + 1] = estados[i + 1], estados[i]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return mejor_ruta, mejor_costo
+
+
+# =========================================================================
+# 3. EJECUCIÓN
+# =========================================================================
+
+if __name__ == "__main__":
+    from .datos import GRAFO_SEVILLA, COSTOS, INICIO, META
+
+    print("### ENFRIAMIENTO SIMULADO EN PARALELO ###")
+    ruta, costo = multi_arranque(GRAFO_SEVILLA, INICIO, META, COSTOS, cadenas=8,
+                                 T_inicial=1000.0, factor_enfriamiento=0.999, iteraciones_max=5000)
+    print(f"Multi-arranque (8 cadenas): {' -> '.join(ruta)} | Costo: {costo}")
+
+    ruta, costo = templado_paralelo(GRAFO_SEVILLA, INICIO, META, COSTOS, rondas=50)
+    print(f"Templado paralelo: {' -> '.join(ruta)} | Costo: {costo}")
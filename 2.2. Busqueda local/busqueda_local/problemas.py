@@ -0,0 +1,130 @@
+import importlib
+import json
+import random
+import time
+
+from .rutas import ruta_aleatoria
+
+# =========================================================================
+# PROBLEMAS DESDE FICHERO Y RESOLUCIÓN
+# =========================================================================
+#
+# Un problema es un JSON con uno de estos formatos:
+#
+# - Ruta INICIO -> META sobre un grafo:
+#     {"grafo": {"IES": ["A", "B"], ...},
+#      "costos": [["IES", "A", 4], ...],
+#      "inicio": "IES", "meta": "ESTADIO"}
+# - Varias paradas sobre un grafo (la primera es el depósito):
+#     {"grafo": ..., "costos": ..., "paradas": ["IES", "A", "E"],
+#      "demandas": [...], "capacidad": 10, "vehiculos": 2}
+# - Varias paradas con matriz de distancias ya calculada:
+#     {"distancias": [[0, 3], [3, 0]], "nombres": ["IES", "A"],
+#      "demandas": [...], "capacidad": 10, "vehiculos": 2}
+#
+# Los costos van como lista de [origen, destino, costo] porque JSON no
+# admite tuplas como claves.
+
+# nombre -> (submódulo, función, tipo de problema, ¿acepta semilla?, ¿acepta ruta inicial?)
+ALGORITMOS = {
+    "enfriamiento": ("enfriamiento", "simulated_annealing", "ruta", True, True),
+    "escalada": ("escalada", "hill_climbing", "ruta", True, True),
+    "maxima_pendiente": ("escalada", "hill_climbing_maxima_pendiente", "ruta", False, True),
+    "tabu": ("escalada", "busqueda_tabu", "ruta", False, True),
+    "reinicios": ("escalada", "reinicios_aleatorios", "ruta", True, False),
+    "multi_arranque": ("paralelo", "multi_arranque", "ruta", True, False),
+    "templado": ("paralelo", "templado_paralelo", "ruta", True, False),
+    "multiparada": ("multiparada", "optimizar_rutas", "paradas", True, False),
+}
+
+
+def _costos_desde_json(lista):
+    return {(origen, destino): costo for origen, destino, costo in lista}
+
+
+def cargar_problema(ruta_fichero):
+    """Lee un problema JSON y lo devuelve listo para `resolver`."""
+    with open(ruta_fichero, encoding="utf-8") as f:
+        datos = json.load(f)
+
+    problema = dict(datos)
+    if "costos" in datos:
+        problema["costos"] = _costos_desde_json(datos["costos"])
+    if "grafo" not in problema and "distancias" not in problema:
+        raise ValueError(f"{ruta_fichero}: el problema necesita 'grafo' o 'distancias'")
+    return problema
+
+
+def problema_de_ejemplo():
+    """El grafo de ejemplo de Sevilla como problema INICIO -> META."""
+    from .datos import GRAFO_SEVILLA, COSTOS, INICIO, META
+
+    return {"grafo": GRAFO_SEVILLA, "costos": COSTOS, "inicio": INICIO, "meta": META}
+
+
+def _tipo(problema):
+    return "paradas" if "paradas" in problema or "distancias" in problema else "ruta"
+
+
+def _ruta_inicial(problema, rng):
+    inicio, meta = problema["inicio"], problema["meta"]
+    ruta = ruta_aleatoria(problema["grafo"], inicio, meta, rng)
+    if ruta is None:
+        raise ValueError(f"No hay ninguna ruta de {inicio!r} a {meta!r} en el grafo")
+    return ruta
+
+
+def resolver(problema, algoritmo=None, semilla=None, **parametros):
+    """
+    Resuelve `problema` (dict de cargar_problema) con el algoritmo
+    indicado por nombre (ver ALGORITMOS). Sin algoritmo se usa
+    "enfriamiento" o "multiparada" según el tipo de problema. Si el
+    algoritmo parte de una ruta y no se le pasa `ruta_inicial`, se saca
+    una aleatoria del grafo con la semilla. Devuelve un dict con la ruta
+    (o rutas), el costo y el tiempo empleado.
+    """
+    tipo = _tipo(problema)
+    if algoritmo is None:
+        algoritmo = "enfriamiento" if tipo == "ruta" else "multiparada"
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (disponibles: {', '.join(ALGORITMOS)})")
+    modulo, funcion, tipo_algoritmo, acepta_semilla, acepta_ruta = ALGORITMOS[algoritmo]
+    if tipo_algoritmo != tipo:
+        raise ValueError(f"El algoritmo {algoritmo!r} no sirve para problemas de tipo {tipo!r}")
+    funcion = getattr(importlib.import_module(f".{modulo}", __package__), funcion)
+
+    # La ruta inicial sale del grafo cargado con la semilla de la corrida;
+    # a partir de ella, los algoritmos sin semilla son deterministas
+    if acepta_ruta and parametros.get("ruta_inicial") is None:
+        parametros["ruta_inicial"] = _ruta_inicial(problema, random.Random(semilla))
+    if semilla is not None and acepta_semilla:
+        parametros["semilla"] = semilla
+
+    t0 = time.perf_counter()
+    if tipo == "ruta":
+        ruta, costo = funcion(problema["grafo"], problema["inicio"], problema["meta"], problema["costos"],
+                              **parametros)
+        if ruta is None:
+            raise ValueError(f"No hay ninguna ruta de {problema['inicio']!r} a {problema['meta']!r} en el grafo")
+        resultado = {"ruta": ruta, "costo": costo}
+    else:
+        nombres = problema.get("nombres")
+        distancias = problema.get("distancias")
+        if distancias is None:
+            from .multiparada import matriz_distancias
+
+            nombres = problema["paradas"]
+            distancias = matriz_distancias(problema["grafo"], problema["costos"], nombres)
+        rutas, costo = funcion(distancias, problema.get("demandas"), problema.get("capacidad"),
+                               problema.get("vehiculos", 1), nombres=nombres, **parametros)
+        resultado = {"rutas": rutas, "costo": costo}
+
+    resultado["algoritmo"] = algoritmo
+    resultado["segundos"] = time.perf_counter() - t0
+    return resultado
+
+
+def guardar_resultado(resultado, ruta_fichero):
+    """Escribe el resultado de `resolver` como JSON."""
+    with open(ruta_fichero, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
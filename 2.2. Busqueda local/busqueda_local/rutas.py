@@ -0,0 +1,90 @@
+# =========================================================================
+# FUNCIONES DE APOYO COMUNES
+# =========================================================================
+
+def calcular_costo_ruta(ruta, costos):
+    """Calcula el costo total (tiempo) de una ruta dada."""
+    costo_total = 0
+    for i in range(len(ruta) - 1):
+        origen = ruta[i]
+        destino = ruta[i+1]
+        costo = costos.get((origen, destino))
+        
+        # Si un segmento no es válido o no tiene costo, la ruta es inválida
+        if costo is None:
+            return float('inf') 
+        costo_total += costo
+    return costo_total
+
+def costo_tramo(origen, destino, costos):
+    """Costo de una sola arista (inf si no existe)."""
+    return costos.get((origen, destino), float('inf'))
+
+def delta_movimiento(tramos_nuevos, tramos_viejos, costos):
+    """
+    Diferencia de costo de un movimiento mirando solo las aristas que toca.
+    Es exacta si la ruta de partida es válida (costo finito).
+    """
+    nuevo = sum(costo_tramo(o, d, costos) for o, d in tramos_nuevos)
+    viejo = sum(costo_tramo(o, d, costos) for o, d in tramos_viejos)
+    return nuevo - viejo
+
+# Un movimiento de generar_vecino es (delta, i, nodo, insertar): pone
+# `nodo` en la posición i de la ruta, sustituyendo a ruta[i] o, con
+# insertar=True, desplazándolo. Las búsquedas lo aplican en sitio solo
+# si lo aceptan, con un Counter de los nodos de la ruta para consultar
+# la pertenencia en O(1) (una ruta puede repetir nodos).
+
+def ruta_con_movimiento(ruta, movimiento):
+    """Copia de la ruta con el movimiento aplicado."""
+    _, i, nodo, insertar = movimiento
+    return ruta[:i] + [nodo] + ruta[i if insertar else i + 1:]
+
+def aplicar_en_sitio(ruta, en_ruta, movimiento):
+    """Aplica el movimiento sobre la propia ruta y actualiza el Counter `en_ruta`."""
+    _, i, nodo, insertar = movimiento
+    if insertar:
+        ruta.insert(i, nodo)
+    else:
+        viejo = ruta[i]
+        ruta[i] = nodo
+        en_ruta[viejo] -= 1
+        if not en_ruta[viejo]:
+            del en_ruta[viejo]
+    en_ruta[nodo] += 1
+
+def ruta_aleatoria(grafo, inicio, meta, rng):
+    """Ruta sin ciclos de inicio a meta con un recorrido en profundidad aleatorio (None si no hay)."""
+    ruta = [inicio]
+    en_ruta = {inicio}
+    pendientes = [rng.sample(grafo.get(inicio, []), len(grafo.get(inicio, [])))]
+    while pendientes:
+        if ruta[-1] == meta:
+            return ruta
+        if pendientes[-1]:
+            siguiente = pendientes[-1].pop()
+            if siguiente not in en_ruta:
+                ruta.append(siguiente)
+                en_ruta.add(siguiente)
+                vecinos = grafo.get(siguiente, [])
+                pendientes.append(rng.sample(vecinos, len(vecinos)))
+        else:
+            pendientes.pop()
+            en_ruta.discard(ruta.pop())
+    return None
+
+def es_camino(ruta, grafo):
+    """True si cada par consecutivo de la ruta es una arista del grafo."""
+    return all(b in grafo.get(a, ()) for a, b in zip(ruta, ruta[1:]))
+
+def ruta_inicial_en_grafo(preferida, grafo, inicio, meta, rng):
+    """
+    Devuelve `preferida` si es un camino de este grafo y, si no, una ruta
+    aleatoria de inicio a meta sacada con `rng`. ValueError si no hay ninguna.
+    """
+    if es_camino(preferida, grafo):
+        return preferida
+    ruta = ruta_aleatoria(grafo, inicio, meta, rng)
+    if ruta is None:
+        raise ValueError(f"No hay ninguna ruta de {inicio!r} a {meta!r} en el grafo")
+    return ruta
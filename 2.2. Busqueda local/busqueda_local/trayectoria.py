@@ -0,0 +1,196 @@
+import json
+import struct
+import sys
+from array import array
+
+# =========================================================================
+# REGISTRO DE TRAYECTORIAS Y REPRODUCCIÓN
+# =========================================================================
+#
+# simulated_annealing(..., registro=RegistroTrayectoria(...)) anota por
+# cada iteración: iteración, temperatura usada, costo actual, mejor
+# costo y resultado de la propuesta (ACEPTADO, RECHAZADO o INVALIDO).
+#
+# Las columnas son arrays de tamaño fijo reservados al empezar, así que
+# anotar una iteración son cinco asignaciones, sin print ni listas que
+# crezcan. Cuando el buffer se llena:
+#
+# - con `fichero`, se vuelca como un bloque binario y se reutiliza;
+# - sin él, funciona como buffer circular y guarda las últimas `capacidad`.
+#
+# Formato del fichero (little-endian):
+#
+#   MAGIA | uint32 longitud | metadatos JSON (parámetros y semilla)
+#   y por cada bloque: uint32 n | n x int64 iteración | n x float64
+#   temperatura | n x float64 costo | n x float64 mejor | n x int8 resultado
+#
+# Con NumPy, np.frombuffer(columna, dtype=...) da cada columna sin copiar.
+
+MAGIA = b"TRAYSA1\n"
+
+ACEPTADO, RECHAZADO, INVALIDO = 1, 0, -1
+
+COLUMNAS = (("iteracion", "q"), ("temperatura", "d"), ("costo", "d"), ("mejor", "d"), ("resultado", "b"))
+
+
+class RegistroTrayectoria:
+    """Buffer preasignado de la trayectoria de una ejecución de simulated_annealing."""
+
+    def __init__(self, capacidad=65536, fichero=None):
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser al menos 1")
+        self.capacidad = capacidad
+        self.fichero = fichero
+        self.columnas = {nombre: array(tipo, bytes(capacidad * array(tipo).itemsize))
+                         for nombre, tipo in COLUMNAS}
+        self.metadatos = None
+        self.posicion = 0       # siguiente hueco del buffer
+        self.total = 0          # iteraciones anotadas desde iniciar()
+        self._salida = None
+
+    def iniciar(self, metadatos):
+        """Empieza una trayectoria nueva; con fichero escribe la cabecera."""
+        self.cerrar()
+        self.metadatos = metadatos
+        self.posicion = self.total = 0
+        if self.fichero is not None:
+            cabecera = json.dumps(metadatos, ensure_ascii=False).encode("utf-8")
+            self._salida = open(self.fichero, "wb")
+            self._salida.write(MAGIA + struct.pack("<I", len(cabecera)) + cabecera)
+
+    def anotar(self, iteracion, temperatura, costo, mejor, resultado):
+        p = self.posicion
+        c = self.columnas
+        c["iteracion"][p] = iteracion
+        c["temperatura"][p] = temperatura
+        c["costo"][p] = costo
+        c["mejor"][p] = mejor
+        c["resultado"][p] = resultado
+        self.total += 1
+        p += 1
+        if p == self.capacidad:
+            if self._salida is not None:
+                self.volcar(p)
+            p = 0
+        self.posicion = p
+
+    def volcar(self, n=None):
+        """Escribe las `n` primeras filas del buffer como un bloque."""
+        n = self.posicion if n is None else n
+        if self._salida is None or n == 0:
+            return
+        self._salida.write(struct.pack("<I", n))
+        for nombre, _ in COLUMNAS:
+            bloque = self.columnas[nombre][:n]
+            if sys.byteorder == "big":
+                bloque.byteswap()
+            bloque.tofile(self._salida)
+        self.posicion = 0
+
+    def cerrar(self):
+        """Vuelca lo pendiente y cierra el fichero (si lo hay)."""
+        if self._salida is not None:
+            self.volcar()
+            self._salida.close()
+            self._salida = None
+
+    def __len__(self):
+        return self.total
+
+    def datos(self):
+        """Columnas en memoria en orden cronológico (las últimas `capacidad` sin fichero)."""
+        if self.fichero is not None or self.total <= self.capacidad:
+            n = self.posicion if self.fichero is not None else self.total
+            return {nombre: columna[:n] for nombre, columna in self.columnas.items()}
+        p = self.posicion
+        return {nombre: columna[p:] + columna[:p] for nombre, columna in self.columnas.items()}
+
+
+def leer_trayectoria(fichero):
+    """Lee un fichero de RegistroTrayectoria. Devuelve (metadatos, columnas)."""
+    with open(fichero, "rb") as f:
+        if f.read(len(MAGIA)) != MAGIA:
+            raise ValueError(f"{fichero}: no es un fichero de trayectoria")
+        (longitud,) = struct.unpack("<I", f.read(4))
+        metadatos = json.loads(f.read(longitud).decode("utf-8"))
+        columnas = {nombre: array(tipo) for nombre, tipo in COLUMNAS}
+        while True:
+            cabecera = f.read(4)
+            if not cabecera:
+                break
+            (n,) = struct.unpack("<I", cabecera)
+            for nombre, tipo in COLUMNAS:
+                bloque = array(tipo)
+                bloque.fromfile(f, n)
+                if sys.byteorder == "big":
+                    bloque.byteswap()
+                columnas[nombre].extend(bloque)
+    return metadatos, columnas
+
+
+def tasa_aceptacion(columnas):
+    """Fracción de propuestas aceptadas en una trayectoria."""
+    resultado = columnas["resultado"]
+    return resultado.count(ACEPTADO) / len(resultado) if resultado else 0.0
+
+
+def reproducir(fichero, grafo, costos, esquema=None, vecindario=None):
+    """
+    Vuelve a ejecutar la corrida guardada en `fichero` con la misma semilla
+    y parámetros, y comprueba que la trayectoria es idéntica iteración a
+    iteración (ValueError si diverge). Devuelve (ruta, costo, columnas).
+
+    Un vecindario se reconstruye con sus operadores (con sus parámetros por
+    defecto) y pesos, y toma el azar de la semilla de la corrida. Hay que
+    pasar uno equivalente si sus operadores usaban otros parámetros o
+    tenía un rng propio, y también un esquema si no se eligió por nombre.
+    """
+    from .enfriamiento import simulated_annealing
+
+    metadatos, original = leer_trayectoria(fichero)
+    if metadatos.get("semilla") is None:
+        raise ValueError(f"{fichero}: la corrida usó un rng externo y no se puede reproducir")
+
+    parametros = dict(metadatos["parametros"])
+    if parametros.get("esquema") not in (None, *_esquemas()):
+        if esquema is None:
+            raise ValueError(f"{fichero}: hay que pasar el esquema {parametros['esquema']} usado")
+        parametros["esquema"] = esquema
+    descripcion = parametros.pop("vecindario", None)
+    if descripcion is not None:
+        if vecindario is None:
+            if descripcion["rng_propio"]:
+                raise ValueError(f"{fichero}: el vecindario tenía un rng propio; hay que pasarlo")
+            vecindario = _vecindario(grafo, costos, descripcion)
+        parametros["vecindario"] = vecindario
+
+    # Los nodos vuelven del JSON como listas: se recuperan los del grafo
+    nodos = {json.dumps(nodo): nodo for nodo in grafo}
+    nodo = lambda x: nodos[json.dumps(x)]
+    if parametros.get("ruta_inicial") is not None:
+        parametros["ruta_inicial"] = [nodo(x) for x in parametros["ruta_inicial"]]
+
+    registro = RegistroTrayectoria(capacidad=max(1, len(original["iteracion"])))
+    ruta, costo = simulated_annealing(grafo, nodo(metadatos["inicio"]), nodo(metadatos["meta"]), costos,
+                                      semilla=metadatos["semilla"], registro=registro, **parametros)
+
+    nueva = registro.datos()
+    for nombre, _ in COLUMNAS:
+        if nueva[nombre] != original[nombre]:
+            i = next((k for k, (a, b) in enumerate(zip(nueva[nombre], original[nombre])) if a != b),
+                     min(len(nueva[nombre]), len(original[nombre])))
+            raise ValueError(f"La reproducción diverge en la fila {i} (columna {nombre})")
+    return ruta, costo, nueva
+
+
+def _vecindario(grafo, costos, descripcion):
+    from . import vecindarios
+
+    operadores = [getattr(vecindarios, nombre)() for nombre in descripcion["operadores"]]
+    return vecindarios.Vecindario(grafo, costos, operadores, descripcion["pesos"])
+
+
+def _esquemas():
+    from .esquemas import ESQUEMAS
+
+    return ESQUEMAS
@@ -0,0 +1,216 @@
+import heapq
+import random
+from abc import ABC, abstractmethod
+
+# =========================================================================
+# OPERADORES DE VECINDAD VÁLIDOS POR CONSTRUCCIÓN
+# =========================================================================
+#
+# generar_vecino puede devolver rutas con aristas que no existen (costo
+# inf) que luego se descartan. Estos operadores solo proponen rutas
+# factibles: sin repetir nodos, de inicio a meta y con todas sus aristas
+# en `costos`. Si un operador no encuentra ningún movimiento posible
+# devuelve None en lugar de una ruta inválida.
+#
+#   Desvio:        sustituye el tramo ruta[i..j] por el camino más corto
+#                  entre sus extremos que evita un nodo (o arista) del tramo
+#                  y el resto de la ruta.
+#   EliminarNodo:  quita ruta[i] cuando existe el atajo ruta[i-1] -> ruta[i+1].
+#   InvertirTramo: invierte ruta[i..j] si las aristas nuevas existen.
+#
+# Cada operador cuenta cuántos vecinos propone, cuántos se aceptan y
+# cuántas veces no encontró movimiento, para ver qué parte del
+# presupuesto de iteraciones se dedica a candidatos reales.
+
+
+def _costo(costos, origen, destino):
+    return costos.get((origen, destino), float('inf'))
+
+
+def _costo_tramo(ruta, costos):
+    return sum(_costo(costos, a, b) for a, b in zip(ruta, ruta[1:]))
+
+
+class Operador(ABC):
+    """Base de los operadores: contadores y tasa de aceptación."""
+
+    nombre = "operador"
+
+    def __init__(self):
+        self.propuestos = 0
+        self.aceptados = 0
+        self.sin_movimiento = 0
+
+    def proponer(self, ruta, grafo, costos, rng):
+        """(ruta_vecina, delta) o None si no hay movimiento posible."""
+        vecino = self.mover(ruta, grafo, costos, rng)
+        if vecino is None:
+            self.sin_movimiento += 1
+        else:
+            self.propuestos += 1
+        return vecino
+
+    @abstractmethod
+    def mover(self, ruta, grafo, costos, rng):
+        """Movimiento concreto del operador: (ruta_vecina, delta) o None."""
+
+    def registrar(self, aceptado):
+        self.aceptados += aceptado
+
+    @property
+    def tasa_aceptacion(self):
+        return self.aceptados / self.propuestos if self.propuestos else 0.0
+
+
+class Desvio(Operador):
+    """Reencamina un tramo por el desvío más corto entre dos nodos de la ruta."""
+
+    nombre = "desvio"
+
+    def __init__(self, longitud_max=6):
+        super().__init__()
+        self.longitud_max = longitud_max
+
+    def mover(self, ruta, grafo, costos, rng):
+        if len(ruta) < 2:
+            return None
+        i = rng.randrange(len(ruta) - 1)
+        j = min(len(ruta) - 1, i + rng.randint(1, self.longitud_max))
+
+        # Se prohíbe un nodo interior del tramo (o la arista directa si no
+        # hay interior) para forzar un camino distinto al actual
+        prohibidos = set(ruta[:i]) | set(ruta[j + 1:])
+        arista_prohibida = None
+        if j - i > 1:
+            prohibidos.add(ruta[rng.randint(i + 1, j - 1)])
+        else:
+            arista_prohibida = (ruta[i], ruta[j])
+
+        desvio = _camino_mas_corto(grafo, costos, ruta[i], ruta[j], prohibidos, arista_prohibida)
+        if desvio is None:
+            return None
+        ruta_vecina = ruta[:i] + desvio + ruta[j + 1:]
+        delta = _costo_tramo(desvio, costos) - _costo_tramo(ruta[i:j + 1], costos)
+        return ruta_vecina, delta
+
+
+class EliminarNodo(Operador):
+    """Quita un nodo intermedio cuando sus vecinos en la ruta están conectados."""
+
+    nombre = "eliminar_nodo"
+
+    def mover(self, ruta, grafo, costos, rng):
+        posiciones = [i for i in range(1, len(ruta) - 1) if (ruta[i - 1], ruta[i + 1]) in costos]
+        if not posiciones:
+            return None
+        i = rng.choice(posiciones)
+        anterior, nodo, siguiente = ruta[i - 1], ruta[i], ruta[i + 1]
+        delta = costos[(anterior, siguiente)] - costos[(anterior, nodo)] - costos[(nodo, siguiente)]
+        return ruta[:i] + ruta[i + 1:], delta
+
+
+class InvertirTramo(Operador):
+    """Invierte un tramo intermedio ruta[i..j] (sin tocar inicio ni meta)."""
+
+    nombre = "invertir_tramo"
+
+    def __init__(self, intentos=20):
+        super().__init__()
+        self.intentos = intentos
+
+    def mover(self, ruta, grafo, costos, rng):
+        if len(ruta) < 4:
+            return None
+        for _ in range(self.intentos):
+            i = rng.randint(1, len(ruta) - 3)
+            j = rng.randint(i + 1, len(ruta) - 2)
+            nuevo = ruta[i - 1:i] + ruta[j:i - 1:-1] + ruta[j + 1:j + 2]
+            if all((a, b) in costos for a, b in zip(nuevo, nuevo[1:])):
+                delta = _costo_tramo(nuevo, costos) - _costo_tramo(ruta[i - 1:j + 2], costos)
+                return ruta[:i] + ruta[j:i - 1:-1] + ruta[j + 1:], delta
+        return None
+
+
+def _camino_mas_corto(grafo, costos, origen, destino, prohibidos, arista_prohibida=None):
+    """Dijkstra de origen a destino sin pasar por `prohibidos` (None si no hay camino)."""
+    distancias = {origen: 0}
+    padres = {origen: None}
+    frontera = [(0, 0, origen)]
+    contador = 1
+    while frontera:
+        d, _, nodo = heapq.heappop(frontera)
+        if d > distancias[nodo]:
+            continue
+        if nodo == destino:
+            camino = []
+            while nodo is not None:
+                camino.append(nodo)
+                nodo = padres[nodo]
+            return camino[::-1]
+        for vecino in grafo.get(nodo, []):
+            if vecino in prohibidos or (nodo, vecino) == arista_prohibida:
+                continue
+            costo = costos.get((nodo, vecino))
+            if costo is None:
+                continue
+            nueva = d + costo
+            if nueva < distancias.get(vecino, float('inf')):
+                distancias[vecino] = nueva
+                padres[vecino] = nodo
+                heapq.heappush(frontera, (nueva, contador, vecino))
+                contador += 1
+    return None
+
+
+# =========================================================================
+# VECINDARIO: COMBINACIÓN DE OPERADORES
+# =========================================================================
+
+class Vecindario:
+    """
+    Elige un operador al azar (según `pesos`) y, si no encuentra
+    movimiento, prueba con los demás. Se usa en lugar de generar_vecino:
+
+        ruta_vecina, delta = vecindario.generar(ruta, rng)
+        ...
+        vecindario.registrar(aceptado)
+
+    Sin `rng` propio usa el que le pasa cada llamada a generar (el de la
+    ejecución, sembrado con su semilla), o el módulo random si no hay.
+    """
+
+    def __init__(self, grafo, costos, operadores=None, pesos=None, rng=None):
+        self.grafo = grafo
+        self.costos = costos
+        self.operadores = operadores if operadores is not None else [Desvio(), EliminarNodo(), InvertirTramo()]
+        self.pesos = pesos
+        self.rng = rng
+        self.ultimo = None
+
+    def generar(self, ruta, rng=None):
+        """(ruta_vecina, delta); si ningún operador puede moverse devuelve (ruta, 0)."""
+        if self.rng is not None:
+            rng = self.rng
+        elif rng is None:
+            rng = random
+        primero = rng.choices(self.operadores, weights=self.pesos)[0]
+        orden = [primero] + [op for op in self.operadores if op is not primero]
+        for operador in orden:
+            vecino = operador.proponer(ruta, self.grafo, self.costos, rng)
+            if vecino is not None:
+                self.ultimo = operador
+                return vecino
+        self.ultimo = None
+        return list(ruta), 0
+
+    def registrar(self, aceptado):
+        if self.ultimo is not None:
+            self.ultimo.registrar(aceptado)
+
+    def resumen(self):
+        """Texto con propuestas, aceptaciones y tasa de cada operador."""
+        lineas = []
+        for op in self.operadores:
+            lineas.append(f"{op.nombre:<15} propuestos: {op.propuestos:6d} | aceptados: {op.aceptados:6d} | "
+                          f"tasa: {op.tasa_aceptacion:.1%} | sin movimiento: {op.sin_movimiento}")
+        return "\n".join(lineas)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# El paquete busqueda_local está junto a esta carpeta, sin instalar
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,23 @@
+from busqueda_local.datos import COSTOS, GRAFO_SEVILLA, INICIO, META
+from busqueda_local.escalada import hill_climbing
+from busqueda_local.problemas import problema_de_ejemplo, resolver
+
+
+def test_hill_climbing_is_reproducible_from_its_seed():
+    for semilla in range(20):
+        primera = hill_climbing(GRAFO_SEVILLA, INICIO, META, COSTOS, max_intentos=50, semilla=semilla)
+        assert hill_climbing(GRAFO_SEVILLA, INICIO, META, COSTOS, max_intentos=50, semilla=semilla) == primera
+
+
+def test_resolver_passes_the_seed_to_hill_climbing():
+    a = resolver(problema_de_ejemplo(), "escalada", semilla=3, max_intentos=20)
+    b = resolver(problema_de_ejemplo(), "escalada", semilla=3, max_intentos=20)
+    assert (a["ruta"], a["costo"]) == (b["ruta"], b["costo"])
+
+
+def test_hill_climbing_leaves_the_global_random_state_alone():
+    import random
+
+    estado = random.getstate()
+    hill_climbing(GRAFO_SEVILLA, INICIO, META, COSTOS, max_intentos=200, semilla=0)
+    assert random.getstate() == estado
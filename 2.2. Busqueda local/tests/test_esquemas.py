@@ -0,0 +1,29 @@
+import pytest
+
+from busqueda_local.datos import COSTOS, GRAFO_SEVILLA, INICIO, META
+from busqueda_local.enfriamiento import simulated_annealing
+from busqueda_local.esquemas import ESQUEMAS, EsquemaEnfriamiento, Lineal, crear_esquema
+from busqueda_local.trayectoria import RegistroTrayectoria
+
+
+def test_base_schedule_is_abstract():
+    with pytest.raises(TypeError):
+        EsquemaEnfriamiento()
+
+
+def test_linear_reaches_final_temperature_at_the_last_iteration():
+    esquema = Lineal(iteraciones=10, T_final=1.0)
+    esquema.iniciar(11.0)
+    T = 11.0
+    temperaturas = [T := esquema.siguiente(T, False) for _ in range(10)]
+    assert temperaturas == pytest.approx([10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+
+
+@pytest.mark.parametrize("nombre", sorted(ESQUEMAS))
+def test_named_schedules_run_the_requested_iterations(nombre):
+    registro = RegistroTrayectoria(capacidad=20000)
+    simulated_annealing(GRAFO_SEVILLA, INICIO, META, COSTOS, T_inicial=1000.0, factor_enfriamiento=0.9999,
+                        iteraciones_max=20000, T_minima=0.01, esquema=nombre, semilla=0, registro=registro)
+    if nombre in ("geometrico", "lineal", "logaritmico"):
+        assert len(registro) == 20000
+    assert isinstance(crear_esquema(nombre, 100), ESQUEMAS[nombre])
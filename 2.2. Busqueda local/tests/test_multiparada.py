@@ -0,0 +1,47 @@
+import math
+import random
+
+import pytest
+
+from busqueda_local.multiparada import ProblemaRutas, Solucion, escalada, optimizar_rutas
+from busqueda_local.problemas import resolver
+
+
+def _distancias(n, semilla=0):
+    rnd = random.Random(semilla)
+    puntos = [(rnd.uniform(0, 100), rnd.uniform(0, 100)) for _ in range(n)]
+    return [[math.dist(a, b) for b in puntos] for a in puntos]
+
+
+@pytest.mark.parametrize("metodo", ["escalada", "enfriamiento"])
+def test_both_methods_accept_a_seed(metodo):
+    d = _distancias(30)
+    extra = {"iteraciones": 20000} if metodo == "enfriamiento" else {}
+    rutas, costo = optimizar_rutas(d, metodo=metodo, semilla=0, **extra)
+    assert sorted(p for r in rutas for p in r[1:-1]) == list(range(1, 30))
+    assert (rutas, costo) == optimizar_rutas(d, metodo=metodo, semilla=0, **extra)
+
+
+def test_resolver_with_seed_and_hill_climbing():
+    resultado = resolver({"distancias": _distancias(10)}, "multiparada", semilla=1, metodo="escalada")
+    assert len(resultado["rutas"]) == 1
+
+
+def test_2opt_delta_on_an_asymmetric_matrix():
+    rnd = random.Random(4)
+    d = [[0 if i == j else rnd.randint(1, 50) for j in range(12)] for i in range(12)]
+    problema = ProblemaRutas(d)
+    assert not problema.simetrica
+    for _ in range(200):
+        ruta = rnd.sample(range(1, 12), 11)
+        solucion = Solucion(problema, [ruta])
+        x, y = rnd.sample(ruta, 2)
+        delta = solucion.delta_2opt(x, y)
+        if delta is None:
+            continue
+        antes = solucion.costo
+        solucion.aplicar_2opt(x, y)
+        assert antes + delta == solucion.costo_ruta(solucion.rutas[0])
+
+    solucion = escalada(problema)
+    assert solucion.costo == sum(solucion.costo_ruta(r) for r in solucion.rutas)
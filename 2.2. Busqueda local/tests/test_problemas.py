@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from busqueda_local.cli import main
+from busqueda_local.escalada import busqueda_tabu, hill_climbing_maxima_pendiente
+from busqueda_local.problemas import ALGORITMOS, cargar_problema, resolver
+
+# Un grafo sin ninguno de los nodos del ejemplo de Sevilla
+PROBLEMA = {
+    "grafo": {"S": ["X", "Y"], "X": ["S", "Y", "T"], "Y": ["S", "X", "T"], "T": ["X", "Y"]},
+    "costos": [["S", "X", 4], ["X", "S", 4], ["S", "Y", 1], ["Y", "S", 1], ["X", "Y", 1], ["Y", "X", 1],
+               ["X", "T", 1], ["T", "X", 1], ["Y", "T", 6], ["T", "Y", 6]],
+    "inicio": "S", "meta": "T",
+}
+ALGORITMOS_DE_RUTA = [nombre for nombre, (_, _, tipo, _, _) in ALGORITMOS.items() if tipo == "ruta"]
+
+
+@pytest.fixture
+def fichero(tmp_path):
+    ruta = tmp_path / "problema.json"
+    ruta.write_text(json.dumps(PROBLEMA), encoding="utf-8")
+    return str(ruta)
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS_DE_RUTA)
+def test_resolver_works_on_a_graph_other_than_the_example(fichero, algoritmo):
+    parametros = {"workers": 1} if algoritmo in ("reinicios", "multi_arranque", "templado") else {}
+    resultado = resolver(cargar_problema(fichero), algoritmo, semilla=1, **parametros)
+    ruta = resultado["ruta"]
+    assert ruta[0] == "S" and ruta[-1] == "T"
+    assert set(ruta) <= set(PROBLEMA["grafo"])
+    assert resultado["costo"] < float("inf")
+
+
+def test_cli_solves_a_problem_file(fichero, capsys):
+    assert main([fichero, "-s", "2"]) == 0
+    salida = capsys.readouterr().out
+    assert salida.startswith("Ruta: S -> ") and "Costo: inf" not in salida
+
+
+def test_cli_reports_a_problem_without_any_route(tmp_path, capsys):
+    problema = dict(PROBLEMA, grafo={"S": ["X"], "X": ["S"], "T": []})
+    fichero = tmp_path / "sin_ruta.json"
+    fichero.write_text(json.dumps(problema), encoding="utf-8")
+    assert main([str(fichero)]) == 1
+    assert "No hay ninguna ruta" in capsys.readouterr().err
+
+
+def test_algorithms_fall_back_to_a_route_of_the_graph():
+    costos = {(origen, destino): costo for origen, destino, costo in PROBLEMA["costos"]}
+    for busqueda in (hill_climbing_maxima_pendiente, busqueda_tabu):
+        ruta, costo = busqueda(PROBLEMA["grafo"], "S", "T", costos)
+        assert ruta[0] == "S" and ruta[-1] == "T" and costo < float("inf")
+
+
+@pytest.mark.parametrize("algoritmo", ["reinicios", "multi_arranque", "templado"])
+def test_restarts_without_any_route_give_no_route(algoritmo):
+    problema = dict(PROBLEMA, grafo={"S": ["X"], "X": ["S"], "T": []}, costos={})
+    with pytest.raises(ValueError, match="No hay ninguna ruta"):
+        resolver(problema, algoritmo, semilla=0, workers=1)
+
+
+def test_multi_arranque_skips_chains_without_an_initial_route():
+    from busqueda_local.paralelo import multi_arranque
+
+    grafo = {"S": ["X"], "X": ["S"], "T": []}
+    assert multi_arranque(grafo, "S", "T", {}, cadenas=3, workers=1) == (None, float("inf"))
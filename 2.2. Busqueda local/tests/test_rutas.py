@@ -0,0 +1,28 @@
+import random
+from collections import Counter
+
+import pytest
+
+from busqueda_local import enfriamiento, escalada
+from busqueda_local.datos import COSTOS, GRAFO_SEVILLA, INICIO, META
+from busqueda_local.rutas import aplicar_en_sitio, calcular_costo_ruta, ruta_con_movimiento
+
+
+@pytest.mark.parametrize("modulo", [enfriamiento, escalada])
+def test_in_place_moves_match_generar_vecino(modulo):
+    rng_a, rng_b = random.Random(0), random.Random(0)
+    ruta = [INICIO, "B", "E", META]
+    en_ruta = Counter(ruta)
+    for _ in range(2000):
+        esperado, delta = modulo.generar_vecino(ruta, GRAFO_SEVILLA, INICIO, META, COSTOS, rng_a)
+        movimiento = modulo.proponer_vecino(ruta, GRAFO_SEVILLA, INICIO, META, COSTOS, rng_b, en_ruta)
+        if movimiento is None:
+            assert (esperado, delta) == (ruta, 0)
+            continue
+        assert ruta_con_movimiento(ruta, movimiento) == esperado
+        assert movimiento[0] == delta
+        costo_antes = calcular_costo_ruta(ruta, COSTOS)
+        if costo_antes + delta < float("inf"):
+            assert calcular_costo_ruta(esperado, COSTOS) == costo_antes + delta
+            aplicar_en_sitio(ruta, en_ruta, movimiento)
+            assert ruta == esperado and en_ruta == Counter(ruta)
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from busqueda_local.datos import COSTOS, GRAFO_SEVILLA, INICIO, META
+from busqueda_local.enfriamiento import simulated_annealing
+from busqueda_local.trayectoria import RegistroTrayectoria, leer_trayectoria, reproducir
+from busqueda_local.vecindarios import Desvio, EliminarNodo, Vecindario
+
+
+def _grabar(tmp_path, **parametros):
+    fichero = tmp_path / "corrida.tray"
+    registro = RegistroTrayectoria(capacidad=128, fichero=str(fichero))
+    resultado = simulated_annealing(GRAFO_SEVILLA, INICIO, META, COSTOS, T_inicial=100.0, iteraciones_max=2000,
+                                    T_minima=0, semilla=7, registro=registro, **parametros)
+    return str(fichero), resultado
+
+
+def test_replay_rebuilds_the_run(tmp_path):
+    fichero, (ruta, costo) = _grabar(tmp_path, esquema="lineal")
+    assert reproducir(fichero, GRAFO_SEVILLA, COSTOS)[:2] == (ruta, costo)
+    assert len(leer_trayectoria(fichero)[1]["iteracion"]) == 2000
+
+
+def test_replay_with_vecindario_needs_only_the_seed(tmp_path):
+    vecindario = Vecindario(GRAFO_SEVILLA, COSTOS, [Desvio(), EliminarNodo()], pesos=[3, 1])
+    fichero, (ruta, costo) = _grabar(tmp_path, vecindario=vecindario)
+    random.seed(12345)  # el estado global no influye
+    ruta_r, costo_r, columnas = reproducir(fichero, GRAFO_SEVILLA, COSTOS)
+    assert (ruta_r, costo_r) == (ruta, costo)
+    assert columnas["resultado"] == leer_trayectoria(fichero)[1]["resultado"]
+
+
+def test_replay_detects_divergence(tmp_path):
+    fichero, _ = _grabar(tmp_path)
+    costos = dict(COSTOS)
+    costos[("IES", "A")] += 3
+    costos[("A", "IES")] += 3
+    with pytest.raises(ValueError, match="diverge"):
+        reproducir(fichero, GRAFO_SEVILLA, costos)
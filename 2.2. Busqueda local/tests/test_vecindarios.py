@@ -0,0 +1,24 @@
+import pytest
+
+from busqueda_local.datos import COSTOS, GRAFO_SEVILLA, INICIO, META
+from busqueda_local.enfriamiento import simulated_annealing
+from busqueda_local.trayectoria import RegistroTrayectoria
+from busqueda_local.vecindarios import Operador, Vecindario
+
+
+def test_operator_base_is_abstract():
+    with pytest.raises(TypeError):
+        Operador()
+
+
+def _corrida(semilla):
+    registro = RegistroTrayectoria(capacidad=3000)
+    resultado = simulated_annealing(GRAFO_SEVILLA, INICIO, META, COSTOS, T_inicial=100.0, iteraciones_max=3000,
+                                    T_minima=0, vecindario=Vecindario(GRAFO_SEVILLA, COSTOS),
+                                    semilla=semilla, registro=registro)
+    return resultado, registro.datos()
+
+
+def test_vecindario_follows_the_run_seed():
+    assert _corrida(4) == _corrida(4)
+    assert _corrida(4)[1] != _corrida(5)[1]
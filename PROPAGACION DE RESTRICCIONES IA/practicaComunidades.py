@@ -1,3 +1,4 @@
+import heapq
 import matplotlib.pyplot as plt
 import networkx as nx 
 
@@ -40,14 +41,32 @@ def visualize_solution(solution, neighbors):
     plt.show()
 
 # --- CLASE CSP (CON MÉTODOS ANIDADOS) ---
-# (La lógica interna de la clase CSP se mantiene sin cambios)
+
+# Estrategias de ordenación del backtracking:
+#   variable_ordering: "static" (orden de la lista) o "mrv" (mínimos valores
+#                      restantes; a igualdad, más vecinos sin asignar)
+#   value_ordering:    "static" (orden del dominio) o "lcv" (primero el valor
+#                      que menos valores quita a los vecinos sin asignar)
+# MRV y LCV no recalculan nada en cada elección: al asignar o desasignar una
+# variable se actualizan solo los contadores de sus vecinos.
+VARIABLE_ORDERINGS = ("static", "mrv")
+VALUE_ORDERINGS = ("static", "lcv")
+
 
 class CSP:
-    def __init__(self, variables, domains, neighbors, constraints):
+    def __init__(self, variables, domains, neighbors, constraints,
+                 variable_ordering="static", value_ordering="static"):
+        if variable_ordering not in VARIABLE_ORDERINGS:
+            raise ValueError(f"variable_ordering debe ser uno de {VARIABLE_ORDERINGS}")
+        if value_ordering not in VALUE_ORDERINGS:
+            raise ValueError(f"value_ordering debe ser uno de {VALUE_ORDERINGS}")
         self.variables = variables
         self.domains = domains
         self.neighbors = neighbors
         self.constraints = constraints
+        self.variable_ordering = variable_ordering
+        self.value_ordering = value_ordering
+        self.nodes = 0  # asignaciones probadas en la última búsqueda
 
     def is_consistent(self, var, assignment):
         for neighbor in self.neighbors[var]:
@@ -74,26 +93,112 @@ class CSP:
                 revised = True
         return revised
     
-    def backtracking_search(self, assignment={}):
-        if len(assignment) == len(self.variables): return assignment
-        
+    def backtracking_search(self, assignment=None):
+        assignment = dict(assignment or {})
+        self.nodes = 0
+        self._tracking = self.variable_ordering == "mrv" or self.value_ordering == "lcv"
+        if self._tracking:
+            self._init_counts(assignment)
+        return self._backtrack(assignment)
+
+    def _backtrack(self, assignment):
+        if len(assignment) == len(self.variables): return dict(assignment)
+
         var = self.select_unassigned_variable(assignment)
-        
-        for value in self.domains[var]:
-            new_assignment = assignment.copy()
-            new_assignment[var] = value
-            
-            if self.is_consistent(var, new_assignment):
-                result = self.backtracking_search(new_assignment)
+
+        for value in self.order_domain_values(var, assignment):
+            self.nodes += 1
+            assignment[var] = value
+
+            if self.is_consistent(var, assignment):
+                if self._tracking: self._assign(var, value)
+                result = self._backtrack(assignment)
+                if self._tracking: self._unassign(var, value)
                 if result: return result
-        
+
+            del assignment[var]
+
         return None
 
     def select_unassigned_variable(self, assignment):
+        if self.variable_ordering == "mrv":
+            return self._pop_mrv(assignment)
         for var in self.variables:
             if var not in assignment: return var
         return None
 
+    def order_domain_values(self, var, assignment):
+        if not self._tracking:
+            return self.domains[var]
+        # Los valores que ya chocan con algún vecino asignado se descartan sin probarlos
+        values = [x for x in self.domains[var] if self.conflicts[var][x] == 0]
+        if self.value_ordering == "lcv":
+            values.sort(key=lambda x: self._ruled_out(var, x, assignment))
+        return values
+
+    # --- CONTADORES INCREMENTALES (MRV / LCV) ---
+    #   conflicts[v][x]: vecinos asignados con los que v = x es incompatible
+    #   remaining[v]:    valores de v sin conflictos (los que le quedan)
+    #   free_degree[v]:  vecinos de v aún sin asignar
+
+    def _init_counts(self, assignment):
+        self.conflicts = {v: {x: 0 for x in self.domains[v]} for v in self.variables}
+        self.remaining = {v: len(self.domains[v]) for v in self.variables}
+        self.free_degree = {v: sum(n not in assignment for n in self.neighbors[v]) for v in self.variables}
+        self._order = {v: i for i, v in enumerate(self.variables)}
+        self._heap = []
+        for var, value in assignment.items():
+            self._assign(var, value, push=False)
+        for var in self.variables:
+            if var not in assignment: self._push(var)
+
+    def _push(self, var):
+        heapq.heappush(self._heap, (self.remaining[var], -self.free_degree[var], self._order[var], var))
+
+    def _pop_mrv(self, assignment):
+        # Montículo con entradas perezosas: se descartan las de variables ya
+        # asignadas o cuyos contadores han cambiado desde que se metieron
+        heap = self._heap
+        while heap:
+            remaining, degree, _, var = heap[0]
+            if var not in assignment and remaining == self.remaining[var] \
+                    and -degree == self.free_degree[var]:
+                return var
+            heapq.heappop(heap)
+        return None
+
+    def _assign(self, var, value, push=True):
+        for n in self.neighbors[var]:
+            self.free_degree[n] -= 1
+            counts = self.conflicts[n]
+            for y in counts:
+                if not self.constraints(n, y, var, value):
+                    counts[y] += 1
+                    if counts[y] == 1: self.remaining[n] -= 1
+            if push: self._push(n)
+
+    def _unassign(self, var, value):
+        for n in self.neighbors[var]:
+            self.free_degree[n] += 1
+            counts = self.conflicts[n]
+            for y in counts:
+                if not self.constraints(n, y, var, value):
+                    counts[y] -= 1
+                    if counts[y] == 0: self.remaining[n] += 1
+            self._push(n)
+        self._push(var)
+
+    def _ruled_out(self, var, value, assignment):
+        """Valores aún disponibles de los vecinos sin asignar que var = value eliminaría."""
+        total = 0
+        for n in self.neighbors[var]:
+            if n in assignment: continue
+            counts = self.conflicts[n]
+            for y, c in counts.items():
+                if c == 0 and not self.constraints(n, y, var, value):
+                    total += 1
+        return total
+
 # --- DEFINICIÓN DEL PROBLEMA DE PROVINCIAS DE ANDALUCÍA ---
 
 variables = ['AL', 'CA', 'CO', 'GR', 'HU', 'JA', 'MA', 'SE']
@@ -129,13 +234,14 @@ neighbors = {
 
 # --- EJECUCIÓN ---
 
-csp = CSP(variables, domains, neighbors, constraint)
+csp = CSP(variables, domains, neighbors, constraint, variable_ordering="mrv", value_ordering="lcv")
 
 print("Iniciando AC-3 para propagación de restricciones...")
 
 if csp.ac3():
     print("AC-3 finalizado. Buscando solución con Backtracking...")
     solution = csp.backtracking_search()
+    print(f"Backtracking (MRV + grado, LCV): {csp.nodes} asignaciones probadas")
     
     if solution:
         print("\n✅ Solución encontrada (Coloreado de Provincias de Andalucía):")